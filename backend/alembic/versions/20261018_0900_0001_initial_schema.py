@@ -0,0 +1,111 @@
+"""initial schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 09:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'users',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('email', sa.String(100), nullable=False),
+        sa.Column('username', sa.String(50), nullable=False),
+        sa.Column('full_name', sa.String(100), nullable=False),
+        sa.Column('hashed_password', sa.String(255), nullable=False),
+        sa.Column('role', sa.String(20), nullable=True),
+        sa.Column('is_active', sa.Boolean(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+    )
+    op.create_index('ix_users_id', 'users', ['id'])
+    op.create_index('ix_users_email', 'users', ['email'], unique=True)
+    op.create_index('ix_users_username', 'users', ['username'], unique=True)
+
+    op.create_table(
+        'departments',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('name', sa.String(100), nullable=False, unique=True),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+    )
+    op.create_index('ix_departments_id', 'departments', ['id'])
+
+    op.create_table(
+        'employees',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id'), nullable=False, unique=True),
+        sa.Column('department_id', sa.Integer(), sa.ForeignKey('departments.id'), nullable=True),
+        sa.Column('full_name', sa.String(100), nullable=False),
+        sa.Column('title', sa.String(100), nullable=False),
+        sa.Column('email', sa.String(100), nullable=False, unique=True),
+        sa.Column('phone', sa.String(20), nullable=True),
+        sa.Column('avatar_url', sa.String(255), nullable=True),
+        sa.Column('start_date', sa.String(10), nullable=False),
+        sa.Column('is_on_leave', sa.Boolean(), nullable=True),
+        sa.Column('address', sa.Text(), nullable=True),
+        sa.Column('birth_date', sa.String(10), nullable=True),
+        sa.Column('emergency_contact', sa.String(200), nullable=True),
+        sa.Column('annual_leave_total', sa.Integer(), nullable=True),
+        sa.Column('annual_leave_used', sa.Integer(), nullable=True),
+        sa.Column('sick_leave_total', sa.Integer(), nullable=True),
+        sa.Column('sick_leave_used', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+    )
+    op.create_index('ix_employees_id', 'employees', ['id'])
+
+    op.create_table(
+        'leaves',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('employee_id', sa.Integer(), sa.ForeignKey('employees.id'), nullable=False),
+        sa.Column('leave_type', sa.String(50), nullable=False),
+        sa.Column('start_date', sa.String(10), nullable=False),
+        sa.Column('end_date', sa.String(10), nullable=False),
+        sa.Column('days', sa.Integer(), nullable=False),
+        sa.Column('reason', sa.Text(), nullable=False),
+        sa.Column('status', sa.String(20), nullable=True),
+        sa.Column('approved_by', sa.Integer(), sa.ForeignKey('users.id'), nullable=True),
+        sa.Column('approved_at', sa.DateTime(), nullable=True),
+        sa.Column('rejection_reason', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+    )
+    op.create_index('ix_leaves_id', 'leaves', ['id'])
+
+    op.create_table(
+        'expenses',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('employee_id', sa.Integer(), sa.ForeignKey('employees.id'), nullable=False),
+        sa.Column('expense_type', sa.String(50), nullable=False),
+        sa.Column('amount', sa.Float(), nullable=False),
+        sa.Column('date', sa.String(10), nullable=False),
+        sa.Column('description', sa.Text(), nullable=False),
+        sa.Column('receipt_url', sa.String(500), nullable=True),
+        sa.Column('status', sa.String(20), nullable=True),
+        sa.Column('approved_by', sa.Integer(), sa.ForeignKey('users.id'), nullable=True),
+        sa.Column('approved_at', sa.DateTime(), nullable=True),
+        sa.Column('rejection_reason', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+    )
+    op.create_index('ix_expenses_id', 'expenses', ['id'])
+
+
+def downgrade() -> None:
+    op.drop_table('expenses')
+    op.drop_table('leaves')
+    op.drop_table('employees')
+    op.drop_table('departments')
+    op.drop_table('users')
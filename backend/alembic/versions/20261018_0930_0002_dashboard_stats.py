@@ -0,0 +1,39 @@
+"""dashboard stats
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 09:30:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+# Every counter crud maintains (db_models.DASHBOARD_STAT_NAMES); crud only
+# UPDATEs them, so the rows must exist
+STAT_NAMES = [
+    'total_employees', 'on_leave', 'pending_requests',
+    *(f'birthdays_month_{month:02d}' for month in range(1, 13)),
+]
+
+
+def upgrade() -> None:
+    stats = op.create_table(
+        'dashboard_stats',
+        sa.Column('name', sa.String(50), primary_key=True),
+        sa.Column('value', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+    )
+    # Values are filled in by `python manage.py reconcile-stats` (or the app's periodic job)
+    op.bulk_insert(stats, [{'name': name, 'value': 0} for name in STAT_NAMES])
+
+
+def downgrade() -> None:
+    op.drop_table('dashboard_stats')
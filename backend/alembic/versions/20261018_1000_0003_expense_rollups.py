@@ -0,0 +1,37 @@
+"""expense rollups
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 10:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'expense_rollups',
+        sa.Column('month', sa.String(7), primary_key=True),
+        sa.Column('employee_id', sa.Integer(), sa.ForeignKey('employees.id'), primary_key=True),
+        sa.Column('status', sa.String(20), primary_key=True),
+        sa.Column('total_amount', sa.Float(), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+    )
+    op.create_table(
+        'expense_rollup_months',
+        sa.Column('month', sa.String(7), primary_key=True),
+        sa.Column('closed_at', sa.DateTime(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('expense_rollup_months')
+    op.drop_table('expense_rollups')
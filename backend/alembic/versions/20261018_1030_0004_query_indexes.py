@@ -0,0 +1,40 @@
+"""indexes for list, summary and balance query paths
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 10:30:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+
+INDEXES = [
+    ('ix_employees_full_name', 'employees', ['full_name']),
+    ('ix_employees_is_on_leave', 'employees', ['is_on_leave']),
+    ('ix_leaves_status_created_at', 'leaves', ['status', 'created_at']),
+    ('ix_leaves_created_at', 'leaves', ['created_at']),
+    ('ix_leaves_employee_id_start_date', 'leaves', ['employee_id', 'start_date']),
+    ('ix_expenses_status_date', 'expenses', ['status', 'date']),
+    ('ix_expenses_status_created_at', 'expenses', ['status', 'created_at']),
+    ('ix_expenses_created_at', 'expenses', ['created_at']),
+    ('ix_expenses_employee_id_date', 'expenses', ['employee_id', 'date']),
+    ('ix_expenses_date', 'expenses', ['date']),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,179 @@
+"""native DATE columns for employee, leave and expense dates
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 11:00:00
+
+Online migration:
+- SQLite: Date is stored as ISO 'YYYY-MM-DD' text, which is exactly what the
+  String(10) columns already hold, so no table rewrite is needed.
+- MariaDB/MySQL: a VARCHAR -> DATE ALTER copies (and locks) the table, so
+  instead, per table:
+  1. add nullable <column>_new DATE columns (instant), plus BEFORE INSERT /
+     BEFORE UPDATE triggers that fill them from the VARCHAR values, so rows
+     written or changed by the running app stay in sync (dual write);
+  2. backfill the existing rows in primary-key chunks, each chunk committed
+     on its own, then check that every date parsed;
+  3. make the NOT NULL ones NOT NULL and build the replacement indexes on
+     the new columns (ALGORITHM=INPLACE, LOCK=NONE: writes continue);
+  4. swap under a short LOCK TABLES ... WRITE: drop the triggers, catch up
+     anything still missing, drop the old indexes and columns, rename the
+     new columns and indexes. DROP COLUMN and the renames are metadata-only
+     on MariaDB >= 10.5 / MySQL >= 8.0.29; older servers rebuild the table
+     there, so run step 4 with an online schema-change tool (pt-online-
+     schema-change, gh-ost) instead - DATE_MIGRATION_SWAP=false stops after
+     step 3 and leaves the triggers in place for that.
+
+Set DATE_MIGRATION_CHUNK to change the backfill chunk size (default 5000).
+"""
+import os
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+
+CHUNK_SIZE = int(os.getenv("DATE_MIGRATION_CHUNK", "5000"))
+SWAP = os.getenv("DATE_MIGRATION_SWAP", "true").lower() in ("1", "true", "yes")
+
+# table -> [(column, nullable)]
+DATE_COLUMNS = {
+    'employees': [('start_date', False), ('birth_date', True)],
+    'leaves': [('start_date', False), ('end_date', False)],
+    'expenses': [('date', False)],
+}
+
+# Indexes that include a converted column: (name, table, columns)
+AFFECTED_INDEXES = [
+    ('ix_leaves_employee_id_start_date', 'leaves', ['employee_id', 'start_date']),
+    ('ix_expenses_status_date', 'expenses', ['status', 'date']),
+    ('ix_expenses_employee_id_date', 'expenses', ['employee_id', 'date']),
+    ('ix_expenses_date', 'expenses', ['date']),
+]
+
+
+def _parsed(column):
+    return f"STR_TO_DATE(`{column}`, '%Y-%m-%d')"
+
+
+def _missing(columns):
+    return " OR ".join(f"(`{column}_new` IS NULL AND `{column}` IS NOT NULL)" for column, _ in columns)
+
+
+def _create_sync_triggers(table, columns):
+    """Dual write: keep *_new in sync with every INSERT/UPDATE while the migration runs."""
+    assignments = ", ".join(
+        f"NEW.`{column}_new` = STR_TO_DATE(NEW.`{column}`, '%Y-%m-%d')" for column, _ in columns
+    )
+    for suffix, event in (('bi', 'INSERT'), ('bu', 'UPDATE')):
+        op.execute(
+            f"CREATE TRIGGER {table}_date_sync_{suffix} BEFORE {event} ON {table} "
+            f"FOR EACH ROW SET {assignments}"
+        )
+
+
+def _drop_sync_triggers(table):
+    for suffix in ('bi', 'bu'):
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_date_sync_{suffix}")
+
+
+def _backfill(table, columns):
+    """Copy parsed dates into the *_new columns, one committed PK chunk at a time."""
+    bind = op.get_bind()
+    low, high = bind.execute(sa.text(f"SELECT MIN(id), MAX(id) FROM {table}")).one()
+    if low is None:
+        return
+
+    assignments = ", ".join(f"`{column}_new` = {_parsed(column)}" for column, _ in columns)
+    statement = sa.text(
+        f"UPDATE {table} SET {assignments} WHERE id BETWEEN :low AND :high AND ({_missing(columns)})"
+    )
+    for start in range(low, high + 1, CHUNK_SIZE):
+        bind.execute(statement, {"low": start, "high": start + CHUNK_SIZE - 1})
+
+
+def _check_parsed(table, columns):
+    bad = op.get_bind().execute(sa.text(f"SELECT id FROM {table} WHERE {_missing(columns)} LIMIT 5")).all()
+    if bad:
+        raise RuntimeError(
+            f"{table}: unparsable dates in rows {', '.join(str(row.id) for row in bad)}; fix them and re-run"
+        )
+
+
+def _affected_indexes(table):
+    return [(name, index_columns) for name, index_table, index_columns in AFFECTED_INDEXES if index_table == table]
+
+
+def _prepare(table, columns):
+    """Step 3: NOT NULL and the replacement indexes, without blocking writes."""
+    converted = {column for column, _ in columns}
+    changes = [f"MODIFY `{column}_new` DATE NOT NULL" for column, nullable in columns if not nullable]
+    changes += [
+        f"ADD INDEX {name}_new ("
+        + ", ".join(f"`{c}_new`" if c in converted else f"`{c}`" for c in index_columns)
+        + ")"
+        for name, index_columns in _affected_indexes(table)
+    ]
+    if changes:
+        op.execute(f"ALTER TABLE {table} {', '.join(changes)}, ALGORITHM=INPLACE, LOCK=NONE")
+
+
+def _swap(table, columns):
+    """Step 4, under a short write lock on the table."""
+    bind = op.get_bind()
+    changes = [f"DROP INDEX {name}" for name, _ in _affected_indexes(table)]
+    changes += [f"DROP COLUMN `{column}`" for column, _ in columns]
+    changes += [f"RENAME COLUMN `{column}_new` TO `{column}`" for column, _ in columns]
+    changes += [f"RENAME INDEX {name}_new TO {name}" for name, _ in _affected_indexes(table)]
+    assignments = ", ".join(f"`{column}_new` = {_parsed(column)}" for column, _ in columns)
+
+    bind.execute(sa.text(f"LOCK TABLES {table} WRITE"))
+    try:
+        _drop_sync_triggers(table)
+        bind.execute(sa.text(f"UPDATE {table} SET {assignments} WHERE {_missing(columns)}"))
+        bind.execute(sa.text(f"ALTER TABLE {table} {', '.join(changes)}"))
+    finally:
+        bind.execute(sa.text("UNLOCK TABLES"))
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'sqlite':
+        return  # values are already ISO dates; SQLAlchemy's Date reads them as-is
+
+    with op.get_context().autocommit_block():
+        for table, columns in DATE_COLUMNS.items():
+            op.execute(
+                f"ALTER TABLE {table} "
+                + ", ".join(f"ADD COLUMN `{column}_new` DATE NULL" for column, _ in columns)
+            )
+            _create_sync_triggers(table, columns)
+
+        for table, columns in DATE_COLUMNS.items():
+            _backfill(table, columns)
+            _check_parsed(table, columns)
+            _prepare(table, columns)
+
+        if not SWAP:
+            return
+        for table, columns in DATE_COLUMNS.items():
+            _swap(table, columns)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'sqlite':
+        return
+
+    for table, columns in DATE_COLUMNS.items():
+        for column, nullable in columns:
+            op.alter_column(
+                table, column,
+                type_=sa.String(10),
+                existing_type=sa.Date(),
+                existing_nullable=nullable,
+            )
@@ -0,0 +1,24 @@
+"""index for the pending-days part of the leave balance check
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 11:30:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_leaves_employee_id_status', 'leaves', ['employee_id', 'status'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_leaves_employee_id_status', table_name='leaves')
@@ -0,0 +1,33 @@
+"""updated_at indexes for ETag validators
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18 12:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0007'
+down_revision = '0006'
+branch_labels = None
+depends_on = None
+
+
+INDEXES = [
+    ('ix_employees_updated_at', 'employees', ['updated_at']),
+    ('ix_leaves_updated_at', 'leaves', ['updated_at']),
+    ('ix_expenses_updated_at', 'expenses', ['updated_at']),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
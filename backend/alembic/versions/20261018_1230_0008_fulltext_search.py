@@ -0,0 +1,59 @@
+"""full-text search on leave reasons and expense descriptions
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18 12:30:00
+
+- SQLite: FTS5 external-content tables (leaves_fts, expenses_fts) plus the
+  triggers that keep them in sync, then a 'rebuild' to index existing rows.
+- MariaDB/MySQL: a FULLTEXT index per column. The first FULLTEXT index on
+  an InnoDB table rebuilds it in place (writes are blocked meanwhile), so
+  run this outside business hours on large tables.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0008'
+down_revision = '0007'
+branch_labels = None
+depends_on = None
+
+
+COLUMNS = [('leaves', 'reason'), ('expenses', 'description')]
+
+
+def _sqlite_ddl(table, column):
+    fts = f'{table}_fts'
+    delete_old = f"INSERT INTO {fts}({fts}, rowid, {column}) VALUES ('delete', old.id, old.{column});"
+    insert_new = f"INSERT INTO {fts}(rowid, {column}) VALUES (new.id, new.{column});"
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+        f"{column}, content='{table}', content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN {insert_new} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN {delete_old} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {column} ON {table} "
+        f"BEGIN {delete_old} {insert_new} END",
+        f"INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+    ]
+
+
+def upgrade() -> None:
+    sqlite = op.get_bind().dialect.name == 'sqlite'
+    for table, column in COLUMNS:
+        if sqlite:
+            for statement in _sqlite_ddl(table, column):
+                op.execute(statement)
+        else:
+            op.execute(f"ALTER TABLE {table} ADD FULLTEXT INDEX ft_{table}_{column} ({column})")
+
+
+def downgrade() -> None:
+    sqlite = op.get_bind().dialect.name == 'sqlite'
+    for table, column in reversed(COLUMNS):
+        if sqlite:
+            for suffix in ('ai', 'ad', 'au'):
+                op.execute(f"DROP TRIGGER IF EXISTS {table}_fts_{suffix}")
+            op.execute(f"DROP TABLE IF EXISTS {table}_fts")
+        else:
+            op.drop_index(f'ft_{table}_{column}', table_name=table)
@@ -0,0 +1,49 @@
+"""microsecond updated_at for ETag validators
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-18 13:00:00
+
+The collection ETag hashes COUNT(*) + MAX(updated_at). A plain DATETIME on
+MariaDB/MySQL keeps whole seconds, so a second edit within the same second
+(same row count) kept the old tag and clients got a stale 304. This widens
+updated_at to DATETIME(6) on employees, leaves and expenses.
+
+- SQLite: nothing to do, DateTime values are stored with microseconds.
+- MariaDB/MySQL: changing the column type copies the table (writes are
+  blocked meanwhile), so run this outside business hours on large tables,
+  or apply the same MODIFY with pt-online-schema-change / gh-ost.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+# revision identifiers, used by Alembic.
+revision = '0009'
+down_revision = '0008'
+branch_labels = None
+depends_on = None
+
+
+TABLES = ['employees', 'leaves', 'expenses']
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'sqlite':
+        return
+    for table in TABLES:
+        op.alter_column(
+            table, 'updated_at',
+            type_=mysql.DATETIME(fsp=6), existing_type=sa.DateTime(), existing_nullable=True,
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'sqlite':
+        return
+    for table in reversed(TABLES):
+        op.alter_column(
+            table, 'updated_at',
+            type_=sa.DateTime(), existing_type=mysql.DATETIME(fsp=6), existing_nullable=True,
+        )
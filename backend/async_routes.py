@@ -0,0 +1,182 @@
+"""
+Async versions of the read-heavy endpoints.
+main.py includes this router ahead of the sync routes when DATABASE_ASYNC
+is enabled, so these paths are served from the AsyncEngine pool. Reads go
+to a read replica when configured (get_async_read_db), like the sync routes.
+"""
+
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from datetime import date as date_type
+
+from database import get_async_read_db
+import crud_async
+import db_models
+from etags import conditional_get
+from responses import model_response
+from pagination import InvalidCursor, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from auth import UserInToken, get_current_user
+from fieldsets import InvalidFields, parse_fields
+from serializers import (
+    to_employee_card,
+    employee_card_from_row, employee_detail_from_row, employee_suggestion_from_row,
+    leave_request_from_row, expense_request_from_row, page_of
+)
+from suggest import SUGGEST_LIMIT
+from models import (
+    EmployeeCard, EmployeeDetail, EmployeePage, EmployeeSuggestion,
+    LeaveRequest, LeavePage, ExpenseRequest, ExpensePage
+)
+
+router = APIRouter()
+
+
+@router.get("/api/employees", response_model=EmployeePage)
+async def get_employees(
+    request: Request,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    fields: Optional[str] = None,
+    current_user: UserInToken = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """
+    Tüm çalışanların kart görünümü (async, ETag/304 destekli).
+    """
+    version = await crud_async.get_collection_version(db, db_models.Employee)
+    not_modified = conditional_get(request, response, *version)
+    if not_modified:
+        return not_modified
+
+    try:
+        selected = parse_fields(fields, EmployeeCard)
+        employees, next_cursor = await crud_async.get_employee_cards(
+            db, cursor=cursor, limit=limit, fields=selected
+        )
+    except (InvalidCursor, InvalidFields) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    items = [employee_card_from_row(row, selected) for row in employees]
+    return model_response(page_of(EmployeePage, items, next_cursor, selected), response)
+
+
+@router.get("/api/employees/suggest", response_model=List[EmployeeSuggestion])
+async def suggest_employees(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(SUGGEST_LIMIT, ge=1, le=50),
+    current_user: UserInToken = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """
+    İsim, ünvan ve departmana göre çalışan önerileri (async, bellekteki indeksten).
+    """
+    rows = await crud_async.suggest_employees(db, q, limit)
+    return model_response([employee_suggestion_from_row(row) for row in rows])
+
+
+@router.get("/api/employees/on-leave", response_model=List[EmployeeCard])
+async def get_employees_on_leave(
+    current_user: UserInToken = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """
+    Şu anda izinli olan çalışanları döndürür (async).
+    """
+    employees = await crud_async.get_employees_on_leave(db)
+    return model_response([to_employee_card(emp) for emp in employees])
+
+
+@router.get("/api/employees/{employee_id}", response_model=EmployeeDetail)
+async def get_employee_detail(
+    employee_id: int,
+    request: Request,
+    response: Response,
+    fields: Optional[str] = None,
+    current_user: UserInToken = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """
+    Belirli bir çalışanın detaylı bilgilerini döndürür (async, ETag/304 destekli).
+    """
+    version = await crud_async.get_row_version(db, db_models.Employee, employee_id)
+    if version is None:
+        raise HTTPException(status_code=404, detail="Çalışan bulunamadı")
+    not_modified = conditional_get(request, response, *version)
+    if not_modified:
+        return not_modified
+
+    try:
+        selected = parse_fields(fields, EmployeeDetail)
+    except InvalidFields as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    row = await crud_async.get_employee_row(db, employee_id, selected)
+    if row is None:
+        raise HTTPException(status_code=404, detail="Çalışan bulunamadı")
+    return model_response(employee_detail_from_row(row, selected), response)
+
+
+@router.get("/api/leaves", response_model=LeavePage)
+async def get_leaves(
+    request: Request,
+    response: Response,
+    status: Optional[str] = None,
+    overlaps_from: Optional[date_type] = None,
+    overlaps_to: Optional[date_type] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    fields: Optional[str] = None,
+    current_user: UserInToken = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """
+    İzin taleplerini listeler (async, en yeni önce, ETag/304 destekli).
+    """
+    version = await crud_async.get_collection_version(db, db_models.Leave, db_models.Employee)
+    not_modified = conditional_get(request, response, *version)
+    if not_modified:
+        return not_modified
+
+    try:
+        selected = parse_fields(fields, LeaveRequest)
+        db_leaves, next_cursor = await crud_async.get_leave_rows(
+            db, status=status, cursor=cursor, limit=limit,
+            overlaps_from=overlaps_from, overlaps_to=overlaps_to, fields=selected
+        )
+    except (InvalidCursor, InvalidFields) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    items = [leave_request_from_row(row, selected) for row in db_leaves]
+    return model_response(page_of(LeavePage, items, next_cursor, selected), response)
+
+
+@router.get("/api/expenses", response_model=ExpensePage)
+async def get_expenses(
+    request: Request,
+    response: Response,
+    status: Optional[str] = None,
+    date_from: Optional[date_type] = None,
+    date_to: Optional[date_type] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    fields: Optional[str] = None,
+    current_user: UserInToken = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """
+    Masraf taleplerini listeler (async, en yeni önce, ETag/304 destekli).
+    """
+    version = await crud_async.get_collection_version(db, db_models.Expense, db_models.Employee)
+    not_modified = conditional_get(request, response, *version)
+    if not_modified:
+        return not_modified
+
+    try:
+        selected = parse_fields(fields, ExpenseRequest)
+        db_expenses, next_cursor = await crud_async.get_expense_rows(
+            db, status=status, cursor=cursor, limit=limit,
+            date_from=date_from, date_to=date_to, fields=selected
+        )
+    except (InvalidCursor, InvalidFields) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    items = [expense_request_from_row(row, selected) for row in db_expenses]
+    return model_response(page_of(ExpensePage, items, next_cursor, selected), response)
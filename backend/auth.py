@@ -1,16 +1,29 @@
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Dict, Optional, Tuple
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+import asyncio
+import hashlib
 import os
+import threading
+import time
 
 # JWT Configuration
 SECRET_KEY = os.getenv("JWT_SECRET_KEY", "your-secret-key-change-in-production")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24  # 24 hours
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", "4096"))
+PASSWORD_SET_TOKEN_EXPIRE_HOURS = int(os.getenv("PASSWORD_SET_TOKEN_EXPIRE_HOURS", "72"))
+PASSWORD_SET_AUDIENCE = "password_set"
+
+# Password worker pool - bcrypt runs here instead of the request threadpool
+PASSWORD_POOL_WORKERS = int(os.getenv("PASSWORD_POOL_WORKERS", str(min(4, os.cpu_count() or 1))))
+PASSWORD_QUEUE_LIMIT = int(os.getenv("PASSWORD_QUEUE_LIMIT", "32"))
 
 # Password hashing
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -27,6 +40,7 @@ class Token(BaseModel):
 
 class TokenData(BaseModel):
     email: Optional[str] = None
+    exp: Optional[int] = None
 
 
 class UserLogin(BaseModel):
@@ -34,6 +48,11 @@ class UserLogin(BaseModel):
     password: str
 
 
+class PasswordSet(BaseModel):
+    token: str
+    new_password: str = Field(min_length=8)
+
+
 class UserInToken(BaseModel):
     email: str
     name: str
@@ -51,6 +70,95 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+# Password worker pool
+class PasswordPoolSaturated(Exception):
+    """Raised when the password pool's queue is full."""
+
+
+class PasswordPool:
+    """
+    Size-bounded thread pool for bcrypt hashing/verification.
+    bcrypt releases the GIL, so a few threads use real cores. At most
+    workers + queue_limit jobs are admitted; beyond that submit() fails
+    fast instead of queueing, so a login storm can't starve other routes.
+    """
+
+    def __init__(self, workers: int = PASSWORD_POOL_WORKERS, queue_limit: int = PASSWORD_QUEUE_LIMIT):
+        self.workers = workers
+        self.queue_limit = queue_limit
+        self._slots = threading.BoundedSemaphore(workers + queue_limit)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.workers, thread_name_prefix="password"
+                    )
+        return self._executor
+
+    def submit(self, fn, *args) -> Future:
+        if not self._slots.acquire(blocking=False):
+            raise PasswordPoolSaturated()
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    async def run(self, fn, *args):
+        return await asyncio.wrap_future(self.submit(fn, *args))
+
+    def map(self, fn, items, in_flight: Optional[int] = None):
+        """
+        Blocking parallel map for batch jobs (employee import). Jobs take the
+        same admission slots as submit(), waiting for one instead of failing,
+        and at most in_flight (default: workers) are queued at a time, so a
+        login waits behind one round of batch hashes, not the whole batch.
+        """
+        window = threading.BoundedSemaphore(in_flight or self.workers)
+
+        def release(_):
+            self._slots.release()
+            window.release()
+
+        futures = []
+        for item in items:
+            window.acquire()
+            self._slots.acquire()
+            try:
+                future = self._get_executor().submit(fn, item)
+            except BaseException:
+                self._slots.release()
+                window.release()
+                raise
+            future.add_done_callback(release)
+            futures.append(future)
+        return [future.result() for future in futures]
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+password_pool = PasswordPool()
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password on the password pool. Raises PasswordPoolSaturated when full."""
+    return await password_pool.run(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """get_password_hash on the password pool. Raises PasswordPoolSaturated when full."""
+    return await password_pool.run(get_password_hash, password)
+
+
 # JWT utilities
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """Create JWT access token"""
@@ -76,7 +184,7 @@ def decode_access_token(token: str) -> TokenData:
                 detail="Token geçersiz",
                 headers={"WWW-Authenticate": "Bearer"},
             )
-        return TokenData(email=email)
+        return TokenData(email=email, exp=payload.get("exp"))
     except JWTError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -85,11 +193,124 @@ def decode_access_token(token: str) -> TokenData:
         )
 
 
-async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> UserInToken:
-    """Get current authenticated user from token"""
-    token = credentials.credentials
-    token_data = decode_access_token(token)
-    
+# Password-set tokens (bulk-imported users start without a password)
+def password_fingerprint(hashed_password: str) -> str:
+    """Short digest of a stored hash; a password-set token is bound to it."""
+    return hashlib.sha256(hashed_password.encode("utf-8")).hexdigest()[:16]
+
+
+def create_password_set_token(email: str, hashed_password: str) -> str:
+    """
+    Token that lets the user set a password once. It carries the fingerprint
+    of the current hash, so it stops working when the password changes, and
+    its own audience, so it is never accepted as an access token.
+    """
+    expire = datetime.utcnow() + timedelta(hours=PASSWORD_SET_TOKEN_EXPIRE_HOURS)
+    claims = {"sub": email, "aud": PASSWORD_SET_AUDIENCE, "pwd": password_fingerprint(hashed_password), "exp": expire}
+    return jwt.encode(claims, SECRET_KEY, algorithm=ALGORITHM)
+
+
+def decode_password_set_token(token: str) -> Tuple[str, str]:
+    """(email, hash fingerprint) of a valid password-set token"""
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM], audience=PASSWORD_SET_AUDIENCE)
+    except JWTError:
+        payload = {}
+    if not payload.get("sub") or not payload.get("pwd"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Şifre belirleme bağlantısı geçersiz veya süresi dolmuş",
+        )
+    return payload["sub"], payload["pwd"]
+
+
+# Verified-token cache
+def _token_digest(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+class TokenCache:
+    """
+    Bounded LRU cache of verified tokens, keyed by token digest.
+    Entries expire at the token's exp; revoked digests are remembered until
+    their exp so a revoked token can't be re-verified and cached again.
+    """
+
+    def __init__(self, maxsize: int = TOKEN_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()  # digest -> (user, exp)
+        self._revoked: Dict[str, float] = {}  # digest -> exp
+        self._lock = threading.Lock()
+
+    def get(self, token: str) -> Optional[UserInToken]:
+        digest = _token_digest(token)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None:
+                return None
+            user, exp = entry
+            if exp is not None and exp <= now:
+                del self._entries[digest]
+                return None
+            self._entries.move_to_end(digest)
+            return user
+
+    def put(self, token: str, user: UserInToken, exp: Optional[int]):
+        digest = _token_digest(token)
+        with self._lock:
+            if digest in self._revoked:
+                return
+            self._entries[digest] = (user, exp)
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def is_revoked(self, token: str) -> bool:
+        digest = _token_digest(token)
+        now = time.time()
+        with self._lock:
+            exp = self._revoked.get(digest)
+            if exp is None:
+                return False
+            if exp <= now:
+                del self._revoked[digest]
+                return False
+            return True
+
+    def revoke(self, token: str, exp: Optional[int] = None):
+        """Drop the token from the cache and reject it until it expires."""
+        digest = _token_digest(token)
+        now = time.time()
+        with self._lock:
+            self._entries.pop(digest, None)
+            if exp is None:
+                exp = now + ACCESS_TOKEN_EXPIRE_MINUTES * 60
+            self._revoked[digest] = exp
+            # Forget revocations for tokens that have expired on their own
+            for stale in [d for d, e in self._revoked.items() if e <= now]:
+                del self._revoked[stale]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._revoked.clear()
+
+
+token_cache = TokenCache()
+
+
+def revoke_token(token: str):
+    """Revoke an access token (logout)."""
+    exp = None
+    try:
+        exp = jwt.get_unverified_claims(token).get("exp")
+    except JWTError:
+        pass
+    token_cache.revoke(token, exp)
+
+
+def _user_from_token(token_data: TokenData) -> UserInToken:
     # TODO: Fetch user from database
     # For now, return mock user based on email
     if token_data.email == "admin@fasthr.com":
@@ -107,35 +328,72 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
         )
 
 
+async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> UserInToken:
+    """Get current authenticated user from token"""
+    token = credentials.credentials
+    user = token_cache.get(token)
+    if user is not None:
+        return user
+
+    if token_cache.is_revoked(token):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Oturum sonlandırıldı",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    token_data = decode_access_token(token)
+    user = _user_from_token(token_data)
+    token_cache.put(token, user, token_data.exp)
+    return user
+
+
 # Mock user database (replace with real database)
-MOCK_USERS = {
-    "admin@fasthr.com": {
-        "email": "admin@fasthr.com",
-        "name": "Admin User",
-        "role": "admin",
-        "hashed_password": get_password_hash("admin123")
-    },
-    "ahmet.yilmaz@fasthr.com": {
-        "email": "ahmet.yilmaz@fasthr.com",
-        "name": "Ahmet Yılmaz",
-        "role": "employee",
-        "hashed_password": get_password_hash("user123")
-    },
-    "ayse.kara@fasthr.com": {
-        "email": "ayse.kara@fasthr.com",
-        "name": "Ayşe Kara",
-        "role": "manager",
-        "hashed_password": get_password_hash("user123")
-    }
-}
+# Hashed lazily on first login so importing auth doesn't pay for bcrypt.
+_MOCK_USER_SEED = [
+    ("admin@fasthr.com", "Admin User", "admin", "admin123"),
+    ("ahmet.yilmaz@fasthr.com", "Ahmet Yılmaz", "employee", "user123"),
+    ("ayse.kara@fasthr.com", "Ayşe Kara", "manager", "user123"),
+]
+_mock_users: Optional[Dict[str, dict]] = None
+_mock_users_lock = threading.Lock()
+
+
+def get_mock_users() -> Dict[str, dict]:
+    """Mock users keyed by email, hashed on first use."""
+    global _mock_users
+    if _mock_users is None:
+        with _mock_users_lock:
+            if _mock_users is None:
+                _mock_users = {
+                    email: {
+                        "email": email,
+                        "name": name,
+                        "role": role,
+                        "hashed_password": get_password_hash(password)
+                    }
+                    for email, name, role, password in _MOCK_USER_SEED
+                }
+    return _mock_users
 
 
 def authenticate_user(email: str, password: str):
     """Authenticate user with email and password"""
-    user = MOCK_USERS.get(email)
+    user = get_mock_users().get(email)
     if not user:
         return False
     if not verify_password(password, user["hashed_password"]):
         return False
     return user
 
+
+async def authenticate_user_async(email: str, password: str):
+    """authenticate_user with bcrypt offloaded to the password pool"""
+    users = _mock_users if _mock_users is not None else await password_pool.run(get_mock_users)
+    user = users.get(email)
+    if not user:
+        return False
+    if not await verify_password_async(password, user["hashed_password"]):
+        return False
+    return user
+
@@ -0,0 +1,70 @@
+"""
+Bulk employee import benchmark.
+Generates a roster CSV and imports it into a throwaway SQLite database,
+failing if it takes longer than the budget.
+
+Usage:
+    python benchmarks/import_employees.py --rows 50000 --budget-s 30
+"""
+
+import argparse
+import csv
+import os
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEPARTMENTS = ["Yazılım", "Tasarım", "Ürün", "İnsan Kaynakları", "Pazarlama", "Satış", "Finans", "Operasyon"]
+
+
+def write_roster(path: str, rows: int):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["full_name", "email", "title", "department", "start_date", "birth_date", "phone"])
+        for i in range(rows):
+            row = [
+                f"Çalışan {i}", f"calisan{i}@example.com", "Uzman",
+                DEPARTMENTS[i % len(DEPARTMENTS)], "2024-01-15",
+                f"19{70 + i % 30}-{1 + i % 12:02d}-{1 + i % 28:02d}", f"+90 555 {i:07d}",
+            ]
+            writer.writerow(row)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--budget-s", type=float, default=30.0)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="fasthr-import-")
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+    os.environ["DATABASE_TYPE"] = "sqlite"
+    sys.path.insert(0, BACKEND_DIR)
+    from database import SessionLocal, init_db
+    from employee_import import import_employees
+
+    init_db()
+    roster = os.path.join(workdir, "roster.csv")
+    write_roster(roster, args.rows)
+
+    db = SessionLocal()
+    start = time.perf_counter()
+    try:
+        with open(roster, "rb") as file:
+            report = import_employees(db, file, roster, chunk_size=args.chunk_size)
+    finally:
+        db.close()
+    elapsed = time.perf_counter() - start
+
+    print(f"imported {report['imported']} rows ({report['failed']} failed) in {elapsed:.1f}s "
+          f"= {report['imported'] / elapsed:.0f} rows/s (budget {args.budget_s:.0f}s)")
+    if elapsed > args.budget_s:
+        print("FAIL - import over budget")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,50 @@
+"""
+Cold-start budget check.
+Imports main in a fresh interpreter and fails if it takes longer than the
+budget, so import-time work (bcrypt, create_all, ...) can't creep back in.
+
+Usage:
+    python benchmarks/import_time.py --budget-ms 1500
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = (
+    "import time; start = time.perf_counter(); import main; "
+    "print((time.perf_counter() - start) * 1000)"
+)
+
+
+def measure(runs: int) -> float:
+    """Best-of-N import time of main, in milliseconds."""
+    samples = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", PROBE],
+            cwd=BACKEND_DIR, capture_output=True, text=True, check=True,
+        )
+        samples.append(float(out.stdout.strip().splitlines()[-1]))
+    return min(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--budget-ms", type=float, default=float(os.getenv("IMPORT_BUDGET_MS", "1500")))
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    elapsed = measure(args.runs)
+    print(f"import main: {elapsed:.0f}ms (budget {args.budget_ms:.0f}ms)")
+    if elapsed > args.budget_ms:
+        print("FAIL - cold start over budget; check `python -X importtime -c 'import main'`")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""
+List response encoding benchmark.
+Builds a page of synthetic employee cards in-process and compares, per
+request, the CPU time and bytes of:
+
+  before  FastAPI's default path for a returned model: dump to dict,
+          validate against response_model, jsonable_encoder, json.dumps
+  after   responses.ModelResponse (pydantic-core, single pass)
+
+plus the compressed size with gzip and brotli (if installed).
+
+Usage:
+    python benchmarks/list_encoding.py --items 5000 --runs 20
+"""
+
+import argparse
+import gzip
+import os
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+
+from compression import BROTLI_QUALITY, GZIP_LEVEL, brotli  # noqa: E402
+from models import EmployeeCard, EmployeePage  # noqa: E402
+from responses import ModelResponse  # noqa: E402
+
+DEPARTMENTS = ["Yazılım", "Tasarım", "Ürün", "İnsan Kaynakları", "Pazarlama", "Satış"]
+
+
+def build_page(items: int) -> EmployeePage:
+    return EmployeePage(
+        items=[
+            EmployeeCard(
+                id=i, full_name=f"Çalışan {i:05d}", title="Kıdemli Yazılım Geliştirici",
+                avatar_url="ÇA", is_on_leave=i % 17 == 0, department=DEPARTMENTS[i % len(DEPARTMENTS)],
+            )
+            for i in range(items)
+        ],
+        next_cursor="eyJ2IjogIkNhbMSxxZ9hbiAwNDk5OSIsICJpZCI6IDQ5OTl9",
+    )
+
+
+def encode_before(page: EmployeePage) -> bytes:
+    validated = EmployeePage.model_validate(page.model_dump())
+    return JSONResponse(jsonable_encoder(validated)).body
+
+
+def encode_after(page: EmployeePage) -> bytes:
+    return ModelResponse(page).body
+
+
+def cpu_ms(encode, page: EmployeePage, runs: int) -> float:
+    """Mean process CPU time per encode, in milliseconds."""
+    start = time.process_time()
+    for _ in range(runs):
+        encode(page)
+    return (time.process_time() - start) * 1000 / runs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=5000)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    page = build_page(args.items)
+    body = encode_after(page)
+
+    print(f"{args.items} employee cards, mean of {args.runs} runs")
+    for name, encode in (("before", encode_before), ("after", encode_after)):
+        print(f"  {name:<7} {cpu_ms(encode, page, args.runs):8.2f} ms CPU  {len(encode(page)):>9} bytes")
+
+    start = time.process_time()
+    gzipped = gzip.compress(body, compresslevel=GZIP_LEVEL)
+    print(f"  gzip    {(time.process_time() - start) * 1000:8.2f} ms CPU  {len(gzipped):>9} bytes (level {GZIP_LEVEL})")
+    if brotli is not None:
+        start = time.process_time()
+        compressed = brotli.compress(body, quality=BROTLI_QUALITY)
+        print(f"  br      {(time.process_time() - start) * 1000:8.2f} ms CPU  {len(compressed):>9} bytes (quality {BROTLI_QUALITY})")
+    else:
+        print("  br      skipped (pip install brotli)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
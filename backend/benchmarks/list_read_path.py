@@ -0,0 +1,100 @@
+"""
+List read path benchmark.
+Seeds a throwaway SQLite database with N employees and walks every page of
+the employee list at the maximum page size, comparing:
+
+  orm   Employee entities + joined Department (query + paginate), validated
+        cards via serializers.to_employee_card - the former list path
+  core  crud.get_employee_cards + serializers.employee_card_from_row
+        (six columns via Core select(), model_construct)
+
+Usage:
+    python benchmarks/list_read_path.py --rows 1000 10000 100000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import date
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEPARTMENTS = ["Yazılım", "Tasarım", "Ürün", "İnsan Kaynakları", "Pazarlama", "Satış", "Finans", "Operasyon"]
+CHUNK = 5000
+
+
+def seed(db, crud, rows: int):
+    department_ids = crud.create_departments(db, DEPARTMENTS)
+    for offset in range(0, rows, CHUNK):
+        chunk = []
+        for i in range(offset, min(offset + CHUNK, rows)):
+            email = f"calisan{i}@example.com"
+            chunk.append((
+                {"email": email, "username": f"calisan{i}", "full_name": f"Çalışan {i:06d}",
+                 "hashed_password": "!", "role": "employee", "is_active": True},
+                {"full_name": f"Çalışan {i:06d}", "title": "Uzman", "email": email,
+                 "department_id": department_ids[DEPARTMENTS[i % len(DEPARTMENTS)]],
+                 "avatar_url": "ÇA", "start_date": date(2024, 1, 15), "is_on_leave": i % 17 == 0},
+            ))
+        crud.bulk_create_employees(db, chunk)
+        db.commit()
+
+
+def orm_page(db, cursor, limit: int):
+    import db_models
+    from pagination import paginate
+    from sqlalchemy.orm import joinedload
+
+    query = db.query(db_models.Employee).options(joinedload(db_models.Employee.department))
+    return paginate(query, db_models.Employee.full_name, db_models.Employee.id, cursor=cursor, limit=limit)
+
+
+def walk(fetch, convert, limit: int):
+    """Read every page; returns (rows, seconds)."""
+    start = time.perf_counter()
+    total, cursor = 0, None
+    while True:
+        rows, cursor = fetch(cursor, limit)
+        total += len([convert(row) for row in rows])
+        if cursor is None:
+            return total, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--limit", type=int, default=500)
+    args = parser.parse_args()
+
+    sys.path.insert(0, BACKEND_DIR)
+    for rows in args.rows:
+        workdir = tempfile.mkdtemp(prefix="fasthr-list-")
+        os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+        os.environ["DATABASE_TYPE"] = "sqlite"
+        for module in ("database", "db_models", "crud", "serializers"):
+            sys.modules.pop(module, None)
+        import crud
+        from database import SessionLocal, init_db
+        from serializers import employee_card_from_row, to_employee_card
+
+        init_db()
+        db = SessionLocal()
+        try:
+            seed(db, crud, rows)
+            paths = (
+                ("orm", lambda c, n: orm_page(db, c, n), to_employee_card),
+                ("core", lambda c, n: crud.get_employee_cards(db, cursor=c, limit=n), employee_card_from_row),
+            )
+            print(f"{rows} employees, limit={args.limit}")
+            for name, fetch, convert in paths:
+                db.expunge_all()
+                count, seconds = walk(fetch, convert, args.limit)
+                print(f"  {name:<5} {seconds * 1000:9.1f} ms  {count / seconds:>10.0f} rows/s")
+        finally:
+            db.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
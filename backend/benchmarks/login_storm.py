@@ -0,0 +1,123 @@
+"""
+Login storm benchmark.
+Fires concurrent logins at a running server while measuring the latency of
+another protected route, to check that bcrypt load doesn't starve it.
+
+Usage (server running on :8000):
+    python benchmarks/login_storm.py --logins 2000 --login-concurrency 64
+"""
+
+import argparse
+import json
+import statistics
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+
+def _request(url, data=None, token=None):
+    headers = {"Content-Type": "application/json"}
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    body = json.dumps(data).encode("utf-8") if data is not None else None
+    req = urllib.request.Request(url, data=body, headers=headers)
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(req, timeout=30) as resp:
+            payload = resp.read()
+            status = resp.status
+    except urllib.error.HTTPError as e:
+        payload = e.read()
+        status = e.code
+    return status, time.perf_counter() - start, payload
+
+
+def percentile(samples, pct):
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def probe(base_url, token, stop, latencies):
+    while not stop.is_set():
+        status, elapsed, _ = _request(f"{base_url}/api/employees?limit=20", token=token)
+        if status == 200:
+            latencies.append(elapsed)
+
+
+def report(name, latencies):
+    print(f"{name}: n={len(latencies)} "
+          f"p50={percentile(latencies, 50) * 1000:.1f}ms "
+          f"p99={percentile(latencies, 99) * 1000:.1f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--email", default="admin@fasthr.com")
+    parser.add_argument("--password", default="admin123")
+    parser.add_argument("--logins", type=int, default=1000)
+    parser.add_argument("--login-concurrency", type=int, default=64)
+    parser.add_argument("--probe-concurrency", type=int, default=4)
+    parser.add_argument("--baseline-seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    credentials = {"email": args.email, "password": args.password}
+    status, _, payload = _request(f"{args.base_url}/api/auth/login", credentials)
+    if status != 200:
+        raise SystemExit(f"Login failed ({status}): {payload!r}")
+    token = json.loads(payload)["access_token"]
+
+    def run_probes(duration=None, until=None):
+        stop = threading.Event()
+        latencies = []
+        threads = [
+            threading.Thread(target=probe, args=(args.base_url, token, stop, latencies))
+            for _ in range(args.probe_concurrency)
+        ]
+        for t in threads:
+            t.start()
+        if until is not None:
+            until()
+        else:
+            time.sleep(duration)
+        stop.set()
+        for t in threads:
+            t.join()
+        return latencies
+
+    # 1) Baseline: probe route alone
+    baseline = run_probes(duration=args.baseline_seconds)
+
+    # 2) Same probes during a login storm
+    login_results = []
+
+    def storm():
+        def one(_):
+            return _request(f"{args.base_url}/api/auth/login", credentials)[:2]
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.login_concurrency) as pool:
+            login_results.extend(pool.map(one, range(args.logins)))
+        login_results.append(("elapsed", time.perf_counter() - start))
+
+    during = run_probes(until=storm)
+
+    elapsed = login_results.pop()[1]
+    ok = [t for s, t in login_results if s == 200]
+    shed = sum(1 for s, _ in login_results if s == 503)
+    print(f"logins: {len(login_results)} in {elapsed:.1f}s "
+          f"({len(ok) / elapsed:.1f} ok/s, {shed} shed with 503)")
+    report("login latency", ok)
+    report("probe baseline", baseline)
+    report("probe during storm", during)
+    if baseline and during:
+        print(f"p99 ratio: {percentile(during, 99) / max(percentile(baseline, 99), 1e-9):.2f}x "
+              f"(median {statistics.median(during) / statistics.median(baseline):.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+SQLite concurrency benchmark.
+Seeds a throwaway SQLite database with employees and pending leaves, then
+runs approver threads (one-leave bulk approvals, the write path of
+POST /api/leaves:bulk-approve) next to reader threads (the leave list
+query) for a fixed time, once per profile:
+
+  default     SQLITE_PROFILE=false: rollback journal, one shared pool,
+              deferred transactions
+  production  SQLITE_PROFILE=true: WAL + pragmas, a single BEGIN IMMEDIATE
+              writer connection, a separate reader pool
+
+Reports approvals/s, "database is locked" errors and read latency, and
+exits 1 if the production profile hit any lock error.
+
+Usage:
+    python benchmarks/sqlite_concurrency.py --writers 8 --readers 8 --seconds 10
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from datetime import date
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEPARTMENTS = ["Yazılım", "Tasarım", "Ürün", "İnsan Kaynakları"]
+PROFILES = (("default", "false"), ("production", "true"))
+
+
+def seed(db, crud, db_models, employees: int, leaves: int):
+    from sqlalchemy import insert
+
+    department_ids = crud.create_departments(db, DEPARTMENTS)
+    chunk = []
+    for i in range(employees):
+        email = f"calisan{i}@example.com"
+        chunk.append((
+            {"email": email, "username": f"calisan{i}", "full_name": f"Çalışan {i:05d}",
+             "hashed_password": "!", "role": "employee", "is_active": True},
+            {"full_name": f"Çalışan {i:05d}", "title": "Uzman", "email": email,
+             "department_id": department_ids[DEPARTMENTS[i % len(DEPARTMENTS)]],
+             "avatar_url": "ÇA", "start_date": date(2024, 1, 15)},
+        ))
+    crud.bulk_create_employees(db, chunk)
+    db.commit()
+
+    employee_ids = [row[0] for row in db.query(db_models.Employee.id).all()]
+    db.execute(insert(db_models.Leave), [
+        {"employee_id": employee_ids[i % len(employee_ids)], "leave_type": "Yıllık İzin",
+         "start_date": date(2026, 7, 1), "end_date": date(2026, 7, 2), "days": 2,
+         "reason": "Tatil", "status": "Bekliyor"}
+        for i in range(leaves)
+    ])
+    db.commit()
+    return [row[0] for row in db.query(db_models.Leave.id).all()]
+
+
+def run(args, enabled: str) -> dict:
+    workdir = tempfile.mkdtemp(prefix="fasthr-sqlite-")
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+    os.environ["DATABASE_TYPE"] = "sqlite"
+    os.environ["SQLITE_PROFILE"] = enabled
+    for module in ("database", "db_models", "crud", "pool_metrics"):
+        sys.modules.pop(module, None)
+    import crud
+    import db_models
+    from database import ReadSessionLocal, SessionLocal, init_db
+    from sqlalchemy.exc import OperationalError
+    from sqlalchemy.exc import TimeoutError as PoolTimeout
+
+    init_db()
+    db = SessionLocal()
+    try:
+        leave_ids = seed(db, crud, db_models, args.employees, args.leaves)
+    finally:
+        db.close()
+
+    pending = iter(leave_ids)
+    pending_lock = threading.Lock()
+    stop = threading.Event()
+    lock = threading.Lock()
+    result = {"approvals": 0, "locked": 0, "reads": 0, "read_ms": []}
+
+    def approver():
+        while not stop.is_set():
+            with pending_lock:
+                leave_id = next(pending, None)
+            if leave_id is None:
+                return
+            db = SessionLocal()
+            try:
+                crud.bulk_approve_leaves(db, [leave_id], None)
+                outcome = "approvals"
+            except (OperationalError, PoolTimeout):
+                db.rollback()
+                outcome = "locked"
+            finally:
+                db.close()
+            with lock:
+                result[outcome] += 1
+
+    def reader():
+        while not stop.is_set():
+            start = time.perf_counter()
+            db = ReadSessionLocal()
+            try:
+                crud.get_leave_rows(db, limit=50)
+            except OperationalError:
+                with lock:
+                    result["locked"] += 1
+                continue
+            finally:
+                db.close()
+            elapsed = (time.perf_counter() - start) * 1000
+            with lock:
+                result["reads"] += 1
+                result["read_ms"].append(elapsed)
+
+    threads = [threading.Thread(target=approver) for _ in range(args.writers)]
+    threads += [threading.Thread(target=reader) for _ in range(args.readers)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    time.sleep(args.seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--employees", type=int, default=2000)
+    parser.add_argument("--leaves", type=int, default=200000)
+    parser.add_argument("--writers", type=int, default=8)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=10)
+    args = parser.parse_args()
+
+    sys.path.insert(0, BACKEND_DIR)
+    locked = {}
+    print(f"{args.writers} approvers, {args.readers} readers, {args.seconds:.0f}s")
+    for profile, enabled in PROFILES:
+        result = run(args, enabled)
+        timings = sorted(result["read_ms"]) or [0.0]
+        p50, p99 = timings[len(timings) // 2], timings[int(len(timings) * 0.99)]
+        seconds = result["seconds"]
+        locked[profile] = result["locked"]
+        print(
+            f"  {profile:<10} approvals {result['approvals'] / seconds:8.0f}/s  locked {result['locked']:5d}  "
+            f"reads {result['reads'] / seconds:8.0f}/s  read p50 {p50:6.1f} ms  p99 {p99:6.1f} ms"
+        )
+    return 0 if locked["production"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
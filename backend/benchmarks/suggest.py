@@ -0,0 +1,71 @@
+"""
+Employee typeahead benchmark.
+Loads the suggest index with synthetic employees (no database) and times
+per-keystroke queries, failing if the p99 latency exceeds the budget.
+
+Usage:
+    python benchmarks/suggest.py --employees 40000 --budget-ms 5
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from collections import namedtuple
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from suggest import EmployeeIndex  # noqa: E402
+
+FIRST_NAMES = ["Ahmet", "Ayşe", "Işık", "İsmail", "Şahin", "Gülşen", "Oğuz", "Çağla", "Ümit", "Irmak", "Mehmet", "Zeynep"]
+LAST_NAMES = ["Yılmaz", "Kaya", "Demir", "Şahin", "Çelik", "Öztürk", "Aydın", "Arslan", "Doğan", "Kılıç", "Işıkgör"]
+TITLES = ["Yazılım Geliştirici", "Ürün Müdürü", "Tasarımcı", "İK Uzmanı", "Satış Temsilcisi", "Muhasebe Uzmanı"]
+DEPARTMENTS = ["Yazılım", "Tasarım", "Ürün", "İnsan Kaynakları", "Pazarlama", "Satış", "Finans", "Operasyon"]
+QUERIES = ["a", "ay", "ayş", "ısı", "IŞIK", "isik", "ism", "İSMAİL", "sah", "şahin", "oğu", "ogu", "yaz", "ürün m",
+           "ahmet y", "zeynep kay", "satış", "cel", "çel"]
+
+Row = namedtuple("Row", "id full_name title avatar_url department")
+
+
+def build_rows(count: int):
+    rng = random.Random(42)
+    return [
+        Row(i, f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}", rng.choice(TITLES), None, rng.choice(DEPARTMENTS))
+        for i in range(1, count + 1)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--employees", type=int, default=40000)
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--budget-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    rows = build_rows(args.employees)
+    index = EmployeeIndex()
+    start = time.perf_counter()
+    index.load(rows)
+    print(f"load {args.employees} employees: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    start = time.perf_counter()
+    for row in rows[:100]:
+        index.upsert([row._replace(title="Kıdemli " + row.title)])
+    print(f"upsert (one employee): {(time.perf_counter() - start) * 1000 / 100:.2f} ms")
+
+    timings = []
+    for _ in range(args.runs):
+        for q in QUERIES:
+            start = time.perf_counter()
+            index.search(q)
+            timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    p50, p99 = timings[len(timings) // 2], timings[int(len(timings) * 0.99)]
+    print(f"search: p50 {p50:.2f} ms  p99 {p99:.2f} ms  max {timings[-1]:.2f} ms  (budget {args.budget_ms} ms)")
+    return 0 if p99 <= args.budget_ms else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
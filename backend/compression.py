@@ -0,0 +1,152 @@
+"""
+Negotiated response compression.
+
+Picks brotli when the client accepts "br" and the brotli package is
+installed, gzip otherwise, from the request's Accept-Encoding (q=0 is
+honoured). Only JSON/text bodies are compressed, and a body smaller than
+COMPRESSION_MIN_SIZE is sent as-is because the framing overhead outweighs
+the savings - chunks are buffered until that size is reached or the body
+ends. Streaming bodies (exports) are then compressed chunk by chunk and
+flushed so the bytes still go out as they are produced.
+"""
+
+import os
+import zlib
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+
+try:
+    import brotli
+except ImportError:  # optional: gzip only
+    brotli = None
+
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", "6"))
+BROTLI_QUALITY = int(os.getenv("BROTLI_QUALITY", "4"))
+
+COMPRESSIBLE_TYPES = ("application/json", "text/")
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """Best supported encoding the client accepts, or None."""
+    accepted = {}
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            accepted[name] = quality
+    for encoding in (("br", "gzip") if brotli is not None else ("gzip",)):
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+
+class _Compressor:
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=BROTLI_QUALITY)
+        else:
+            self._zlib = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)  # 31 = gzip container
+
+    def chunk(self, data: bytes) -> bytes:
+        """Compress data and flush so it can be sent now."""
+        if self.encoding == "br":
+            return self._brotli.process(data) + self._brotli.flush()
+        return self._zlib.compress(data) + self._zlib.flush(zlib.Z_SYNC_FLUSH)
+
+    def last(self, data: bytes) -> bytes:
+        if self.encoding == "br":
+            return self._brotli.process(data) + self._brotli.finish()
+        return self._zlib.compress(data) + self._zlib.flush()
+
+
+class CompressionMiddleware:
+    """Pure ASGI middleware (no BaseHTTPMiddleware buffering) for gzip/brotli."""
+
+    def __init__(self, app, minimum_size: int = COMPRESSION_MIN_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        compressible: Optional[bool] = None
+        compressor: Optional[_Compressor] = None
+        # Body chunks held until they reach minimum_size or the stream ends.
+        # BaseHTTPMiddleware (app.middleware("http")) re-streams every body
+        # with more_body=True, so the first chunk alone can't tell a small
+        # response from a large one.
+        pending = []
+        pending_size = 0
+
+        async def send_compressed(message):
+            nonlocal start_message, compressible, compressor, pending_size
+            if message["type"] == "http.response.start":
+                start_message = message  # held until the body decides
+                return
+            if message["type"] != "http.response.body" or compressible is False:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if compressor is not None:
+                data = compressor.chunk(body) if more_body else compressor.last(body)
+                await send({"type": "http.response.body", "body": data, "more_body": more_body})
+                return
+
+            headers = MutableHeaders(raw=start_message["headers"])
+            if compressible is None:
+                content_type = headers.get("content-type", "")
+                compressible = (
+                    start_message["status"] not in (204, 304)
+                    and "content-encoding" not in headers
+                    and content_type.startswith(COMPRESSIBLE_TYPES)
+                )
+                if not compressible:
+                    await send(start_message)
+                    await send(message)
+                    return
+                headers.add_vary_header("Accept-Encoding")
+
+            pending.append(body)
+            pending_size += len(body)
+            if more_body and pending_size < self.minimum_size:
+                return
+            body = b"".join(pending)
+            pending.clear()
+
+            if not more_body and len(body) < self.minimum_size:
+                compressible = False  # pass the rest through untouched
+                await send(start_message)
+                await send({"type": "http.response.body", "body": body})
+                return
+
+            compressor = _Compressor(encoding)
+            headers["Content-Encoding"] = encoding
+            del headers["Content-Length"]
+            if not more_body:
+                body = compressor.last(body)
+                headers["Content-Length"] = str(len(body))
+                await send(start_message)
+                await send({"type": "http.response.body", "body": body})
+                return
+            await send(start_message)
+            await send({"type": "http.response.body", "body": compressor.chunk(body), "more_body": True})
+
+        await self.app(scope, receive, send_compressed)
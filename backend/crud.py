@@ -2,10 +2,14 @@
 CRUD operations for database models.
 """
 
-from sqlalchemy.orm import Session
-from typing import List, Optional
-from datetime import datetime
+from sqlalchemy import and_, case, delete, func, insert, literal, null, or_, select, true, update
+from sqlalchemy.orm import Session, joinedload
+from typing import Dict, List, Optional, Tuple
+from datetime import date, datetime
 import db_models
+import fulltext
+from pagination import paginate_rows, DEFAULT_PAGE_SIZE
+from suggest import employee_index, SUGGEST_LIMIT
 from models import (
     EmployeeCard, EmployeeDetail, 
     LeaveRequest, LeaveCreateRequest,
@@ -13,29 +17,58 @@ from models import (
 )
 
 
-# ==================== EMPLOYEE CRUD ====================
+# ==================== USER CRUD ====================
+
+def get_user_by_email(db: Session, email: str) -> Optional[db_models.User]:
+    """Get user by email."""
+    return db.query(db_models.User).filter(db_models.User.email == email).first()
 
-def get_employees(db: Session, skip: int = 0, limit: int = 100) -> List[db_models.Employee]:
-    """Get all employees."""
-    return db.query(db_models.Employee).offset(skip).limit(limit).all()
 
+def set_user_password(db: Session, user_id: int, current_hash: str, new_hash: str) -> bool:
+    """
+    Replace the user's password hash if it is still current_hash
+    (compare-and-set: a password-set token works once). True if it changed.
+    """
+    User = db_models.User
+    result = db.execute(
+        update(User)
+        .where(User.id == user_id, User.hashed_password == current_hash)
+        .values(hashed_password=new_hash, updated_at=datetime.utcnow())
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return result.rowcount == 1
+
+
+# ==================== EMPLOYEE CRUD ====================
 
 def get_employee(db: Session, employee_id: int) -> Optional[db_models.Employee]:
     """Get employee by ID."""
-    return db.query(db_models.Employee).filter(db_models.Employee.id == employee_id).first()
+    return db.query(db_models.Employee).options(
+        joinedload(db_models.Employee.department)
+    ).filter(db_models.Employee.id == employee_id).first()
 
 
 def get_employees_on_leave(db: Session) -> List[db_models.Employee]:
     """Get employees currently on leave."""
-    return db.query(db_models.Employee).filter(db_models.Employee.is_on_leave == True).all()
+    return db.query(db_models.Employee).options(
+        joinedload(db_models.Employee.department)
+    ).filter(db_models.Employee.is_on_leave == True).all()
 
 
 def create_employee(db: Session, employee_data: dict) -> db_models.Employee:
     """Create new employee."""
     db_employee = db_models.Employee(**employee_data)
     db.add(db_employee)
+    _bump_stat(db, "total_employees", 1)
+    if db_employee.is_on_leave:
+        _bump_stat(db, "on_leave", 1)
+    birth_month = _birth_month(db_employee.birth_date)
+    if birth_month:
+        _bump_stat(db, f"birthdays_month_{birth_month:02d}", 1)
     db.commit()
     db.refresh(db_employee)
+    _reindex_employees(db, db_models.Employee.id == db_employee.id)
     return db_employee
 
 
@@ -43,22 +76,79 @@ def update_employee(db: Session, employee_id: int, employee_data: dict) -> Optio
     """Update employee."""
     db_employee = get_employee(db, employee_id)
     if db_employee:
+        was_on_leave = bool(db_employee.is_on_leave)
+        old_birth_month = _birth_month(db_employee.birth_date)
         for key, value in employee_data.items():
             setattr(db_employee, key, value)
         db_employee.updated_at = datetime.utcnow()
+        if bool(db_employee.is_on_leave) != was_on_leave:
+            _bump_stat(db, "on_leave", 1 if db_employee.is_on_leave else -1)
+        new_birth_month = _birth_month(db_employee.birth_date)
+        if new_birth_month != old_birth_month:
+            if old_birth_month:
+                _bump_stat(db, f"birthdays_month_{old_birth_month:02d}", -1)
+            if new_birth_month:
+                _bump_stat(db, f"birthdays_month_{new_birth_month:02d}", 1)
         db.commit()
         db.refresh(db_employee)
+        _reindex_employees(db, db_models.Employee.id == employee_id)
     return db_employee
 
 
+def get_user_identities(db: Session) -> Tuple[set, set]:
+    """All taken user emails and usernames (lower-cased), for bulk import duplicate checks."""
+    emails, usernames = set(), set()
+    for email, username in db.query(db_models.User.email, db_models.User.username):
+        emails.add(email.lower())
+        usernames.add(username.lower())
+    return emails, usernames
+
+
+def bulk_create_employees(db: Session, rows: List[Tuple[dict, dict]]) -> int:
+    """
+    Insert (user values, employee values) pairs with two executemany INSERTs
+    and one id lookup, then bump the dashboard counters once per chunk.
+    Employee values get user_id filled in from the inserted users.
+    """
+    if not rows:
+        return 0
+    User = db_models.User
+    now = datetime.utcnow()
+    db.execute(insert(User), [{**user, "created_at": now, "updated_at": now} for user, _ in rows])
+    user_ids = dict(
+        db.query(User.email, User.id).filter(User.email.in_([user["email"] for user, _ in rows])).all()
+    )
+    db.execute(
+        insert(db_models.Employee),
+        [{**employee, "user_id": user_ids[user["email"]], "created_at": now, "updated_at": now}
+         for user, employee in rows]
+    )
+
+    _bump_stat(db, "total_employees", len(rows))
+    birthdays: Dict[int, int] = {}
+    for _, employee in rows:
+        month = _birth_month(employee.get("birth_date"))
+        if month:
+            birthdays[month] = birthdays.get(month, 0) + 1
+    for month, count in birthdays.items():
+        _bump_stat(db, f"birthdays_month_{month:02d}", count)
+    db.commit()
+    _reindex_employees(db, db_models.Employee.user_id.in_(user_ids.values()))
+    return len(rows)
+
+
 # ==================== LEAVE CRUD ====================
 
-def get_leaves(db: Session, status: Optional[str] = None, skip: int = 0, limit: int = 100) -> List[db_models.Leave]:
-    """Get leaves with optional status filter."""
-    query = db.query(db_models.Leave)
+def _leave_filters(status: Optional[str], overlaps_from: Optional[date], overlaps_to: Optional[date]) -> list:
+    Leave = db_models.Leave
+    conditions = []
     if status:
-        query = query.filter(db_models.Leave.status == status)
-    return query.offset(skip).limit(limit).all()
+        conditions.append(Leave.status == status)
+    if overlaps_to:
+        conditions.append(Leave.start_date <= overlaps_to)
+    if overlaps_from:
+        conditions.append(Leave.end_date >= overlaps_from)
+    return conditions
 
 
 def get_leave(db: Session, leave_id: int) -> Optional[db_models.Leave]:
@@ -66,74 +156,300 @@ def get_leave(db: Session, leave_id: int) -> Optional[db_models.Leave]:
     return db.query(db_models.Leave).filter(db_models.Leave.id == leave_id).first()
 
 
+# Leave types that draw from an Employee balance counter
+LEAVE_BALANCE_COLUMNS = {
+    "Yıllık İzin": "annual_leave_used",
+    "Hastalık İzni": "sick_leave_used",
+}
+
+# Leaves that block their dates for the employee
+ACTIVE_LEAVE_STATUSES = ("Bekliyor", "Onaylandı")
+
+
+class LeaveConflict(ValueError):
+    """The requested dates overlap a pending or approved leave."""
+
+
+class InsufficientLeaveBalance(ValueError):
+    """The request needs more days than the employee has left."""
+
+
+def _overlapping_leave_end(employee_id: int, start_date: date, end_date: date):
+    """
+    Latest end date among the employee's active leaves overlapping
+    [start_date, end_date], or NULL if none does. Every active leave starting
+    on or before end_date is checked, so rows created before the overlap
+    check existed (which may overlap each other) cannot hide a conflict; the
+    range is read on ix_leaves_employee_id_start_date.
+
+    The leaves lookup sits in a derived table (not mergeable: it aggregates)
+    because MariaDB/MySQL reject a subquery on the table being inserted into
+    or updated (error 1093); create_leave and _transition_leave write leaves.
+    """
+    Leave = db_models.Leave
+    overlapping = (
+        select(func.max(Leave.end_date).label("end_date"))
+        .where(
+            Leave.employee_id == employee_id,
+            Leave.status.in_(ACTIVE_LEAVE_STATUSES),
+            Leave.start_date <= end_date,
+            Leave.end_date >= start_date,
+        )
+        .subquery("overlapping_active_leaves")
+    )
+    return select(overlapping.c.end_date).scalar_subquery()
+
+
+def _remaining_leave_days(employee_id: int, leave_type: str):
+    """
+    total - used - pending days for leave_type (over the employees row), or
+    None if the type has no balance. The pending sum is an aggregate derived
+    table for the same reason as in _overlapping_leave_end.
+    """
+    used_name = LEAVE_BALANCE_COLUMNS.get(leave_type)
+    if used_name is None:
+        return None
+    Employee, Leave = db_models.Employee, db_models.Leave
+    pending_days = (
+        select(func.coalesce(func.sum(Leave.days), 0).label("days"))
+        .where(
+            Leave.employee_id == employee_id,
+            Leave.status == "Bekliyor",
+            Leave.leave_type == leave_type,
+        )
+        .subquery("pending_leave_days")
+    )
+    pending = select(pending_days.c.days).scalar_subquery()
+    total = getattr(Employee, used_name.replace("_used", "_total"))
+    return total - getattr(Employee, used_name) - pending
+
+
+def get_leave_request_checks(db: Session, employee_id: int, leave_type: str,
+                             start_date: date, end_date: date):
+    """
+    (id, overlapping_end, remaining_days) for a prospective leave, or None if
+    the employee does not exist. remaining_days is None for types without a balance.
+    """
+    Employee = db_models.Employee
+    remaining = _remaining_leave_days(employee_id, leave_type)
+    return db.query(
+        Employee.id,
+        _overlapping_leave_end(employee_id, start_date, end_date).label("overlapping_end"),
+        (remaining if remaining is not None else null()).label("remaining_days"),
+    ).filter(Employee.id == employee_id).first()
+
+
 def create_leave(db: Session, leave_data: LeaveCreateRequest, employee_id: int) -> db_models.Leave:
-    """Create new leave request."""
-    # Calculate days
-    from datetime import datetime
-    start = datetime.strptime(leave_data.start_date, "%Y-%m-%d")
-    end = datetime.strptime(leave_data.end_date, "%Y-%m-%d")
-    days = (end - start).days + 1
-    
-    db_leave = db_models.Leave(
-        employee_id=employee_id,
-        leave_type=leave_data.leave_type,
-        start_date=leave_data.start_date,
-        end_date=leave_data.end_date,
-        days=days,
-        reason=leave_data.reason,
-        status="Bekliyor"
+    """
+    Create new leave request.
+
+    The overlap and balance checks are part of the INSERT itself
+    (INSERT ... SELECT ... FROM employees WHERE <no overlap> AND <enough days>),
+    so they cost no extra round trip and cannot be raced by a concurrent
+    submission: SQLite runs the statement under its write lock, MariaDB locks
+    the employee row (FOR UPDATE). The checks are only re-run to explain a
+    rejected insert.
+
+    Raises LookupError, LeaveConflict or InsufficientLeaveBalance.
+    """
+    Employee, Leave = db_models.Employee, db_models.Leave
+    days = (leave_data.end_date - leave_data.start_date).days + 1
+    now = datetime.utcnow()
+
+    conditions = [
+        Employee.id == employee_id,
+        _overlapping_leave_end(employee_id, leave_data.start_date, leave_data.end_date).is_(None),
+    ]
+    remaining = _remaining_leave_days(employee_id, leave_data.leave_type)
+    if remaining is not None:
+        conditions.append(remaining >= days)
+
+    values = {
+        "employee_id": employee_id,
+        "leave_type": leave_data.leave_type,
+        "start_date": leave_data.start_date,
+        "end_date": leave_data.end_date,
+        "days": days,
+        "reason": leave_data.reason,
+        "status": "Bekliyor",
+        "created_at": now,
+        "updated_at": now,
+    }
+    source = (
+        select(*[literal(value, getattr(Leave, name).type) for name, value in values.items()])
+        .select_from(Employee)
+        .where(*conditions)
+        .with_for_update()
     )
-    db.add(db_leave)
+    result = db.execute(insert(Leave).from_select(list(values), source))
+
+    if result.rowcount != 1:
+        db.rollback()
+        _raise_leave_rejection(db, employee_id, leave_data.leave_type,
+                               leave_data.start_date, leave_data.end_date, days)
+
+    leave_id = result.lastrowid
+    _bump_stat(db, "pending_requests", 1)
     db.commit()
-    db.refresh(db_leave)
-    return db_leave
+    return get_leave(db, leave_id)
+
+
+def _raise_leave_rejection(db: Session, employee_id: int, leave_type: str,
+                           start_date: date, end_date: date, days: int):
+    """Re-run the checks a conditional write failed on and raise the matching error."""
+    checks = get_leave_request_checks(db, employee_id, leave_type, start_date, end_date)
+    if checks is None:
+        raise LookupError("Çalışan bulunamadı")
+    if checks.overlapping_end is not None:
+        raise LeaveConflict(
+            f"Bu tarihler {checks.overlapping_end.isoformat()} tarihine kadar süren "
+            "başka bir izin talebiyle çakışıyor."
+        )
+    if checks.remaining_days is not None and checks.remaining_days < days:
+        raise InsufficientLeaveBalance(
+            f"Yetersiz izin bakiyesi: {max(checks.remaining_days, 0)} gün kaldı, {days} gün talep edildi."
+        )
+    raise LeaveConflict("İzin talebi eşzamanlı bir değişiklik nedeniyle kaydedilemedi, tekrar deneyin.")
+
+
+def _adjust_leave_balance(db: Session, employee_id: int, leave_type: str, days: int):
+    """Atomically add days to the employee's used-leave counter for leave_type."""
+    column_name = LEAVE_BALANCE_COLUMNS.get(leave_type)
+    if column_name is None or not days:
+        return
+    column = getattr(db_models.Employee, column_name)
+    db.execute(
+        update(db_models.Employee)
+        .where(db_models.Employee.id == employee_id)
+        .values({column_name: column + days})
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _transition_leave(db: Session, db_leave: db_models.Leave, new_status: str, **values) -> bool:
+    """
+    Compare-and-set the leave's status (UPDATE ... WHERE status = <status we read>)
+    and apply the pending-counter and balance side effects in the same
+    transaction. Returns False if another request changed the leave first.
+
+    Reactivating a leave (rejected -> approved) re-checks what create_leave
+    checks, in the UPDATE's WHERE and under the same employee row lock:
+    no overlap with an active leave and enough remaining days. Raises
+    LeaveConflict or InsufficientLeaveBalance when that fails.
+    """
+    Employee, Leave = db_models.Employee, db_models.Leave
+    leave_id, employee_id, leave_type = db_leave.id, db_leave.employee_id, db_leave.leave_type
+    start_date, end_date, days = db_leave.start_date, db_leave.end_date, db_leave.days
+    previous = db_leave.status
+    now = datetime.utcnow()
+    conditions = [Leave.id == leave_id, Leave.status == previous]
+    reactivating = previous not in ACTIVE_LEAVE_STATUSES and new_status in ACTIVE_LEAVE_STATUSES
+    if reactivating:
+        db.execute(select(Employee.id).where(Employee.id == employee_id).with_for_update())
+        conditions.append(_overlapping_leave_end(employee_id, start_date, end_date).is_(None))
+        remaining = _remaining_leave_days(employee_id, leave_type)
+        if remaining is not None:
+            conditions.append(select(remaining).where(Employee.id == employee_id).scalar_subquery() >= days)
+
+    result = db.execute(
+        update(Leave)
+        .where(*conditions)
+        .values(status=new_status, approved_at=now, updated_at=now, **values)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount != 1:
+        if reactivating and db.query(Leave.status).filter(Leave.id == leave_id).scalar() == previous:
+            db.rollback()
+            _raise_leave_rejection(db, employee_id, leave_type, start_date, end_date, days)
+        return False
+
+    if previous == "Bekliyor":
+        _bump_stat(db, "pending_requests", -1)
+    if new_status == "Onaylandı":
+        _adjust_leave_balance(db, employee_id, leave_type, days)
+    elif previous == "Onaylandı":
+        _adjust_leave_balance(db, employee_id, leave_type, -days)
+    return True
 
 
 def approve_leave(db: Session, leave_id: int, approved_by: int) -> Optional[db_models.Leave]:
-    """Approve leave request."""
+    """
+    Approve leave request and charge the employee's leave balance.
+    Raises LeaveConflict or InsufficientLeaveBalance when approving a
+    rejected leave that no longer fits.
+    """
     db_leave = get_leave(db, leave_id)
-    if db_leave:
-        db_leave.status = "Onaylandı"
-        db_leave.approved_by = approved_by
-        db_leave.approved_at = datetime.utcnow()
-        db_leave.updated_at = datetime.utcnow()
+    if db_leave and db_leave.status != "Onaylandı":
+        _transition_leave(db, db_leave, "Onaylandı", approved_by=approved_by)
         db.commit()
         db.refresh(db_leave)
     return db_leave
 
 
 def reject_leave(db: Session, leave_id: int, approved_by: int, reason: Optional[str] = None) -> Optional[db_models.Leave]:
-    """Reject leave request."""
+    """Reject leave request (refunds the balance if it was approved)."""
     db_leave = get_leave(db, leave_id)
-    if db_leave:
-        db_leave.status = "Reddedildi"
-        db_leave.approved_by = approved_by
-        db_leave.approved_at = datetime.utcnow()
-        db_leave.rejection_reason = reason
-        db_leave.updated_at = datetime.utcnow()
+    if db_leave and db_leave.status != "Reddedildi":
+        _transition_leave(db, db_leave, "Reddedildi", approved_by=approved_by, rejection_reason=reason)
         db.commit()
         db.refresh(db_leave)
     return db_leave
 
 
 def delete_leave(db: Session, leave_id: int) -> bool:
-    """Delete leave request."""
+    """Delete leave request (refunds the balance if it was approved)."""
     db_leave = get_leave(db, leave_id)
-    if db_leave:
-        db.delete(db_leave)
-        db.commit()
-        return True
-    return False
+    if not db_leave:
+        return False
+    previous = db_leave.status
+    result = db.execute(
+        delete(db_models.Leave)
+        .where(db_models.Leave.id == leave_id, db_models.Leave.status == previous)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount != 1:
+        db.rollback()
+        return False
+    if previous == "Bekliyor":
+        _bump_stat(db, "pending_requests", -1)
+    elif previous == "Onaylandı":
+        _adjust_leave_balance(db, db_leave.employee_id, db_leave.leave_type, -db_leave.days)
+    db.commit()
+    return True
+
+
+def get_leave_balance(db: Session, employee_id: int):
+    """Balance counters of one employee (single-row lookup), or None."""
+    Employee = db_models.Employee
+    return db.query(
+        Employee.id, Employee.annual_leave_total, Employee.annual_leave_used,
+        Employee.sick_leave_total, Employee.sick_leave_used
+    ).filter(Employee.id == employee_id).first()
+
+
+def get_leave_balances(db: Session, employee_ids: List[int]) -> list:
+    """Balance counters of many employees in one query."""
+    if not employee_ids:
+        return []
+    Employee = db_models.Employee
+    return db.query(
+        Employee.id, Employee.annual_leave_total, Employee.annual_leave_used,
+        Employee.sick_leave_total, Employee.sick_leave_used
+    ).filter(Employee.id.in_(set(employee_ids))).all()
 
 
 # ==================== EXPENSE CRUD ====================
 
-def get_expenses(db: Session, status: Optional[str] = None, skip: int = 0, limit: int = 100) -> List[db_models.Expense]:
-    """Get expenses with optional status filter."""
-    query = db.query(db_models.Expense)
+def _expense_filters(status: Optional[str], date_from: Optional[date], date_to: Optional[date]) -> list:
+    Expense = db_models.Expense
+    conditions = []
     if status:
-        query = query.filter(db_models.Expense.status == status)
-    return query.offset(skip).limit(limit).all()
+        conditions.append(Expense.status == status)
+    if date_from:
+        conditions.append(Expense.date >= date_from)
+    if date_to:
+        conditions.append(Expense.date <= date_to)
+    return conditions
 
 
 def get_expense(db: Session, expense_id: int) -> Optional[db_models.Expense]:
@@ -152,6 +468,8 @@ def create_expense(db: Session, expense_data: ExpenseCreateRequest, employee_id:
         status="Bekliyor"
     )
     db.add(db_expense)
+    _bump_stat(db, "pending_requests", 1)
+    _invalidate_expense_rollup(db, db_expense.date)
     db.commit()
     db.refresh(db_expense)
     return db_expense
@@ -161,6 +479,9 @@ def approve_expense(db: Session, expense_id: int, approved_by: int) -> Optional[
     """Approve expense request."""
     db_expense = get_expense(db, expense_id)
     if db_expense:
+        if db_expense.status == "Bekliyor":
+            _bump_stat(db, "pending_requests", -1)
+        _invalidate_expense_rollup(db, db_expense.date)
         db_expense.status = "Onaylandı"
         db_expense.approved_by = approved_by
         db_expense.approved_at = datetime.utcnow()
@@ -174,6 +495,9 @@ def reject_expense(db: Session, expense_id: int, approved_by: int, reason: Optio
     """Reject expense request."""
     db_expense = get_expense(db, expense_id)
     if db_expense:
+        if db_expense.status == "Bekliyor":
+            _bump_stat(db, "pending_requests", -1)
+        _invalidate_expense_rollup(db, db_expense.date)
         db_expense.status = "Reddedildi"
         db_expense.approved_by = approved_by
         db_expense.approved_at = datetime.utcnow()
@@ -188,12 +512,616 @@ def delete_expense(db: Session, expense_id: int) -> bool:
     """Delete expense request."""
     db_expense = get_expense(db, expense_id)
     if db_expense:
+        if db_expense.status == "Bekliyor":
+            _bump_stat(db, "pending_requests", -1)
+        _invalidate_expense_rollup(db, db_expense.date)
         db.delete(db_expense)
         db.commit()
         return True
     return False
 
 
+# ==================== BULK DECISIONS ====================
+
+def _bulk_transition(db: Session, model, ids: List[int], new_status: str, columns: list, **values) -> list:
+    """
+    Move the pending rows among ids to new_status with one set-based UPDATE and
+    return `columns` (first one must be model.id) of the rows that changed.
+    Uses UPDATE ... RETURNING where the dialect supports it (SQLite); MariaDB has
+    no UPDATE ... RETURNING, so the pending rows are locked and read with
+    SELECT ... FOR UPDATE first and exactly those are updated.
+    """
+    now = datetime.utcnow()
+    pending = (model.id.in_(set(ids)), model.status == "Bekliyor")
+    stmt = (
+        update(model)
+        .values(status=new_status, approved_at=now, updated_at=now, **values)
+        .execution_options(synchronize_session=False)
+    )
+    if db.get_bind().dialect.update_returning:
+        return db.execute(stmt.where(*pending).returning(*columns)).all()
+    rows = db.execute(select(*columns).where(*pending).with_for_update()).all()
+    if rows:
+        db.execute(stmt.where(model.id.in_([row.id for row in rows])))
+    return rows
+
+
+def _bulk_outcomes(db: Session, model, ids: List[int], rows: list, new_status: str) -> List[dict]:
+    """Per-id result in request order: updated, not_pending (with its current status) or not_found."""
+    changed = {row.id for row in rows}
+    missed = set(ids) - changed
+    current = dict(db.query(model.id, model.status).filter(model.id.in_(missed)).all()) if missed else {}
+    outcomes = []
+    for item_id in dict.fromkeys(ids):
+        if item_id in changed:
+            outcomes.append({"id": item_id, "outcome": "updated", "status": new_status})
+        elif item_id in current:
+            outcomes.append({"id": item_id, "outcome": "not_pending", "status": current[item_id]})
+        else:
+            outcomes.append({"id": item_id, "outcome": "not_found", "status": None})
+    return outcomes
+
+
+def _adjust_leave_balances(db: Session, rows: list):
+    """
+    Charge approved leaves to the balance counters with one UPDATE per counter
+    column: used = used + CASE id WHEN <employee> THEN <days> ... END.
+    """
+    Employee = db_models.Employee
+    per_column: Dict[str, Dict[int, int]] = {}
+    for row in rows:
+        column_name = LEAVE_BALANCE_COLUMNS.get(row.leave_type)
+        if column_name is None or not row.days:
+            continue
+        per_employee = per_column.setdefault(column_name, {})
+        per_employee[row.employee_id] = per_employee.get(row.employee_id, 0) + row.days
+
+    for column_name, per_employee in per_column.items():
+        column = getattr(Employee, column_name)
+        db.execute(
+            update(Employee)
+            .where(Employee.id.in_(per_employee))
+            .values({column_name: column + case(per_employee, value=Employee.id, else_=0)})
+            .execution_options(synchronize_session=False)
+        )
+
+
+def _decide_leaves(db: Session, leave_ids: List[int], new_status: str, **values) -> List[dict]:
+    Leave = db_models.Leave
+    rows = _bulk_transition(
+        db, Leave, leave_ids, new_status,
+        [Leave.id, Leave.employee_id, Leave.leave_type, Leave.days], **values
+    )
+    if rows:
+        _bump_stat(db, "pending_requests", -len(rows))
+    if new_status == "Onaylandı":
+        _adjust_leave_balances(db, rows)
+    outcomes = _bulk_outcomes(db, Leave, leave_ids, rows, new_status)
+    db.commit()
+    return outcomes
+
+
+def bulk_approve_leaves(db: Session, leave_ids: List[int], approved_by: Optional[int]) -> List[dict]:
+    """Approve every pending leave in leave_ids in one transaction; returns per-id outcomes."""
+    return _decide_leaves(db, leave_ids, "Onaylandı", approved_by=approved_by)
+
+
+def bulk_reject_leaves(db: Session, leave_ids: List[int], approved_by: Optional[int],
+                       reason: Optional[str] = None) -> List[dict]:
+    """Reject every pending leave in leave_ids in one transaction; returns per-id outcomes."""
+    return _decide_leaves(db, leave_ids, "Reddedildi", approved_by=approved_by, rejection_reason=reason)
+
+
+def _decide_expenses(db: Session, expense_ids: List[int], new_status: str, **values) -> List[dict]:
+    Expense = db_models.Expense
+    rows = _bulk_transition(db, Expense, expense_ids, new_status, [Expense.id, Expense.date], **values)
+    if rows:
+        _bump_stat(db, "pending_requests", -len(rows))
+    for expense_date in {_month_of(row.date): row.date for row in rows}.values():
+        _invalidate_expense_rollup(db, expense_date)
+    outcomes = _bulk_outcomes(db, Expense, expense_ids, rows, new_status)
+    db.commit()
+    return outcomes
+
+
+def bulk_approve_expenses(db: Session, expense_ids: List[int], approved_by: Optional[int]) -> List[dict]:
+    """Approve every pending expense in expense_ids in one transaction; returns per-id outcomes."""
+    return _decide_expenses(db, expense_ids, "Onaylandı", approved_by=approved_by)
+
+
+def bulk_reject_expenses(db: Session, expense_ids: List[int], approved_by: Optional[int],
+                         reason: Optional[str] = None) -> List[dict]:
+    """Reject every pending expense in expense_ids in one transaction; returns per-id outcomes."""
+    return _decide_expenses(db, expense_ids, "Reddedildi", approved_by=approved_by, rejection_reason=reason)
+
+
+# ==================== EXPENSE SUMMARY ====================
+
+EXPENSE_GROUPS = ("employee", "department", "month", "status")
+
+
+def _month_of(value) -> str:
+    """'YYYY-MM' of a date or 'YYYY-MM-DD' string."""
+    if isinstance(value, date):
+        return value.strftime("%Y-%m")
+    return str(value)[:7]
+
+
+def _expense_month_expr():
+    """SQL expression for an expense's 'YYYY-MM' (DATE renders as YYYY-MM-DD on SQLite and MariaDB)."""
+    return func.substr(db_models.Expense.date, 1, 7)
+
+
+def _month_start(month: str) -> date:
+    return date(int(month[:4]), int(month[5:7]), 1)
+
+
+def _month_bounds(month_from: Optional[str], month_to: Optional[str]):
+    """Inclusive 'YYYY-MM' range -> [start, end) date bounds on Expense.date."""
+    start = _month_start(month_from) if month_from else None
+    end = None
+    if month_to:
+        last = _month_start(month_to)
+        end = date(last.year + 1, 1, 1) if last.month == 12 else date(last.year, last.month + 1, 1)
+    return start, end
+
+
+def _open_month_ranges(closed_months: List[str], start: Optional[date], end: Optional[date]) -> list:
+    """
+    [lower, upper) date ranges (None = unbounded) covering [start, end)
+    minus closed_months, so the raw side of a rollup reads only open months
+    through the date indexes.
+    """
+    ranges = []
+    lower = start
+    for month in sorted(closed_months):
+        month_start, month_end = _month_bounds(month, month)
+        if lower is None or lower < month_start:
+            ranges.append((lower, month_start))
+        lower = month_end
+    if lower is None or end is None or lower < end:
+        ranges.append((lower, end))
+    return ranges
+
+
+def _rollup_sort_key(item):
+    """Ids in numeric order, months and statuses as text, the None key last."""
+    key = item[0]
+    numeric = isinstance(key, (int, float))
+    return (key is None, not numeric, key if numeric else 0, str(key))
+
+
+def _insert_ignore(db: Session, model, **values) -> bool:
+    """INSERT a row unless its primary key exists (no error); True if this call inserted it."""
+    prefix = "OR IGNORE" if db.get_bind().dialect.name == "sqlite" else "IGNORE"
+    return db.execute(insert(model).prefix_with(prefix).values(**values)).rowcount == 1
+
+
+def _invalidate_expense_rollup(db: Session, expense_date):
+    """An expense in a closed month changed: drop that month's rollup until it is rebuilt."""
+    month = _month_of(expense_date)
+    if month >= datetime.utcnow().strftime("%Y-%m"):
+        return  # open months are never rolled up
+    db.execute(delete(db_models.ExpenseRollupMonth).where(db_models.ExpenseRollupMonth.month == month))
+    db.execute(delete(db_models.ExpenseRollup).where(db_models.ExpenseRollup.month == month))
+
+
+def _summarize(by_status: Dict[str, list]) -> Dict[str, float]:
+    """Turn {status: [amount, count]} into the summary response shape."""
+    def amount(name):
+        return round(by_status.get(name, [0.0, 0])[0], 2)
+
+    def count(name):
+        return by_status.get(name, [0.0, 0])[1]
+
+    return {
+        "total_amount": round(sum(v[0] for v in by_status.values()), 2),
+        "pending_amount": amount("Bekliyor"),
+        "approved_amount": amount("Onaylandı"),
+        "rejected_amount": amount("Reddedildi"),
+        "total_count": sum(v[1] for v in by_status.values()),
+        "pending_count": count("Bekliyor"),
+        "approved_count": count("Onaylandı"),
+        "rejected_count": count("Reddedildi"),
+    }
+
+
+def get_expense_rollup(
+    db: Session,
+    group_by: Optional[str] = None,
+    employee_id: Optional[int] = None,
+    department_id: Optional[int] = None,
+    status: Optional[str] = None,
+    month_from: Optional[str] = None,
+    month_to: Optional[str] = None,
+) -> List[dict]:
+    """
+    Expense totals grouped by employee, department, month or status.
+    Closed months come from expense_rollups; only open (or invalidated)
+    months are aggregated from the expenses table, read as date ranges
+    between the closed months. Both sides use GROUP BY in the database.
+    Returns [{"key": ..., **summary}], sorted by key.
+    """
+    Expense, Rollup, Employee = db_models.Expense, db_models.ExpenseRollup, db_models.Employee
+
+    closed_query = db.query(db_models.ExpenseRollupMonth.month)
+    if month_from:
+        closed_query = closed_query.filter(db_models.ExpenseRollupMonth.month >= month_from)
+    if month_to:
+        closed_query = closed_query.filter(db_models.ExpenseRollupMonth.month <= month_to)
+    closed_months = [m for (m,) in closed_query.all()]
+
+    def grouped(source, employee_col, status_col, month_col, amount_expr, count_expr, where):
+        keys = {
+            None: None,
+            "employee": employee_col,
+            "department": Employee.department_id,
+            "month": month_col,
+            "status": status_col,
+        }
+        key_col = keys[group_by]
+        columns = [status_col, amount_expr, count_expr]
+        if key_col is not None:
+            columns.insert(0, key_col)
+        query = db.query(*columns).select_from(source)
+        if group_by == "department" or department_id is not None:
+            query = query.join(Employee, Employee.id == employee_col)
+        if employee_id is not None:
+            query = query.filter(employee_col == employee_id)
+        if department_id is not None:
+            query = query.filter(Employee.department_id == department_id)
+        if status:
+            query = query.filter(status_col == status)
+        for condition in where:
+            query = query.filter(condition)
+        group_cols = [status_col] if key_col is None else [key_col, status_col]
+        rows = query.group_by(*group_cols).all()
+        if key_col is None:
+            return [(None, row[0], row[1], row[2]) for row in rows]
+        return [tuple(row) for row in rows]
+
+    rows = []
+    if closed_months:
+        rows += grouped(
+            Rollup, Rollup.employee_id, Rollup.status, Rollup.month,
+            func.sum(Rollup.total_amount), func.sum(Rollup.count),
+            [Rollup.month.in_(closed_months)],
+        )
+
+    start, end = _month_bounds(month_from, month_to)
+    open_ranges = []
+    for lower, upper in _open_month_ranges(closed_months, start, end):
+        bounds = []
+        if lower:
+            bounds.append(Expense.date >= lower)
+        if upper:
+            bounds.append(Expense.date < upper)
+        open_ranges.append(and_(*bounds) if bounds else true())
+    if open_ranges:
+        rows += grouped(
+            Expense, Expense.employee_id, Expense.status, _expense_month_expr(),
+            func.sum(Expense.amount), func.count(Expense.id),
+            [or_(*open_ranges)],
+        )
+
+    groups: Dict[object, Dict[str, list]] = {}
+    for key, row_status, amount, count in rows:
+        bucket = groups.setdefault(key, {}).setdefault(row_status, [0.0, 0])
+        bucket[0] += amount or 0.0
+        bucket[1] += count or 0
+
+    return [
+        {"key": key, **_summarize(by_status)}
+        for key, by_status in sorted(groups.items(), key=_rollup_sort_key)
+    ]
+
+
+def get_expense_summary(db: Session, **filters) -> Dict[str, float]:
+    """Overall expense summary (totals by status) for the given filters."""
+    rows = get_expense_rollup(db, group_by=None, **filters)
+    return {k: v for k, v in rows[0].items() if k != "key"} if rows else _summarize({})
+
+
+def close_expense_months(db: Session, before_month: Optional[str] = None) -> List[str]:
+    """
+    Build expense_rollups for every month before before_month (default: the
+    current month) that has expenses but isn't closed yet. Returns the months closed.
+
+    Each month is claimed first by inserting its expense_rollup_months row
+    (INSERT IGNORE): the key stays locked until the month's commit, so a
+    concurrent run waits, finds the month taken and skips it.
+    """
+    Expense = db_models.Expense
+    before_month = before_month or datetime.utcnow().strftime("%Y-%m")
+    month_expr = _expense_month_expr()
+
+    closed = {m for (m,) in db.query(db_models.ExpenseRollupMonth.month).all()}
+    candidates = [
+        m for (m,) in db.query(month_expr).filter(Expense.date < _month_start(before_month)).distinct().all()
+        if m and m not in closed
+    ]
+
+    closed_now = []
+    for month in sorted(candidates):
+        if not _insert_ignore(db, db_models.ExpenseRollupMonth, month=month, closed_at=datetime.utcnow()):
+            db.rollback()
+            continue
+        start, end = _month_bounds(month, month)
+        aggregates = db.query(
+            Expense.employee_id, Expense.status, func.sum(Expense.amount), func.count(Expense.id)
+        ).filter(Expense.date >= start, Expense.date < end).group_by(
+            Expense.employee_id, Expense.status
+        ).all()
+        db.execute(delete(db_models.ExpenseRollup).where(db_models.ExpenseRollup.month == month))
+        db.add_all([
+            db_models.ExpenseRollup(
+                month=month, employee_id=employee_id, status=row_status,
+                total_amount=amount or 0.0, count=count
+            )
+            for employee_id, row_status, amount, count in aggregates
+        ])
+        db.commit()
+        closed_now.append(month)
+    return closed_now
+
+
+# ==================== LIST ROWS (Core select, no ORM entities) ====================
+# The list endpoints only need a handful of columns. Selecting exactly those
+# (joined to the department / employee name) returns plain Row tuples: no
+# identity map, no attribute instrumentation, no relationship loading.
+# serializers.*_from_row map them to the response models.
+#
+# *_FIELD_COLUMNS list the columns each response field is built from, so a
+# ?fields= request (fieldsets.parse_fields) selects only what it returns.
+# The joins are added only when a joined column is selected.
+
+EMPLOYEE_CARD_FIELDS = tuple(EmployeeCard.model_fields)
+EMPLOYEE_DETAIL_FIELDS = tuple(EmployeeDetail.model_fields)
+LEAVE_FIELDS = tuple(LeaveRequest.model_fields)
+EXPENSE_FIELDS = tuple(ExpenseRequest.model_fields)
+
+_employee_name = db_models.Employee.full_name.label("employee_name")
+
+EMPLOYEE_FIELD_COLUMNS = {
+    "id": (db_models.Employee.id,),
+    "full_name": (db_models.Employee.full_name,),
+    "title": (db_models.Employee.title,),
+    "avatar_url": (db_models.Employee.avatar_url, db_models.Employee.full_name),  # initials fallback
+    "is_on_leave": (db_models.Employee.is_on_leave,),
+    "department": (db_models.Department.name.label("department"),),
+    "email": (db_models.Employee.email,),
+    "phone": (db_models.Employee.phone,),
+    "start_date": (db_models.Employee.start_date,),
+    "address": (db_models.Employee.address,),
+    "birth_date": (db_models.Employee.birth_date,),
+    "emergency_contact": (db_models.Employee.emergency_contact,),
+    "salary": (),  # not stored yet, always null
+}
+
+LEAVE_FIELD_COLUMNS = {
+    "id": (db_models.Leave.id,),
+    "employee_id": (db_models.Leave.employee_id,),
+    "employee_name": (_employee_name,),
+    "leave_type": (db_models.Leave.leave_type,),
+    "start_date": (db_models.Leave.start_date,),
+    "end_date": (db_models.Leave.end_date,),
+    "days": (db_models.Leave.days,),
+    "reason": (db_models.Leave.reason,),
+    "status": (db_models.Leave.status,),
+    "created_at": (db_models.Leave.created_at,),
+}
+
+EXPENSE_FIELD_COLUMNS = {
+    "id": (db_models.Expense.id,),
+    "employee_id": (db_models.Expense.employee_id,),
+    "employee_name": (_employee_name,),
+    "expense_type": (db_models.Expense.expense_type,),
+    "amount": (db_models.Expense.amount,),
+    "date": (db_models.Expense.date,),
+    "description": (db_models.Expense.description,),
+    "receipt_url": (db_models.Expense.receipt_url,),
+    "status": (db_models.Expense.status,),
+    "created_at": (db_models.Expense.created_at,),
+}
+
+
+def _projection(field_columns: dict, fields, *always) -> list:
+    """Columns for fields (plus always: id / sort key), each selected once."""
+    columns = {}
+    for column in always + tuple(column for name in fields for column in field_columns[name]):
+        columns.setdefault(column.key, column)
+    return list(columns.values())
+
+
+def employee_row_stmt(fields=EMPLOYEE_CARD_FIELDS):
+    Employee, Department = db_models.Employee, db_models.Department
+    columns = _projection(EMPLOYEE_FIELD_COLUMNS, fields, Employee.id, Employee.full_name)
+    stmt = select(*columns)
+    if "department" in fields:
+        stmt = stmt.outerjoin(Department, Department.id == Employee.department_id)
+    return stmt
+
+
+def leave_row_stmt(status: Optional[str] = None, overlaps_from: Optional[date] = None,
+                   overlaps_to: Optional[date] = None, fields=LEAVE_FIELDS):
+    Leave, Employee = db_models.Leave, db_models.Employee
+    stmt = select(*_projection(LEAVE_FIELD_COLUMNS, fields, Leave.id, Leave.created_at))
+    if "employee_name" in fields:
+        stmt = stmt.outerjoin(Employee, Employee.id == Leave.employee_id)
+    return stmt.where(*_leave_filters(status, overlaps_from, overlaps_to))
+
+
+def expense_row_stmt(status: Optional[str] = None, date_from: Optional[date] = None,
+                     date_to: Optional[date] = None, fields=EXPENSE_FIELDS):
+    Expense, Employee = db_models.Expense, db_models.Employee
+    stmt = select(*_projection(EXPENSE_FIELD_COLUMNS, fields, Expense.id, Expense.created_at))
+    if "employee_name" in fields:
+        stmt = stmt.outerjoin(Employee, Employee.id == Expense.employee_id)
+    return stmt.where(*_expense_filters(status, date_from, date_to))
+
+
+def get_employee_row(db: Session, employee_id: int, fields: Optional[Tuple[str, ...]] = None):
+    """Employee by ID as a plain row of the requested detail fields (all by default)."""
+    stmt = employee_row_stmt(fields or EMPLOYEE_DETAIL_FIELDS).where(db_models.Employee.id == employee_id)
+    return db.execute(stmt).first()
+
+
+def get_leave_row(db: Session, leave_id: int, fields: Optional[Tuple[str, ...]] = None):
+    """Leave by ID as a plain row of the requested fields (all by default)."""
+    return db.execute(leave_row_stmt(fields=fields or LEAVE_FIELDS).where(db_models.Leave.id == leave_id)).first()
+
+
+def get_expense_row(db: Session, expense_id: int, fields: Optional[Tuple[str, ...]] = None):
+    """Expense by ID as a plain row of the requested fields (all by default)."""
+    stmt = expense_row_stmt(fields=fields or EXPENSE_FIELDS).where(db_models.Expense.id == expense_id)
+    return db.execute(stmt).first()
+
+
+def get_employee_cards(db: Session, cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE,
+                       fields: Optional[Tuple[str, ...]] = None):
+    """A page of employee cards ordered by name, as plain rows: (rows, next_cursor)."""
+    return paginate_rows(
+        db, employee_row_stmt(fields or EMPLOYEE_CARD_FIELDS), db_models.Employee.full_name, db_models.Employee.id,
+        cursor=cursor, limit=limit
+    )
+
+
+def get_leave_rows(
+    db: Session, status: Optional[str] = None,
+    cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE,
+    overlaps_from: Optional[date] = None, overlaps_to: Optional[date] = None,
+    fields: Optional[Tuple[str, ...]] = None
+):
+    """
+    A page of leaves (newest first) as plain rows: (rows, next_cursor).
+    overlaps_from/overlaps_to keep only leaves that overlap that date range.
+    """
+    return paginate_rows(
+        db, leave_row_stmt(status, overlaps_from, overlaps_to, fields or LEAVE_FIELDS),
+        db_models.Leave.created_at, db_models.Leave.id,
+        cursor=cursor, limit=limit, descending=True
+    )
+
+
+def get_expense_rows(
+    db: Session, status: Optional[str] = None,
+    cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE,
+    date_from: Optional[date] = None, date_to: Optional[date] = None,
+    fields: Optional[Tuple[str, ...]] = None
+):
+    """A page of expenses (newest first) with optional status/date filters, as plain rows: (rows, next_cursor)."""
+    return paginate_rows(
+        db, expense_row_stmt(status, date_from, date_to, fields or EXPENSE_FIELDS),
+        db_models.Expense.created_at, db_models.Expense.id,
+        cursor=cursor, limit=limit, descending=True
+    )
+
+
+# ==================== FULL-TEXT SEARCH ====================
+# Leave reasons / expense descriptions through the full-text index (see
+# fulltext.py), best match first. The match and its rank are computed in a
+# subquery so the keyset cursor can page on (search_rank, id).
+
+def _search_page(db: Session, stmt, model, column_name: str, q: str, cursor: Optional[str], limit: int):
+    match = fulltext.ranked(stmt, model, column_name, q, db.get_bind().dialect.name)
+    if match is None:
+        return [], None
+    stmt, descending = match
+    ranked = stmt.subquery()
+    return paginate_rows(
+        db, select(ranked), ranked.c.search_rank, ranked.c.id,
+        cursor=cursor, limit=limit, descending=descending
+    )
+
+
+def search_leaves(
+    db: Session, q: str, status: Optional[str] = None,
+    cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE,
+    overlaps_from: Optional[date] = None, overlaps_to: Optional[date] = None,
+    fields: Optional[Tuple[str, ...]] = None
+):
+    """Leaves whose reason matches q, as plain rows: (rows, next_cursor)."""
+    stmt = leave_row_stmt(status, overlaps_from, overlaps_to, fields or LEAVE_FIELDS)
+    return _search_page(db, stmt, db_models.Leave, "reason", q, cursor, limit)
+
+
+def search_expenses(
+    db: Session, q: str, status: Optional[str] = None,
+    cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE,
+    date_from: Optional[date] = None, date_to: Optional[date] = None,
+    fields: Optional[Tuple[str, ...]] = None
+):
+    """Expenses whose description matches q, as plain rows: (rows, next_cursor)."""
+    stmt = expense_row_stmt(status, date_from, date_to, fields or EXPENSE_FIELDS)
+    return _search_page(db, stmt, db_models.Expense, "description", q, cursor, limit)
+
+
+# ==================== SUGGEST (typeahead index) ====================
+
+SUGGEST_FIELDS = ("id", "full_name", "title", "avatar_url", "department")
+
+
+def get_suggest_rows(db: Session, *criteria) -> list:
+    """Rows the typeahead index is built from (all employees, or those matching criteria)."""
+    return db.execute(employee_row_stmt(SUGGEST_FIELDS).where(*criteria)).all()
+
+
+def _reindex_employees(db: Session, *criteria):
+    """Refresh these employees in the typeahead index, if it has been built."""
+    if employee_index.loaded or employee_index.loading:
+        employee_index.upsert(get_suggest_rows(db, *criteria))
+
+
+def rebuild_suggest_index(db: Session) -> int:
+    with employee_index.reloading():
+        rows = get_suggest_rows(db)
+        employee_index.load(rows)
+    return len(rows)
+
+
+def suggest_employees(db: Session, q: str, limit: int = SUGGEST_LIMIT) -> list:
+    """Typeahead over name/title/department (index built on first use)."""
+    if not employee_index.loaded:
+        rebuild_suggest_index(db)
+    return employee_index.search(q, limit)
+
+
+# ==================== VERSIONS (ETag validators) ====================
+
+def collection_version_stmt(*models):
+    """
+    One SELECT of COUNT(*) and MAX(updated_at) per model, as scalar subqueries.
+    MAX is answered from the ix_<table>_updated_at indexes.
+    """
+    columns = []
+    for model in models:
+        columns.append(select(func.count()).select_from(model).scalar_subquery())
+        columns.append(select(func.max(model.updated_at)).scalar_subquery())
+    return select(*columns)
+
+
+def get_collection_version(db: Session, *models) -> tuple:
+    """(count, max updated_at, ...) for the given models in one query."""
+    return tuple(db.execute(collection_version_stmt(*models)).one())
+
+
+def row_version_stmt(model, row_id: int):
+    """updated_at of one row, plus its employee's updated_at for leaves/expenses (employee name is in the payload)."""
+    if hasattr(model, "employee_id"):
+        Employee = db_models.Employee
+        return (
+            select(model.updated_at, Employee.updated_at)
+            .outerjoin(Employee, Employee.id == model.employee_id)
+            .where(model.id == row_id)
+        )
+    return select(model.updated_at).where(model.id == row_id)
+
+
+def get_row_version(db: Session, model, row_id: int):
+    """Version tuple of one row (see row_version_stmt), or None if it does not exist."""
+    return db.execute(row_version_stmt(model, row_id)).first()
+
+
 # ==================== DEPARTMENT CRUD ====================
 
 def get_departments(db: Session) -> List[db_models.Department]:
@@ -214,3 +1142,96 @@ def create_department(db: Session, name: str, description: Optional[str] = None)
     db.refresh(db_department)
     return db_department
 
+
+def get_department_map(db: Session) -> Dict[str, int]:
+    """{department name: id} in one query."""
+    return dict(db.query(db_models.Department.name, db_models.Department.id).all())
+
+
+def create_departments(db: Session, names) -> Dict[str, int]:
+    """Insert departments in one executemany and return {name: id} for them."""
+    names = sorted(set(names))
+    if not names:
+        return {}
+    Department = db_models.Department
+    db.execute(insert(Department), [{"name": name, "created_at": datetime.utcnow()} for name in names])
+    created = dict(db.query(Department.name, Department.id).filter(Department.name.in_(names)).all())
+    db.commit()
+    return created
+
+
+# ==================== DASHBOARD STATS ====================
+
+def _birth_month(birth_date) -> Optional[int]:
+    """Month (1-12) of a birth date stored as date or 'YYYY-MM-DD'."""
+    if not birth_date:
+        return None
+    if isinstance(birth_date, date):
+        return birth_date.month
+    try:
+        return int(str(birth_date)[5:7])
+    except ValueError:
+        return None
+
+
+def _bump_stat(db: Session, name: str, delta: int):
+    """
+    Atomically add delta to a dashboard counter inside the caller's transaction.
+    Only an UPDATE: every DASHBOARD_STAT_NAMES row exists (migration 0002,
+    init_db), so concurrent first writers never race to insert it.
+    reconcile_dashboard_stats fixes any drift and recreates missing rows.
+    """
+    db.execute(
+        update(db_models.DashboardStat)
+        .where(db_models.DashboardStat.name == name)
+        .values(value=db_models.DashboardStat.value + delta, updated_at=datetime.utcnow())
+    )
+
+
+def get_dashboard_stats(db: Session) -> Dict[str, int]:
+    """Read all materialized counters (a single small-table scan)."""
+    return {stat.name: stat.value for stat in db.query(db_models.DashboardStat).all()}
+
+
+def compute_dashboard_stats(db: Session) -> Dict[str, int]:
+    """Recompute every counter from the source tables."""
+    Employee, Leave, Expense = db_models.Employee, db_models.Leave, db_models.Expense
+    pending_leaves = db.query(func.count(Leave.id)).filter(Leave.status == "Bekliyor").scalar()
+    pending_expenses = db.query(func.count(Expense.id)).filter(Expense.status == "Bekliyor").scalar()
+    stats = {
+        "total_employees": db.query(func.count(Employee.id)).scalar(),
+        "on_leave": db.query(func.count(Employee.id)).filter(Employee.is_on_leave == True).scalar(),
+        "pending_requests": pending_leaves + pending_expenses,
+    }
+    stats.update({name: 0 for name in db_models.DASHBOARD_STAT_NAMES if name not in stats})
+    birth_months = db.query(func.substr(Employee.birth_date, 6, 2), func.count(Employee.id)).filter(
+        Employee.birth_date.isnot(None)
+    ).group_by(func.substr(Employee.birth_date, 6, 2)).all()
+    for month, count in birth_months:
+        if month:
+            stats[f"birthdays_month_{int(month):02d}"] = count
+    return stats
+
+
+def reconcile_dashboard_stats(db: Session) -> Dict[str, int]:
+    """
+    Overwrite the materialized counters with freshly computed values.
+    Returns the drift that was corrected (name -> stored minus actual).
+
+    The counter rows are locked before counting: a write whose _bump_stat
+    committed earlier is in the counts, and one still in flight blocks on
+    the lock and applies its delta on top of the reconciled value.
+    """
+    stored = {stat.name: stat for stat in db.query(db_models.DashboardStat).with_for_update().all()}
+    actual = compute_dashboard_stats(db)
+    drift = {}
+    for name, value in actual.items():
+        stat = stored.get(name)
+        if stat is None:
+            db.add(db_models.DashboardStat(name=name, value=value))
+            drift[name] = -value
+        elif stat.value != value:
+            drift[name] = stat.value - value
+            stat.value = value
+    db.commit()
+    return drift
@@ -0,0 +1,102 @@
+"""
+Async read operations (AsyncSession counterparts of crud.py).
+Used by async_routes when DATABASE_ASYNC is enabled. Writes stay in crud.py.
+"""
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from typing import List, Optional, Tuple
+from datetime import date
+import db_models
+from pagination import paginate_async, DEFAULT_PAGE_SIZE
+from crud import (
+    collection_version_stmt, row_version_stmt,
+    employee_row_stmt, leave_row_stmt, expense_row_stmt,
+    EMPLOYEE_CARD_FIELDS, EMPLOYEE_DETAIL_FIELDS, LEAVE_FIELDS, EXPENSE_FIELDS, SUGGEST_FIELDS
+)
+from suggest import employee_index, SUGGEST_LIMIT
+
+
+# ==================== EMPLOYEE ====================
+
+async def get_employees_on_leave(db: AsyncSession) -> List[db_models.Employee]:
+    """Get employees currently on leave."""
+    result = await db.execute(
+        select(db_models.Employee)
+        .options(joinedload(db_models.Employee.department))
+        .where(db_models.Employee.is_on_leave == True)
+    )
+    return list(result.scalars().all())
+
+
+# ==================== LIST ROWS (Core select, no ORM entities) ====================
+
+async def get_employee_row(db: AsyncSession, employee_id: int, fields: Optional[Tuple[str, ...]] = None):
+    """Employee by ID as a plain row of the requested detail fields (all by default)."""
+    stmt = employee_row_stmt(fields or EMPLOYEE_DETAIL_FIELDS).where(db_models.Employee.id == employee_id)
+    result = await db.execute(stmt)
+    return result.first()
+
+
+async def get_employee_cards(db: AsyncSession, cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE,
+                             fields: Optional[Tuple[str, ...]] = None):
+    """A page of employee cards ordered by name, as plain rows: (rows, next_cursor)."""
+    return await paginate_async(
+        db, employee_row_stmt(fields or EMPLOYEE_CARD_FIELDS), db_models.Employee.full_name, db_models.Employee.id,
+        cursor=cursor, limit=limit, plain_rows=True
+    )
+
+
+async def get_leave_rows(
+    db: AsyncSession, status: Optional[str] = None,
+    cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE,
+    overlaps_from: Optional[date] = None, overlaps_to: Optional[date] = None,
+    fields: Optional[Tuple[str, ...]] = None
+):
+    """A page of leaves (newest first) as plain rows: (rows, next_cursor)."""
+    return await paginate_async(
+        db, leave_row_stmt(status, overlaps_from, overlaps_to, fields or LEAVE_FIELDS),
+        db_models.Leave.created_at, db_models.Leave.id,
+        cursor=cursor, limit=limit, descending=True, plain_rows=True
+    )
+
+
+async def get_expense_rows(
+    db: AsyncSession, status: Optional[str] = None,
+    cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE,
+    date_from: Optional[date] = None, date_to: Optional[date] = None,
+    fields: Optional[Tuple[str, ...]] = None
+):
+    """A page of expenses (newest first) as plain rows: (rows, next_cursor)."""
+    return await paginate_async(
+        db, expense_row_stmt(status, date_from, date_to, fields or EXPENSE_FIELDS),
+        db_models.Expense.created_at, db_models.Expense.id,
+        cursor=cursor, limit=limit, descending=True, plain_rows=True
+    )
+
+
+# ==================== SUGGEST (typeahead index) ====================
+
+async def suggest_employees(db: AsyncSession, q: str, limit: int = SUGGEST_LIMIT) -> list:
+    """Typeahead over name/title/department (index built on first use)."""
+    if not employee_index.loaded:
+        with employee_index.reloading():
+            result = await db.execute(employee_row_stmt(SUGGEST_FIELDS))
+            employee_index.load(result.all())
+    return employee_index.search(q, limit)
+
+
+# ==================== VERSIONS (ETag validators) ====================
+
+async def get_collection_version(db: AsyncSession, *models) -> tuple:
+    """(count, max updated_at, ...) for the given models in one query."""
+    result = await db.execute(collection_version_stmt(*models))
+    return tuple(result.one())
+
+
+async def get_row_version(db: AsyncSession, model, row_id: int):
+    """Version tuple of one row (see crud.row_version_stmt), or None if it does not exist."""
+    result = await db.execute(row_version_stmt(model, row_id))
+    return result.first()
+
@@ -3,39 +3,392 @@ Database configuration and session management.
 Supports both SQLite (small businesses) and MariaDB/MySQL (production).
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from fastapi import Request
+from typing import Dict, List, Optional
+import hashlib
+import itertools
+import logging
+import math
 import os
+import time
 from dotenv import load_dotenv
 
+from pool_metrics import TimedAsyncQueuePool, TimedQueuePool, track
+
 # Load environment variables
 load_dotenv()
 
 # Database URL from environment
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./fasthr.db")
 DATABASE_TYPE = os.getenv("DATABASE_TYPE", "sqlite")
+SQL_ECHO = os.getenv("SQL_ECHO", "false").lower() in ("1", "true", "yes")
+
+# Startup schema handling (see main.lifespan / manage.py)
+DB_AUTO_CREATE = os.getenv(
+    "DB_AUTO_CREATE", "true" if DATABASE_TYPE == "sqlite" else "false"
+).lower() in ("1", "true", "yes")
+DB_VERIFY_SCHEMA = os.getenv("DB_VERIFY_SCHEMA", "false").lower() in ("1", "true", "yes")
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Connection pool (MariaDB/MySQL, and the SQLite reader pool). Each engine -
+# primary, every read replica and the async engine - gets its own pool of
+# this size per worker process; size it against the worker's thread count
+# (GET /api/admin/db-pool shows whether checkouts wait).
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))   # seconds to wait for a connection
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "3600"))   # reconnect after this many seconds
+
+POOL_OPTIONS = dict(
+    pool_pre_ping=True,  # Verify connections before using
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_recycle=DB_POOL_RECYCLE,
+)
+
+# SQLite production profile (file databases). Every connection gets WAL
+# (readers and the writer don't block each other), synchronous=NORMAL (no
+# fsync per commit in WAL; durable at checkpoints), a busy_timeout, a memory
+# map and a larger page cache. Writes go through one writer connection per
+# process that starts its transactions with BEGIN IMMEDIATE: concurrent
+# writers queue for that connection (pool metrics "primary") instead of
+# failing with "database is locked", and other processes wait busy_timeout.
+# Reads (get_read_db, read_session) use a separate reader pool, and so do
+# SessionLocal's reads until its transaction writes (WriterRoutedSession).
+SQLITE_PROFILE = os.getenv("SQLITE_PROFILE", "true").lower() in ("1", "true", "yes")
+SQLITE_JOURNAL_MODE = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+SQLITE_CACHE_SIZE_KB = int(os.getenv("SQLITE_CACHE_SIZE_KB", "65536"))
+SQLITE_WRITE_TIMEOUT = float(os.getenv("SQLITE_WRITE_TIMEOUT", "30"))  # seconds to wait for the writer
+
+
+def _sqlite_file(url: str) -> bool:
+    return url.startswith("sqlite") and ":memory:" not in url and url.partition("://")[2] not in ("", "/")
+
+
+def sqlite_pragmas(sa_engine):
+    """Apply the profile's pragmas to every new connection of sa_engine."""
+    @event.listens_for(sa_engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute(f"PRAGMA journal_mode={SQLITE_JOURNAL_MODE}")
+        cursor.execute(f"PRAGMA synchronous={SQLITE_SYNCHRONOUS}")
+        cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+        cursor.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
+        cursor.execute(f"PRAGMA cache_size=-{SQLITE_CACHE_SIZE_KB}")
+        cursor.close()
+
+
+def sqlite_immediate_transactions(sa_engine):
+    """
+    Start sa_engine's transactions with BEGIN IMMEDIATE: the write lock is
+    taken up front (waiting busy_timeout), not on the first write of a
+    transaction that has already read - which fails at once in WAL.
+    """
+    @event.listens_for(sa_engine, "connect")
+    def _disable_pysqlite_begin(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(sa_engine, "begin")
+    def _begin_immediate(conn):
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+
 
 # Engine configuration
-if DATABASE_TYPE == "sqlite":
-    # SQLite configuration
-    engine = create_engine(
-        DATABASE_URL,
-        connect_args={"check_same_thread": False},  # SQLite specific
-        echo=True  # Set to False in production
-    )
-else:
+def _create_engine(url: str, name: str, writer: bool = False):
+    if DATABASE_TYPE == "sqlite":
+        # SQLite configuration
+        if not (SQLITE_PROFILE and _sqlite_file(url)):
+            return create_engine(
+                url,
+                connect_args={"check_same_thread": False},  # SQLite specific
+                echo=SQL_ECHO
+            )
+        if writer:
+            pool = dict(pool_size=1, max_overflow=0, pool_timeout=SQLITE_WRITE_TIMEOUT)
+        else:
+            pool = dict(pool_size=DB_POOL_SIZE, max_overflow=DB_MAX_OVERFLOW, pool_timeout=DB_POOL_TIMEOUT)
+        sa_engine = create_engine(
+            url,
+            connect_args={"check_same_thread": False},
+            poolclass=TimedQueuePool,
+            echo=SQL_ECHO,
+            **pool
+        )
+        sqlite_pragmas(sa_engine)
+        if writer:
+            sqlite_immediate_transactions(sa_engine)
+        track(name, sa_engine)
+        return sa_engine
     # MariaDB/MySQL configuration
-    engine = create_engine(
-        DATABASE_URL,
-        pool_pre_ping=True,  # Verify connections before using
-        pool_recycle=3600,   # Recycle connections after 1 hour
-        echo=True  # Set to False in production
-    )
+    sa_engine = create_engine(url, poolclass=TimedQueuePool, echo=SQL_ECHO, **POOL_OPTIONS)
+    track(name, sa_engine)
+    return sa_engine
+
+
+engine = _create_engine(DATABASE_URL, "primary", writer=True)
 
 # SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+def _is_write(clause) -> bool:
+    """INSERT/UPDATE/DELETE, or a SELECT ... FOR UPDATE (a read that is part of a write)."""
+    return clause is not None and (
+        getattr(clause, "is_dml", False) or getattr(clause, "_for_update_arg", None) is not None
+    )
+
+
+class WriterRoutedSession(Session):
+    """
+    SessionLocal of the SQLite profile. Reads run on the reader pool until
+    the transaction first writes (a flush, INSERT/UPDATE/DELETE or SELECT ...
+    FOR UPDATE); only then is the writer connection checked out and its
+    BEGIN IMMEDIATE taken. From there to commit/rollback everything runs on
+    the writer, so the transaction reads its own writes. Lookups before the
+    first write and reads after commit (refresh, reindex) never hold the
+    write lock.
+    """
+
+    _writing = False
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if self._writing or self._flushing or _is_write(clause):
+            self._writing = True
+            return engine
+        return read_engine
+
+
+@event.listens_for(WriterRoutedSession, "after_transaction_end")
+def _end_write(session, transaction):
+    if transaction.parent is None:
+        session._writing = False
+
+
+# Reads on the primary database: SQLite (profile) reads use their own pool
+# so they never wait for the writer connection; elsewhere it's SessionLocal.
+if DATABASE_TYPE == "sqlite" and SQLITE_PROFILE and _sqlite_file(DATABASE_URL):
+    read_engine = _create_engine(DATABASE_URL, "reader")
+    ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, class_=WriterRoutedSession)
+else:
+    read_engine = engine
+    ReadSessionLocal = SessionLocal
+
+
+# Read replicas (optional) - READ_DATABASE_URLS="url1,url2" sends the
+# read-only routes (get_read_db) to replicas, round-robin over the healthy
+# ones. A replica that refuses connections, or lags more than
+# READ_MAX_LAG_SECONDS (check_read_replicas), is skipped for
+# READ_RETRY_SECONDS; with none left, reads go to the primary. After a
+# client's own POST/PUT/PATCH/DELETE its reads stay on the primary for
+# READ_STICKY_SECONDS, so it sees its own writes (read_your_writes_middleware).
+READ_DATABASE_URLS = [url.strip() for url in os.getenv("READ_DATABASE_URLS", "").split(",") if url.strip()]
+READ_STICKY_SECONDS = float(os.getenv("READ_STICKY_SECONDS", "5"))
+READ_RETRY_SECONDS = float(os.getenv("READ_RETRY_SECONDS", "30"))
+READ_MAX_LAG_SECONDS = float(os.getenv("READ_MAX_LAG_SECONDS", "10"))
+
+STICKY_COOKIE = "fasthr_primary"
+WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+logger = logging.getLogger("fasthr.db")
+
+
+class ReadReplicas:
+    """Replica engines with round-robin selection and a cool-down for failing ones."""
+
+    def __init__(self, urls: List[str]):
+        self.urls = urls
+        self.engines = [_create_engine(url, f"replica{i}") for i, url in enumerate(urls)]
+        self.sessions = [sessionmaker(autocommit=False, autoflush=False, bind=e) for e in self.engines]
+        # AsyncSession factories per replica (same order), set when DATABASE_ASYNC is on
+        self.async_sessions: list = []
+        self._down_until: Dict[int, float] = {}
+        self._turn = itertools.count()
+
+    def healthy(self) -> List[int]:
+        now = time.monotonic()
+        return [i for i in range(len(self.engines)) if self._down_until.get(i, 0) <= now]
+
+    def mark_down(self, index: int, reason: str):
+        self._down_until[index] = time.monotonic() + READ_RETRY_SECONDS
+        logger.warning("Read replica %d unavailable for %.0fs: %s", index, READ_RETRY_SECONDS, reason)
+
+    def mark_up(self, index: int):
+        self._down_until.pop(index, None)
+
+    def _candidates(self) -> List[int]:
+        """Healthy replicas, starting from the next one in round-robin order."""
+        healthy = self.healthy()
+        if not healthy:
+            return []
+        start = next(self._turn) % len(healthy)
+        return healthy[start:] + healthy[:start]
+
+    def session(self) -> Optional[Session]:
+        """Session on the next healthy replica (connected), or None."""
+        for index in self._candidates():
+            db = self.sessions[index]()
+            try:
+                db.connection()
+                return db
+            except OperationalError as e:
+                db.close()
+                self.mark_down(index, str(e.orig))
+        return None
+
+    async def async_session(self):
+        """AsyncSession on the next healthy replica (connected), or None."""
+        if not self.async_sessions:
+            return None
+        for index in self._candidates():
+            db = self.async_sessions[index]()
+            try:
+                await db.connection()
+                return db
+            except OperationalError as e:
+                await db.close()
+                self.mark_down(index, str(e.orig))
+        return None
+
+    def check(self):
+        """Probe every replica: connectivity and, on MariaDB/MySQL, replication lag."""
+        for index, replica in enumerate(self.engines):
+            try:
+                with replica.connect() as conn:
+                    conn.exec_driver_sql("SELECT 1")
+                    lag = _replication_lag(conn)
+            except OperationalError as e:
+                self.mark_down(index, str(e.orig))
+                continue
+            if lag is None or lag > READ_MAX_LAG_SECONDS:
+                self.mark_down(index, f"replication lag {lag}")
+            else:
+                self.mark_up(index)
+
+
+def _replication_lag(conn) -> Optional[float]:
+    """Seconds behind the primary (0 when not a replica); None if replication is stopped."""
+    if conn.dialect.name == "sqlite":
+        return 0.0
+    status = conn.exec_driver_sql("SHOW SLAVE STATUS").mappings().first()
+    if status is None:
+        return 0.0
+    lag = status.get("Seconds_Behind_Master")
+    return None if lag is None else float(lag)
+
+
+read_replicas = ReadReplicas(READ_DATABASE_URLS) if READ_DATABASE_URLS else None
+
+
+def check_read_replicas():
+    if read_replicas is not None:
+        read_replicas.check()
+
+
+def read_session() -> Session:
+    """Session for read-only work outside a request (exports): a replica if one is healthy."""
+    db = read_replicas.session() if read_replicas is not None else None
+    return db if db is not None else ReadSessionLocal()
+
+
+# Read-your-writes: clients that just wrote are pinned to the primary,
+# by cookie (any worker) and by bearer token (this worker).
+_sticky_until: Dict[str, float] = {}
+
+
+def _client_key(request: Request) -> Optional[str]:
+    authorization = request.headers.get("authorization")
+    return hashlib.sha1(authorization.encode("utf-8")).hexdigest() if authorization else None
+
+
+def reads_from_primary(request: Request) -> bool:
+    if request.cookies.get(STICKY_COOKIE):
+        return True
+    key = _client_key(request)
+    return key is not None and _sticky_until.get(key, 0) > time.monotonic()
+
+
+async def read_your_writes_middleware(request: Request, call_next):
+    """HTTP middleware: pin a client's reads to the primary right after its writes."""
+    response = await call_next(request)
+    if request.method in WRITE_METHODS and response.status_code < 400:
+        now = time.monotonic()
+        key = _client_key(request)
+        if key is not None:
+            if len(_sticky_until) > 10000:
+                for stale in [k for k, until in _sticky_until.items() if until <= now]:
+                    del _sticky_until[stale]
+            _sticky_until[key] = now + READ_STICKY_SECONDS
+        response.set_cookie(
+            STICKY_COOKIE, "1", max_age=max(1, math.ceil(READ_STICKY_SECONDS)), httponly=True, samesite="lax"
+        )
+    return response
+
+
+# Async engine (optional) - DATABASE_ASYNC=true serves the read endpoints
+# from an AsyncSession so requests wait on the connection pool instead of
+# holding a threadpool slot. With read replicas, each gets an async engine
+# too and get_async_read_db routes like get_read_db (health, stickiness).
+DATABASE_ASYNC = os.getenv("DATABASE_ASYNC", "false").lower() in ("1", "true", "yes")
+
+_ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "mysql": "mysql+aiomysql",
+    "mysql+pymysql": "mysql+aiomysql",
+    "mariadb": "mariadb+aiomysql",
+    "mariadb+pymysql": "mariadb+aiomysql",
+}
+
+
+def to_async_url(url: str) -> str:
+    """Swap a sync driver URL for its async equivalent (sqlite -> aiosqlite, pymysql -> aiomysql)."""
+    scheme, sep, rest = url.partition("://")
+    return _ASYNC_DRIVERS.get(scheme, scheme) + sep + rest
+
+
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL", to_async_url(DATABASE_URL))
+
+async_engine = None
+AsyncSessionLocal = None
+
+
+def _create_async_engine(url: str, name: str):
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    if DATABASE_TYPE == "sqlite":
+        sa_engine = create_async_engine(url)
+        if SQLITE_PROFILE and _sqlite_file(url):
+            sqlite_pragmas(sa_engine.sync_engine)
+        return sa_engine
+    sa_engine = create_async_engine(url, poolclass=TimedAsyncQueuePool, **POOL_OPTIONS)
+    track(name, sa_engine.sync_engine)
+    return sa_engine
+
+
+if DATABASE_ASYNC:
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    async_engine = _create_async_engine(ASYNC_DATABASE_URL, "async")
+    AsyncSessionLocal = async_sessionmaker(
+        async_engine, autoflush=False, expire_on_commit=False
+    )
+    if read_replicas is not None:
+        read_replicas.async_sessions = [
+            async_sessionmaker(
+                _create_async_engine(to_async_url(url), f"async-replica{i}"),
+                autoflush=False, expire_on_commit=False
+            )
+            for i, url in enumerate(read_replicas.urls)
+        ]
+
 # Base class for models
 Base = declarative_base()
 
@@ -53,13 +406,113 @@ def get_db():
         db.close()
 
 
+def get_read_db(request: Request):
+    """
+    Database session dependency for read-only routes.
+    A healthy read replica when configured, otherwise (or right after the
+    client's own write) the primary.
+    Usage: db: Session = Depends(get_read_db)
+    """
+    db = None
+    if read_replicas is not None and not reads_from_primary(request):
+        db = read_replicas.session()
+    if db is None:
+        db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+# Async dependency for FastAPI
+async def get_async_read_db(request: Request):
+    """
+    Async database session dependency for read-only routes, routed like
+    get_read_db: a healthy read replica when configured, otherwise (or right
+    after the client's own write) the primary.
+    Usage: db: AsyncSession = Depends(get_async_read_db)
+    Only available when DATABASE_ASYNC is enabled.
+    """
+    if AsyncSessionLocal is None:
+        raise RuntimeError("Async database is disabled; set DATABASE_ASYNC=true")
+    db = None
+    if read_replicas is not None and not reads_from_primary(request):
+        db = await read_replicas.async_session()
+    if db is None:
+        db = AsyncSessionLocal()
+    try:
+        yield db
+    finally:
+        await db.close()
+
+
 # Create all tables
 def init_db():
     """
-    Initialize database - create all tables.
-    Call this when starting the application.
+    Initialize database - create all tables and stamp the Alembic head.
+    Run explicitly (python manage.py init-db, seed_data.py) or from the app
+    lifespan when DB_AUTO_CREATE is enabled - never at import time.
     """
+    import db_models  # noqa: F401 - register models on Base.metadata
+    from sqlalchemy import inspect
+
+    # Only a freshly created schema is known to match the head; existing
+    # databases must be brought up with `alembic upgrade head`.
+    fresh = not inspect(engine).has_table("users")
     Base.metadata.create_all(bind=engine)
+    seed_dashboard_stats()
+    if fresh:
+        _alembic_stamp_head()
     print(f"OK - Database initialized: {DATABASE_TYPE}")
     print(f"Connection: {DATABASE_URL}")
 
+
+def seed_dashboard_stats():
+    """Create the missing dashboard counter rows (value 0 until the next reconcile)."""
+    from sqlalchemy import insert, select
+    from db_models import DASHBOARD_STAT_NAMES, DashboardStat
+
+    with engine.begin() as conn:
+        existing = set(conn.execute(select(DashboardStat.name)).scalars())
+        missing = [name for name in DASHBOARD_STAT_NAMES if name not in existing]
+        if missing:
+            conn.execute(insert(DashboardStat), [{"name": name, "value": 0} for name in missing])
+
+
+# Schema version checks (Alembic)
+def _alembic_config():
+    from alembic.config import Config
+
+    cfg = Config(os.path.join(BASE_DIR, "alembic.ini"))
+    cfg.set_main_option("script_location", os.path.join(BASE_DIR, "alembic"))
+    cfg.set_main_option("sqlalchemy.url", DATABASE_URL)
+    return cfg
+
+
+def _alembic_stamp_head():
+    from alembic.runtime.migration import MigrationContext
+    from alembic.script import ScriptDirectory
+
+    script = ScriptDirectory.from_config(_alembic_config())
+    with engine.begin() as conn:
+        context = MigrationContext.configure(conn)
+        if not context.get_current_heads():
+            context.stamp(script, "heads")
+
+
+def get_schema_revisions():
+    """Return (current DB revisions, Alembic head revisions) as sets."""
+    from alembic.runtime.migration import MigrationContext
+    from alembic.script import ScriptDirectory
+
+    heads = set(ScriptDirectory.from_config(_alembic_config()).get_heads())
+    with engine.connect() as conn:
+        current = set(MigrationContext.configure(conn).get_current_heads())
+    return current, heads
+
+
+def verify_schema() -> bool:
+    """True when the database is at the Alembic head."""
+    current, heads = get_schema_revisions()
+    return current == heads
+
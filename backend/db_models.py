@@ -2,10 +2,16 @@
 SQLAlchemy Database Models
 """
 
-from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, Float, Boolean, Date, DateTime, ForeignKey, Text, Index
+from sqlalchemy.dialects import mysql
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from database import Base
+import fulltext
+
+# updated_at of the ETag-versioned tables (etags.py): microseconds on
+# MariaDB/MySQL too, where a plain DATETIME keeps whole seconds
+VersionTimestamp = DateTime().with_variant(mysql.DATETIME(fsp=6), "mysql", "mariadb")
 
 
 class User(Base):
@@ -48,6 +54,11 @@ class Employee(Base):
     Employee model.
     """
     __tablename__ = "employees"
+    __table_args__ = (
+        Index("ix_employees_full_name", "full_name"),  # list ordering (full_name, id)
+        Index("ix_employees_is_on_leave", "is_on_leave"),
+        Index("ix_employees_updated_at", "updated_at"),  # ETag validator (MAX)
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), unique=True, nullable=False)
@@ -62,12 +73,12 @@ class Employee(Base):
     avatar_url = Column(String(255), nullable=True)
     
     # İş bilgileri
-    start_date = Column(String(10), nullable=False)  # YYYY-MM-DD
+    start_date = Column(Date, nullable=False)
     is_on_leave = Column(Boolean, default=False)
     
     # Adres ve diğer bilgiler
     address = Column(Text, nullable=True)
-    birth_date = Column(String(10), nullable=True)  # YYYY-MM-DD
+    birth_date = Column(Date, nullable=True)
     emergency_contact = Column(String(200), nullable=True)
     
     # İzin hakları
@@ -78,7 +89,7 @@ class Employee(Base):
     
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = Column(VersionTimestamp, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
     user = relationship("User", back_populates="employee")
@@ -92,13 +103,20 @@ class Leave(Base):
     Leave request model.
     """
     __tablename__ = "leaves"
+    __table_args__ = (
+        Index("ix_leaves_status_created_at", "status", "created_at"),  # filtered list
+        Index("ix_leaves_created_at", "created_at"),  # unfiltered list
+        Index("ix_leaves_employee_id_start_date", "employee_id", "start_date"),  # per-employee history/overlap
+        Index("ix_leaves_employee_id_status", "employee_id", "status"),  # pending days for balance checks
+        Index("ix_leaves_updated_at", "updated_at"),  # ETag validator (MAX)
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     employee_id = Column(Integer, ForeignKey("employees.id"), nullable=False)
     
     leave_type = Column(String(50), nullable=False)  # Yıllık İzin, Hastalık İzni, etc.
-    start_date = Column(String(10), nullable=False)  # YYYY-MM-DD
-    end_date = Column(String(10), nullable=False)  # YYYY-MM-DD
+    start_date = Column(Date, nullable=False)
+    end_date = Column(Date, nullable=False)
     days = Column(Integer, nullable=False)
     reason = Column(Text, nullable=False)
     
@@ -111,7 +129,7 @@ class Leave(Base):
     
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = Column(VersionTimestamp, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
     employee = relationship("Employee", back_populates="leaves")
@@ -122,13 +140,21 @@ class Expense(Base):
     Expense request model.
     """
     __tablename__ = "expenses"
+    __table_args__ = (
+        Index("ix_expenses_status_date", "status", "date"),  # summary by status and month
+        Index("ix_expenses_status_created_at", "status", "created_at"),  # filtered list
+        Index("ix_expenses_created_at", "created_at"),  # unfiltered list
+        Index("ix_expenses_updated_at", "updated_at"),  # ETag validator (MAX)
+        Index("ix_expenses_employee_id_date", "employee_id", "date"),  # per-employee summary
+        Index("ix_expenses_date", "date"),  # month ranges / rollups
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     employee_id = Column(Integer, ForeignKey("employees.id"), nullable=False)
     
     expense_type = Column(String(50), nullable=False)  # Yol, Yemek, Konaklama, Diğer
     amount = Column(Float, nullable=False)
-    date = Column(String(10), nullable=False)  # YYYY-MM-DD
+    date = Column(Date, nullable=False)
     description = Column(Text, nullable=False)
     
     # Fiş/Fatura
@@ -143,8 +169,60 @@ class Expense(Base):
     
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = Column(VersionTimestamp, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
     employee = relationship("Employee", back_populates="expenses")
 
+
+
+# Every dashboard counter; the rows are created up front (migration 0002,
+# init_db) so crud only ever UPDATEs them
+DASHBOARD_STAT_NAMES = (
+    "total_employees", "on_leave", "pending_requests",
+    *(f"birthdays_month_{month:02d}" for month in range(1, 13)),
+)
+
+
+class DashboardStat(Base):
+    """
+    Materialized dashboard counter (total_employees, pending_requests, ...).
+    Maintained by crud in the same transaction as the change; a periodic
+    reconciliation recomputes them from the source tables.
+    """
+    __tablename__ = "dashboard_stats"
+
+    name = Column(String(50), primary_key=True)
+    value = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class ExpenseRollup(Base):
+    """
+    Aggregated expenses of a closed month, per employee and status.
+    Built by crud.close_expense_months; yearly reports read these rows
+    instead of rescanning every expense.
+    """
+    __tablename__ = "expense_rollups"
+
+    month = Column(String(7), primary_key=True)  # YYYY-MM
+    employee_id = Column(Integer, ForeignKey("employees.id"), primary_key=True)
+    status = Column(String(20), primary_key=True)
+    total_amount = Column(Float, nullable=False, default=0)
+    count = Column(Integer, nullable=False, default=0)
+
+
+class ExpenseRollupMonth(Base):
+    """
+    Months whose expense_rollups rows are complete.
+    Removed again when an expense in that month changes.
+    """
+    __tablename__ = "expense_rollup_months"
+
+    month = Column(String(7), primary_key=True)  # YYYY-MM
+    closed_at = Column(DateTime, default=datetime.utcnow)
+
+
+# Full-text indexes on the free-text columns (FTS5 on SQLite, FULLTEXT on MariaDB)
+fulltext.attach(Leave.__table__, "reason")
+fulltext.attach(Expense.__table__, "description")
@@ -0,0 +1,246 @@
+"""
+Bulk employee import from CSV or XLSX rosters.
+
+The file is read as a stream and processed IMPORT_CHUNK_SIZE rows at a time:
+rows are validated against one prefetched department map and one prefetched
+set of taken emails/usernames, missing departments are created once, and each
+chunk is written with executemany INSERTs (crud.bulk_create_employees).
+Invalid rows are skipped and reported with their line number.
+
+No password is hashed during the import: bcrypt at login cost would take
+hours for a large roster and crowd logins out of the password pool. Every
+imported user gets an unusable hash and a password-set token
+(auth.create_password_set_token) in the report; POST /api/auth/set-password
+hashes the user's own password once, when they use it.
+
+    python manage.py import-employees roster.csv
+    POST /api/employees:import   (multipart, field "file")
+
+Columns (header row, Turkish names also accepted): full_name, email, title,
+start_date are required; department, phone, birth_date, address,
+emergency_contact, username, role are optional; other columns (e.g. an old
+password column) are ignored. Dates may be YYYY-MM-DD or DD.MM.YYYY.
+"""
+
+import codecs
+import csv
+import os
+from datetime import date, datetime
+from itertools import islice
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+import crud
+from auth import create_password_set_token
+
+IMPORT_CHUNK_SIZE = int(os.getenv("IMPORT_CHUNK_SIZE", "1000"))
+MAX_REPORTED_ERRORS = 1000
+
+REQUIRED_COLUMNS = ("full_name", "email", "title", "start_date")
+ROLES = ("admin", "manager", "employee")
+
+# Placeholder hash that never verifies; bcrypt hashes always start with "$"
+UNUSABLE_PASSWORD = "!"
+
+COLUMN_ALIASES = {
+    "ad_soyad": "full_name",
+    "e-posta": "email",
+    "eposta": "email",
+    "unvan": "title",
+    "ünvan": "title",
+    "departman": "department",
+    "telefon": "phone",
+    "işe_başlama": "start_date",
+    "ise_baslama": "start_date",
+    "doğum_tarihi": "birth_date",
+    "dogum_tarihi": "birth_date",
+    "adres": "address",
+    "acil_durum_iletişim": "emergency_contact",
+    "kullanıcı_adı": "username",
+    "rol": "role",
+}
+
+
+class ImportFormatError(ValueError):
+    """The file itself can't be imported (unknown type, missing columns)."""
+
+
+def _column_name(header) -> str:
+    name = str(header or "").strip().lower().replace(" ", "_")
+    return COLUMN_ALIASES.get(name, name)
+
+
+def _read_csv(file: BinaryIO) -> Tuple[list, Iterator[Tuple[int, dict]]]:
+    reader = csv.reader(codecs.iterdecode(file, "utf-8-sig"))
+    header = [_column_name(h) for h in next(reader, [])]
+
+    def rows():
+        for row in reader:
+            if any(cell.strip() for cell in row):
+                yield reader.line_num, dict(zip(header, row))
+
+    return header, rows()
+
+
+def _read_xlsx(file: BinaryIO) -> Tuple[list, Iterator[Tuple[int, dict]]]:
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ImportFormatError("XLSX içe aktarma için openpyxl kurulu olmalı (pip install openpyxl)")
+    workbook = load_workbook(file, read_only=True, data_only=True)
+    sheet_rows = workbook.active.iter_rows(values_only=True)
+    header = [_column_name(h) for h in next(sheet_rows, ())]
+
+    def rows():
+        try:
+            for number, row in enumerate(sheet_rows, start=2):
+                if any(cell not in (None, "") for cell in row):
+                    yield number, dict(zip(header, row))
+        finally:
+            workbook.close()
+
+    return header, rows()
+
+
+def iter_rows(file: BinaryIO, filename: str) -> Iterator[Tuple[int, dict]]:
+    """
+    Stream (line number, {column: value}) pairs from a CSV or XLSX file.
+    The header is read up front so format problems surface before any insert.
+    """
+    extension = os.path.splitext(filename.lower())[1]
+    if extension == ".csv":
+        header, rows = _read_csv(file)
+    elif extension == ".xlsx":
+        header, rows = _read_xlsx(file)
+    else:
+        raise ImportFormatError("Desteklenmeyen dosya türü: sadece .csv ve .xlsx")
+    missing = [column for column in REQUIRED_COLUMNS if column not in header]
+    if missing:
+        raise ImportFormatError(f"Eksik kolon: {', '.join(missing)}")
+    return rows
+
+
+def _text(raw: dict, column: str) -> Optional[str]:
+    value = raw.get(column)
+    if value is None:
+        return None
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)  # XLSX numbers, e.g. phone numbers
+    value = str(value).strip()
+    return value or None
+
+
+def _date(raw: dict, column: str) -> Optional[date]:
+    value = raw.get(column)
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    text = _text(raw, column)
+    if text is None:
+        return None
+    for pattern in ("%Y-%m-%d", "%d.%m.%Y"):
+        try:
+            return datetime.strptime(text, pattern).date()
+        except ValueError:
+            pass
+    raise ValueError(f"{column}: geçersiz tarih '{text}'")
+
+
+def _parse_row(raw: dict, taken_emails: set, taken_usernames: set) -> dict:
+    """Validate one row; raises ValueError with a Turkish message."""
+    missing = [column for column in REQUIRED_COLUMNS if not _text(raw, column)]
+    if missing:
+        raise ValueError(f"Eksik alan: {', '.join(missing)}")
+
+    email = _text(raw, "email").lower()
+    if "@" not in email or "." not in email.rsplit("@", 1)[-1]:
+        raise ValueError(f"email: geçersiz e-posta '{email}'")
+    if email in taken_emails:
+        raise ValueError(f"email: '{email}' zaten kayıtlı")
+
+    username = (_text(raw, "username") or email.split("@", 1)[0]).lower()
+    if username in taken_usernames:
+        raise ValueError(f"username: '{username}' zaten kayıtlı")
+
+    role = (_text(raw, "role") or "employee").lower()
+    if role not in ROLES:
+        raise ValueError(f"role: geçersiz rol '{role}'")
+
+    row = {
+        "full_name": _text(raw, "full_name"),
+        "email": email,
+        "username": username,
+        "title": _text(raw, "title"),
+        "role": role,
+        "department": _text(raw, "department"),
+        "phone": _text(raw, "phone"),
+        "start_date": _date(raw, "start_date"),
+        "birth_date": _date(raw, "birth_date"),
+        "address": _text(raw, "address"),
+        "emergency_contact": _text(raw, "emergency_contact"),
+    }
+    taken_emails.add(email)
+    taken_usernames.add(username)
+    return row
+
+
+def _to_insert_values(row: dict, departments: Dict[str, int]) -> Tuple[dict, dict]:
+    user = {
+        "email": row["email"],
+        "username": row["username"],
+        "full_name": row["full_name"],
+        "hashed_password": UNUSABLE_PASSWORD,
+        "role": row["role"],
+        "is_active": True,
+    }
+    employee = {
+        "department_id": departments.get(row["department"]),
+        "full_name": row["full_name"],
+        "title": row["title"],
+        "email": row["email"],
+        "phone": row["phone"],
+        "start_date": row["start_date"],
+        "birth_date": row["birth_date"],
+        "address": row["address"],
+        "emergency_contact": row["emergency_contact"],
+    }
+    return user, employee
+
+
+def import_employees(db: Session, file: BinaryIO, filename: str, chunk_size: int = IMPORT_CHUNK_SIZE) -> dict:
+    """
+    Import a roster file. Returns {"imported", "failed", "errors": [{"row", "error"}],
+    "password_tokens": [{"email", "token"}]}; at most MAX_REPORTED_ERRORS
+    errors are listed. Raises ImportFormatError.
+    """
+    rows = iter_rows(file, filename)
+    departments = crud.get_department_map(db)
+    taken_emails, taken_usernames = crud.get_user_identities(db)
+    imported, failed, errors, password_tokens = 0, 0, [], []
+
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            break
+        valid: List[dict] = []
+        for number, raw in chunk:
+            try:
+                valid.append(_parse_row(raw, taken_emails, taken_usernames))
+            except ValueError as e:
+                failed += 1
+                if len(errors) < MAX_REPORTED_ERRORS:
+                    errors.append({"row": number, "error": str(e)})
+
+        new_departments = {row["department"] for row in valid if row["department"]} - departments.keys()
+        if new_departments:
+            departments.update(crud.create_departments(db, new_departments))
+
+        imported += crud.bulk_create_employees(db, [_to_insert_values(row, departments) for row in valid])
+        password_tokens.extend(
+            {"email": row["email"], "token": create_password_set_token(row["email"], UNUSABLE_PASSWORD)}
+            for row in valid
+        )
+
+    return {"imported": imported, "failed": failed, "errors": errors, "password_tokens": password_tokens}
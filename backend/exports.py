@@ -0,0 +1,160 @@
+"""
+Streaming CSV/XLSX exports of expenses and leaves.
+
+Rows are read as plain tuples off a server-side cursor (yield_per) and
+encoded batch by batch, so memory stays flat however many rows match.
+CSV starts sending bytes with the first batch. XLSX is a zip archive that
+can only be finished once every row is known, so rows are appended to an
+openpyxl write-only workbook (spooled to disk, constant memory) and the
+finished file is streamed out in blocks.
+
+Each stream opens its own session (a read replica when configured): the
+request's session is closed before the response body is sent.
+"""
+
+import csv
+import io
+import os
+import tempfile
+from datetime import date, datetime
+from typing import Iterator, List, Optional, Tuple
+
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.sql import Select
+
+import db_models
+from database import read_session
+
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "1000"))
+_FILE_BLOCK_SIZE = 64 * 1024
+
+MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+# (header, column) pairs
+EXPENSE_COLUMNS = [
+    ("ID", db_models.Expense.id),
+    ("Çalışan ID", db_models.Expense.employee_id),
+    ("Çalışan", db_models.Employee.full_name),
+    ("Masraf Türü", db_models.Expense.expense_type),
+    ("Tutar", db_models.Expense.amount),
+    ("Tarih", db_models.Expense.date),
+    ("Açıklama", db_models.Expense.description),
+    ("Durum", db_models.Expense.status),
+    ("Oluşturulma", db_models.Expense.created_at),
+]
+
+LEAVE_COLUMNS = [
+    ("ID", db_models.Leave.id),
+    ("Çalışan ID", db_models.Leave.employee_id),
+    ("Çalışan", db_models.Employee.full_name),
+    ("İzin Türü", db_models.Leave.leave_type),
+    ("Başlangıç", db_models.Leave.start_date),
+    ("Bitiş", db_models.Leave.end_date),
+    ("Gün", db_models.Leave.days),
+    ("Açıklama", db_models.Leave.reason),
+    ("Durum", db_models.Leave.status),
+    ("Oluşturulma", db_models.Leave.created_at),
+]
+
+
+def expense_export_query(
+    status: Optional[str] = None, date_from: Optional[date] = None, date_to: Optional[date] = None
+) -> Select:
+    Expense = db_models.Expense
+    stmt = (
+        select(*[column for _, column in EXPENSE_COLUMNS])
+        .outerjoin(db_models.Employee, db_models.Employee.id == Expense.employee_id)
+        .order_by(Expense.id)
+    )
+    if status:
+        stmt = stmt.where(Expense.status == status)
+    if date_from:
+        stmt = stmt.where(Expense.date >= date_from)
+    if date_to:
+        stmt = stmt.where(Expense.date <= date_to)
+    return stmt
+
+
+def leave_export_query(
+    status: Optional[str] = None, overlaps_from: Optional[date] = None, overlaps_to: Optional[date] = None
+) -> Select:
+    Leave = db_models.Leave
+    stmt = (
+        select(*[column for _, column in LEAVE_COLUMNS])
+        .outerjoin(db_models.Employee, db_models.Employee.id == Leave.employee_id)
+        .order_by(Leave.id)
+    )
+    if status:
+        stmt = stmt.where(Leave.status == status)
+    if overlaps_to:
+        stmt = stmt.where(Leave.start_date <= overlaps_to)
+    if overlaps_from:
+        stmt = stmt.where(Leave.end_date >= overlaps_from)
+    return stmt
+
+
+def _cell(value):
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d %H:%M")
+    return value
+
+
+def _batches(stmt: Select) -> Iterator[List[Tuple]]:
+    """Result rows in EXPORT_BATCH_SIZE lists, streamed from a server-side cursor."""
+    db = read_session()
+    try:
+        result = db.execute(stmt.execution_options(yield_per=EXPORT_BATCH_SIZE))
+        for partition in result.partitions():
+            yield [tuple(_cell(value) for value in row) for row in partition]
+    finally:
+        db.close()
+
+
+def stream_csv(stmt: Select, headers: List[str]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(headers)
+    yield ("\ufeff" + buffer.getvalue()).encode("utf-8")  # BOM so Excel reads UTF-8
+    for rows in _batches(stmt):
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(rows)
+        yield buffer.getvalue().encode("utf-8")
+
+
+def stream_xlsx(stmt: Select, headers: List[str], title: str) -> Iterator[bytes]:
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(title)
+    sheet.append(headers)
+    for rows in _batches(stmt):
+        for row in rows:
+            sheet.append(row)
+
+    with tempfile.TemporaryFile() as file:
+        workbook.save(file)
+        file.seek(0)
+        while True:
+            block = file.read(_FILE_BLOCK_SIZE)
+            if not block:
+                break
+            yield block
+
+
+def export_response(stmt: Select, columns: list, file_format: str, basename: str) -> StreamingResponse:
+    headers = [header for header, _ in columns]
+    if file_format == "xlsx":
+        body = stream_xlsx(stmt, headers, basename)
+    else:
+        body = stream_csv(stmt, headers)
+    stamp = datetime.utcnow().strftime("%Y%m%d")
+    return StreamingResponse(
+        body,
+        media_type=MEDIA_TYPES[file_format],
+        headers={"Content-Disposition": f'attachment; filename="{basename}-{stamp}.{file_format}"'},
+    )
@@ -0,0 +1,33 @@
+"""
+Sparse fieldsets (?fields=id,full_name,department).
+
+parse_fields checks the requested keys against the route's response model.
+The crud row statements then select only the columns those keys need (plus
+id and the keyset sort column), and the serializers build a plain dict with
+just those keys instead of the full model.
+"""
+
+from typing import Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+
+class InvalidFields(ValueError):
+    """Raised when ?fields= names a key the response model does not have."""
+
+
+def parse_fields(fields: Optional[str], model: Type[BaseModel]) -> Optional[Tuple[str, ...]]:
+    """
+    Requested keys in model field order, always including "id".
+    None (no ?fields=, or an empty one) means the full model.
+    """
+    if not fields:
+        return None
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    if not requested:
+        return None
+    unknown = requested - set(model.model_fields)
+    if unknown:
+        raise InvalidFields(f"Bilinmeyen alan(lar): {', '.join(sorted(unknown))}")
+    requested.add("id")
+    return tuple(name for name in model.model_fields if name in requested)
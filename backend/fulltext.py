@@ -0,0 +1,106 @@
+"""
+Full-text search over leave reasons and expense descriptions.
+
+- SQLite: an FTS5 external-content table per column (leaves_fts,
+  expenses_fts). It indexes the text where it already lives, and AFTER
+  INSERT / UPDATE / DELETE triggers keep it in sync with every write path,
+  bulk UPDATEs and raw SQL included. Ranked by bm25() (lower is better).
+  The unicode61 tokenizer folds case and drops diacritics, so "sirket"
+  finds "Şirket".
+- MariaDB/MySQL: an InnoDB FULLTEXT index, maintained by the engine.
+  Ranked by MATCH ... AGAINST relevance (higher is better). Words shorter
+  than innodb_ft_min_token_size (default 3) are not indexed.
+
+The DDL hangs off the tables' after_create event, so create_all (init_db)
+builds it; existing databases get it from Alembic revision 0008.
+
+User input never reaches the match syntax: the words are extracted and
+each one must match as a prefix ("anka" finds "Ankara").
+"""
+
+import re
+from typing import List, Optional, Tuple
+
+from sqlalchemy import DDL, Float, Select, event, func, literal_column, type_coerce
+from sqlalchemy.dialects import mysql
+from sqlalchemy.sql import column, table
+
+MYSQL_DIALECTS = ("mysql", "mariadb")
+
+_WORD = re.compile(r"\w+")
+
+
+def fts_table(table_name: str) -> str:
+    return f"{table_name}_fts"
+
+
+def sqlite_ddl(table_name: str, column_name: str) -> List[str]:
+    fts = fts_table(table_name)
+    delete_old = f"INSERT INTO {fts}({fts}, rowid, {column_name}) VALUES ('delete', old.id, old.{column_name});"
+    insert_new = f"INSERT INTO {fts}(rowid, {column_name}) VALUES (new.id, new.{column_name});"
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+        f"{column_name}, content='{table_name}', content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table_name} BEGIN {insert_new} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table_name} BEGIN {delete_old} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {column_name} ON {table_name} "
+        f"BEGIN {delete_old} {insert_new} END",
+    ]
+
+
+def mysql_ddl(table_name: str, column_name: str) -> List[str]:
+    return [f"ALTER TABLE {table_name} ADD FULLTEXT INDEX ft_{table_name}_{column_name} ({column_name})"]
+
+
+def attach(sa_table, column_name: str):
+    """Create the full-text index together with sa_table (create_all) and drop the FTS table with it."""
+    for statement in sqlite_ddl(sa_table.name, column_name):
+        event.listen(sa_table, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+    event.listen(
+        sa_table, "before_drop",
+        DDL(f"DROP TABLE IF EXISTS {fts_table(sa_table.name)}").execute_if(dialect="sqlite"),
+    )
+    for statement in mysql_ddl(sa_table.name, column_name):
+        event.listen(sa_table, "after_create", DDL(statement).execute_if(dialect=MYSQL_DIALECTS))
+
+
+def search_words(q: str) -> List[str]:
+    return _WORD.findall(q or "")
+
+
+def fts5_query(words: List[str]) -> str:
+    """FTS5 MATCH string: every word, as a quoted prefix (implicit AND)."""
+    return " ".join(f'"{word}"*' for word in words)
+
+
+def boolean_query(words: List[str]) -> str:
+    """MySQL BOOLEAN MODE string: every word required, as a prefix."""
+    return " ".join(f"+{word}*" for word in words)
+
+
+def ranked(stmt: Select, model, column_name: str, q: str, dialect_name: str) -> Optional[Tuple[Select, bool]]:
+    """
+    Restrict stmt (a select over model) to rows whose column matches q and
+    add the relevance as a "search_rank" column.
+    Returns (stmt, descending) - the direction that puts the best match
+    first - or None when q has no searchable words.
+    """
+    words = search_words(q)
+    if not words:
+        return None
+
+    if dialect_name == "sqlite":
+        fts = fts_table(model.__tablename__)
+        fts_rows = table(fts, column("rowid"))
+        score = func.bm25(literal_column(fts), type_=Float)
+        stmt = (
+            stmt.join(fts_rows, fts_rows.c.rowid == model.id)
+            .where(literal_column(fts).op("MATCH")(fts5_query(words)))
+        )
+        return stmt.add_columns(score.label("search_rank")), False
+
+    if dialect_name in MYSQL_DIALECTS:
+        matched = mysql.match(getattr(model, column_name), against=boolean_query(words)).in_boolean_mode()
+        return stmt.where(matched).add_columns(type_coerce(matched, Float).label("search_rank")), True
+
+    raise NotImplementedError(f"Full-text search is not available on {dialect_name}")
@@ -0,0 +1,66 @@
+"""
+Per-request SQL instrumentation.
+Replaces engine echo: every request records its query count, total DB time
+and slowest statement, returned as a Server-Timing header and written as a
+sampled structured log line (always logged when the slow-query threshold is
+crossed).
+
+Settings:
+    SQL_SLOW_QUERY_MS     - slowest statement above this is always logged (default 200)
+    SQL_LOG_SAMPLE_RATE   - fraction of other requests logged (default 0.01)
+"""
+
+import json
+import logging
+import os
+import random
+from time import perf_counter
+
+from fastapi import Request
+
+from query_counter import count_queries
+
+SQL_SLOW_QUERY_MS = float(os.getenv("SQL_SLOW_QUERY_MS", "200"))
+SQL_LOG_SAMPLE_RATE = float(os.getenv("SQL_LOG_SAMPLE_RATE", "0.01"))
+
+logger = logging.getLogger("fasthr.sql")
+
+
+def _server_timing(counter, app_ms: float) -> str:
+    parts = [
+        f'db;dur={counter.total_time * 1000:.1f};desc="{counter.count} queries"',
+        f"app;dur={app_ms:.1f}",
+    ]
+    slowest = counter.slowest
+    if slowest is not None:
+        parts.append(f"db-slowest;dur={slowest[0] * 1000:.1f}")
+    return ", ".join(parts)
+
+
+async def sql_timing_middleware(request: Request, call_next):
+    """HTTP middleware: collect SQL stats for the request and report them."""
+    start = perf_counter()
+    with count_queries() as counter:
+        response = await call_next(request)
+    app_ms = (perf_counter() - start) * 1000
+
+    response.headers.append("Server-Timing", _server_timing(counter, app_ms))
+
+    slowest = counter.slowest
+    slow = slowest is not None and slowest[0] * 1000 >= SQL_SLOW_QUERY_MS
+    if slow or (counter.count and random.random() < SQL_LOG_SAMPLE_RATE):
+        record = {
+            "event": "slow_query" if slow else "sql_sample",
+            "method": request.method,
+            "path": request.url.path,
+            "status": response.status_code,
+            "queries": counter.count,
+            "db_ms": round(counter.total_time * 1000, 2),
+            "app_ms": round(app_ms, 2),
+        }
+        if slowest is not None:
+            record["slowest_ms"] = round(slowest[0] * 1000, 2)
+            record["slowest_sql"] = " ".join(slowest[1].split())[:500]
+        logger.log(logging.WARNING if slow else logging.INFO, json.dumps(record, ensure_ascii=False))
+
+    return response
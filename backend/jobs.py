@@ -0,0 +1,133 @@
+"""
+Background jobs started from the app lifespan.
+Each job runs its blocking DB work in the threadpool with its own session.
+
+The database maintenance jobs (dashboard stats reconciliation, expense
+month rollups) need one runner, not one per worker: JOBS_ENABLED=false
+turns them off in a process, and every run takes a database-wide lock
+(MariaDB GET_LOCK, a file lock next to the SQLite database) so workers
+that start together skip instead of overlapping. The per-process jobs
+(typeahead rebuild, replica health) run everywhere.
+"""
+
+import asyncio
+import logging
+import os
+from contextlib import contextmanager
+from typing import List
+
+try:
+    import fcntl
+except ImportError:  # Windows: no file locks, SQLite deployments run one worker there
+    fcntl = None
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import text
+
+from database import SessionLocal, READ_DATABASE_URLS, check_read_replicas, read_session, engine
+import crud
+
+JOBS_ENABLED = os.getenv("JOBS_ENABLED", "true").lower() in ("1", "true", "yes")
+
+STATS_RECONCILE_SECONDS = int(os.getenv("STATS_RECONCILE_SECONDS", "3600"))
+EXPENSE_ROLLUP_SECONDS = int(os.getenv("EXPENSE_ROLLUP_SECONDS", "86400"))
+SUGGEST_REBUILD_SECONDS = int(os.getenv("SUGGEST_REBUILD_SECONDS", "600"))
+READ_HEALTH_SECONDS = int(os.getenv("READ_HEALTH_SECONDS", "15"))
+
+logger = logging.getLogger("fasthr.jobs")
+
+
+@contextmanager
+def single_runner(name: str):
+    """Yield True if this process got the job's database-wide lock, False if another one holds it."""
+    if engine.dialect.name == "sqlite":
+        path = engine.url.database
+        if fcntl is None or not path or path == ":memory:":
+            yield True
+            return
+        with open(f"{path}.{name}.lock", "w") as lock_file:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+        return
+
+    with engine.connect() as conn:
+        lock_name = f"fasthr.{name}"
+        acquired = conn.execute(text("SELECT GET_LOCK(:name, 0)"), {"name": lock_name}).scalar() == 1
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                conn.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": lock_name})
+
+
+def reconcile_stats():
+    """Recompute the dashboard counters from the source tables."""
+    with single_runner("reconcile_stats") as acquired:
+        if acquired:
+            _reconcile_stats()
+
+
+def _reconcile_stats():
+    db = SessionLocal()
+    try:
+        drift = crud.reconcile_dashboard_stats(db)
+        if drift:
+            logger.warning("Dashboard stats drift corrected: %s", drift)
+    finally:
+        db.close()
+
+
+def close_expense_months():
+    """Roll up expenses of finished months that aren't rolled up yet."""
+    with single_runner("close_expense_months") as acquired:
+        if acquired:
+            _close_expense_months()
+
+
+def _close_expense_months():
+    db = SessionLocal()
+    try:
+        months = crud.close_expense_months(db)
+        if months:
+            logger.info("Expense months closed: %s", ", ".join(months))
+    finally:
+        db.close()
+
+
+def rebuild_suggest_index():
+    """Reload the typeahead index (picks up writes made by other workers)."""
+    db = read_session()
+    try:
+        crud.rebuild_suggest_index(db)
+    finally:
+        db.close()
+
+
+async def _every(seconds: int, job, name: str):
+    while True:
+        try:
+            await run_in_threadpool(job)
+        except Exception:
+            logger.exception("Background job failed: %s", name)
+        await asyncio.sleep(seconds)
+
+
+def start_background_jobs() -> List[asyncio.Task]:
+    """Start periodic jobs; the caller cancels the returned tasks on shutdown."""
+    tasks = []
+    if JOBS_ENABLED and STATS_RECONCILE_SECONDS > 0:
+        tasks.append(asyncio.create_task(_every(STATS_RECONCILE_SECONDS, reconcile_stats, "reconcile_stats")))
+    if JOBS_ENABLED and EXPENSE_ROLLUP_SECONDS > 0:
+        tasks.append(asyncio.create_task(_every(EXPENSE_ROLLUP_SECONDS, close_expense_months, "close_expense_months")))
+    if SUGGEST_REBUILD_SECONDS > 0:
+        tasks.append(asyncio.create_task(_every(SUGGEST_REBUILD_SECONDS, rebuild_suggest_index, "rebuild_suggest_index")))
+    if READ_DATABASE_URLS and READ_HEALTH_SECONDS > 0:
+        tasks.append(asyncio.create_task(_every(READ_HEALTH_SECONDS, check_read_replicas, "check_read_replicas")))
+    return tasks
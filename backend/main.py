@@ -1,37 +1,89 @@
-from fastapi import FastAPI, HTTPException, Depends, status
+from fastapi import FastAPI, HTTPException, Depends, File, Query, Request, Response, UploadFile, status
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.orm import Session
+from contextlib import asynccontextmanager
 from typing import List, Optional
-from datetime import datetime, timedelta
+from datetime import date as date_type, datetime, timedelta
 
 # Database imports
-from database import get_db, engine, init_db
+from database import (
+    get_db, get_read_db, init_db, verify_schema,
+    DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_RECYCLE,
+    DATABASE_ASYNC, DB_AUTO_CREATE, DB_VERIFY_SCHEMA,
+    READ_DATABASE_URLS, read_your_writes_middleware
+)
 import db_models
 import crud
+from employee_import import import_employees, ImportFormatError
+from etags import conditional_get
+from exports import export_response, expense_export_query, leave_export_query, EXPENSE_COLUMNS, LEAVE_COLUMNS
+from instrumentation import sql_timing_middleware
+import pool_metrics
+from compression import CompressionMiddleware
+from responses import model_response
+from jobs import start_background_jobs
+from pagination import InvalidCursor, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 
 # Auth imports
+from fastapi.security import HTTPAuthorizationCredentials
 from auth import (
-    Token, UserLogin, UserInToken,
-    authenticate_user, create_access_token,
-    get_current_user, ACCESS_TOKEN_EXPIRE_MINUTES
+    Token, UserLogin, UserInToken, PasswordSet,
+    authenticate_user_async, PasswordPoolSaturated, password_pool, create_access_token,
+    decode_password_set_token, get_password_hash, password_fingerprint,
+    get_current_user, revoke_token, security, ACCESS_TOKEN_EXPIRE_MINUTES
 )
 
 # Models
+from serializers import (
+    to_employee_card,
+    to_leave_request, to_expense_request,
+    employee_card_from_row, employee_detail_from_row, employee_suggestion_from_row,
+    leave_request_from_row, expense_request_from_row, page_of
+)
+from suggest import SUGGEST_LIMIT
+from fieldsets import InvalidFields, parse_fields
 from models import (
-    EmployeeCard, EmployeeDetail,
-    LeaveRequest, LeaveBalance,
-    ExpenseRequest, ExpenseCreateRequest, LeaveCreateRequest
+    EmployeeCard, EmployeeDetail, EmployeePage, EmployeeSuggestion,
+    LeaveRequest, LeaveBalance, LeavePage,
+    EmployeeLeaveBalance, LeaveBalanceBatchRequest,
+    ExpenseRequest, ExpensePage, ExpenseCreateRequest, LeaveCreateRequest,
+    ExpenseSummary, ExpenseRollupRow,
+    BulkDecisionRequest, BulkDecisionResponse, EmployeeImportReport
 )
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Startup/shutdown. Importing this module has no side effects; schema
+    creation or verification happens here (or via python manage.py).
+    """
+    if DB_AUTO_CREATE:
+        init_db()
+    elif DB_VERIFY_SCHEMA and not verify_schema():
+        raise RuntimeError("Veritabanı şeması güncel değil: `alembic upgrade head` çalıştırın")
+    tasks = start_background_jobs()
+    yield
+    for task in tasks:
+        task.cancel()
+    password_pool.shutdown()
+
+
 app = FastAPI(
     title="FastHR API",
     description="Modern İnsan Kaynakları Yönetim Sistemi API",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
-# Initialize database
-db_models.Base.metadata.create_all(bind=engine)
-init_db()
+# Per-request SQL metrics (Server-Timing header + sampled logs)
+app.middleware("http")(sql_timing_middleware)
+
+# Read replicas: pin a client's reads to the primary right after its writes
+if READ_DATABASE_URLS:
+    app.middleware("http")(read_your_writes_middleware)
+
+# gzip/brotli for JSON/text bodies above COMPRESSION_MIN_SIZE
+app.add_middleware(CompressionMiddleware)
 
 # CORS ayarları - Frontend'den gelen istekleri kabul et
 app.add_middleware(
@@ -42,6 +94,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Async read path - registered first so it takes precedence over the sync routes below
+if DATABASE_ASYNC:
+    from async_routes import router as async_router
+    app.include_router(async_router)
+
 @app.get("/")
 def read_root():
     return {
@@ -56,11 +113,20 @@ def read_root():
 # ============================================
 
 @app.post("/api/auth/login", response_model=Token)
-def login(user_login: UserLogin):
+async def login(user_login: UserLogin):
     """
     Login endpoint - authenticate user and return JWT token
+    Password verification runs on the bounded password pool; when it is
+    saturated we answer 503 right away instead of queueing.
     """
-    user = authenticate_user(user_login.email, user_login.password)
+    try:
+        user = await authenticate_user_async(user_login.email, user_login.password)
+    except PasswordPoolSaturated:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Sistem yoğun, lütfen tekrar deneyin",
+            headers={"Retry-After": "1"},
+        )
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -77,6 +143,32 @@ def login(user_login: UserLogin):
     return {"access_token": access_token, "token_type": "bearer"}
 
 
+@app.post("/api/auth/set-password")
+def set_password(password_set: PasswordSet, db: Session = Depends(get_db)):
+    """
+    Şifre belirleme - toplu içe aktarmada verilen token ile kullanıcı kendi
+    şifresini belirler. Token tek kullanımlıktır (şifre değişince geçersizleşir).
+    Hash, veritabanı işlemi açılmadan şifre havuzunda hesaplanır.
+    """
+    email, fingerprint = decode_password_set_token(password_set.token)
+    try:
+        hashed_password = password_pool.submit(get_password_hash, password_set.new_password).result()
+    except PasswordPoolSaturated:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Sistem yoğun, lütfen tekrar deneyin",
+            headers={"Retry-After": "1"},
+        )
+    user = crud.get_user_by_email(db, email)
+    if (
+        user is None
+        or password_fingerprint(user.hashed_password) != fingerprint
+        or not crud.set_user_password(db, user.id, user.hashed_password, hashed_password)
+    ):
+        raise HTTPException(status_code=400, detail="Şifre belirleme bağlantısı geçersiz veya süresi dolmuş")
+    return {"message": "Şifre belirlendi"}
+
+
 @app.get("/api/auth/me", response_model=UserInToken)
 def get_me(current_user: UserInToken = Depends(get_current_user)):
     """
@@ -85,135 +177,264 @@ def get_me(current_user: UserInToken = Depends(get_current_user)):
     return current_user
 
 
+@app.post("/api/auth/logout")
+def logout(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    current_user: UserInToken = Depends(get_current_user)
+):
+    """
+    Logout - revoke the current access token
+    """
+    revoke_token(credentials.credentials)
+    return {"message": "Oturum kapatıldı"}
+
+
 # ============================================
 # EMPLOYEE ENDPOINTS (Protected)
 # ============================================
 
-@app.get("/api/employees", response_model=List[EmployeeCard])
+@app.get("/api/employees", response_model=EmployeePage)
 def get_employees(
+    request: Request,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    fields: Optional[str] = None,
     current_user: UserInToken = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     Tüm çalışanların kart görünümü için basitleştirilmiş bilgilerini döndürür.
     Bu endpoint frontend'teki grid kartlarını doldurmak için kullanılır.
+    If-None-Match eşleşirse 304 döner (ETag: COUNT + MAX(updated_at)).
+    
+    Query Params:
+    - cursor: Önceki sayfanın next_cursor değeri
+    - limit: Sayfa başına kayıt sayısı
+    - fields: Sadece istenen alanlar, virgülle ayrılmış (ör. id,full_name; id her zaman döner)
     """
-    employees = crud.get_employees(db)
+    not_modified = conditional_get(request, response, *crud.get_collection_version(db, db_models.Employee))
+    if not_modified:
+        return not_modified
+
+    try:
+        selected = parse_fields(fields, EmployeeCard)
+        employees, next_cursor = crud.get_employee_cards(db, cursor=cursor, limit=limit, fields=selected)
+    except (InvalidCursor, InvalidFields) as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
-    return [
-        EmployeeCard(
-            id=emp.id,
-            full_name=emp.full_name,
-            title=emp.title,
-            avatar_url=emp.avatar_url or "".join([n[0] for n in emp.full_name.split()[:2]]),
-            is_on_leave=emp.is_on_leave,
-            department=emp.department.name if emp.department else "N/A"
-        )
-        for emp in employees
-    ]
+    items = [employee_card_from_row(row, selected) for row in employees]
+    return model_response(page_of(EmployeePage, items, next_cursor, selected), response)
+
+
+@app.post("/api/employees:import", response_model=EmployeeImportReport)
+def import_employees_file(
+    file: UploadFile = File(...),
+    current_user: UserInToken = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    CSV/XLSX dosyasından toplu çalışan içe aktarır (parça parça, toplu INSERT).
+    Hatalı satırlar atlanır ve satır numarasıyla raporlanır. Kullanıcılar şifresiz
+    oluşturulur; her biri için şifre belirleme token'ı döner.
+    Sadece adminler kullanabilir
+    """
+    if current_user.role != "admin":
+        raise HTTPException(status_code=403, detail="Bu işlem için yetkiniz yok")
+
+    try:
+        return import_employees(db, file.file, file.filename or "")
+    except ImportFormatError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="Dosya UTF-8 kodlamalı olmalı")
+
+
+@app.get("/api/employees/suggest", response_model=List[EmployeeSuggestion])
+def suggest_employees(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(SUGGEST_LIMIT, ge=1, le=50),
+    current_user: UserInToken = Depends(get_current_user),
+    db: Session = Depends(get_read_db)
+):
+    """
+    İsim, ünvan ve departmana göre çalışan önerileri (typeahead).
+    Bellekteki önek indeksinden cevaplanır; Türkçe büyük/küçük harf kurallarına uyar
+    (İ/i, I/ı) ve "sahin" yazıldığında "Şahin" de bulunur.
+    """
+    rows = crud.suggest_employees(db, q, limit)
+    return model_response([employee_suggestion_from_row(row) for row in rows])
+
+
+@app.get("/api/employees/on-leave", response_model=List[EmployeeCard])
+def get_employees_on_leave(
+    current_user: UserInToken = Depends(get_current_user),
+    db: Session = Depends(get_read_db)
+):
+    """
+    Şu anda izinli olan çalışanları döndürür.
+    Dashboard'daki "Şu an Kimler Yok?" bölümü için kullanılır.
+    """
+    employees = crud.get_employees_on_leave(db)
+    
+    return model_response([to_employee_card(emp) for emp in employees])
 
 
 @app.get("/api/employees/{employee_id}", response_model=EmployeeDetail)
 def get_employee_detail(
     employee_id: int,
+    request: Request,
+    response: Response,
+    fields: Optional[str] = None,
     current_user: UserInToken = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     Belirli bir çalışanın detaylı bilgilerini döndürür.
     Bu endpoint drawer/modal'da gösterilecek detaylar içindir.
+    If-None-Match eşleşirse 304 döner (ETag: updated_at).
+    fields: Sadece istenen alanlar, virgülle ayrılmış (id her zaman döner).
     """
-    emp = crud.get_employee(db, employee_id)
-    if not emp:
+    version = crud.get_row_version(db, db_models.Employee, employee_id)
+    if version is None:
+        raise HTTPException(status_code=404, detail="Çalışan bulunamadı")
+    not_modified = conditional_get(request, response, *version)
+    if not_modified:
+        return not_modified
+
+    try:
+        selected = parse_fields(fields, EmployeeDetail)
+    except InvalidFields as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    row = crud.get_employee_row(db, employee_id, selected)
+    if row is None:
         raise HTTPException(status_code=404, detail="Çalışan bulunamadı")
     
-    return EmployeeDetail(
-        id=emp.id,
-        full_name=emp.full_name,
-        title=emp.title,
-        avatar_url=emp.avatar_url or "".join([n[0] for n in emp.full_name.split()[:2]]),
-        is_on_leave=emp.is_on_leave,
-        department=emp.department.name if emp.department else "N/A",
-        email=emp.email,
-        phone=emp.phone or "N/A",
-        start_date=emp.start_date.strftime("%Y-%m-%d") if emp.start_date else "N/A",
-        address=emp.address or "N/A",
-        birth_date=emp.birth_date.strftime("%Y-%m-%d") if emp.birth_date else "N/A",
-        emergency_contact=emp.emergency_contact or "N/A",
-        salary=emp.salary or 0.0
-    )
+    return model_response(employee_detail_from_row(row, selected), response)
 
 
 @app.get("/api/dashboard/stats")
-def get_dashboard_stats(current_user: UserInToken = Depends(get_current_user)):
+def get_dashboard_stats(
+    current_user: UserInToken = Depends(get_current_user),
+    db: Session = Depends(get_read_db)
+):
     """
     Dashboard için özet istatistikleri döndürür.
+    Değerler dashboard_stats tablosundan okunur (crud tarafından güncel tutulur).
     """
+    stats = crud.get_dashboard_stats(db)
     return {
-        "total_employees": 42,
-        "on_leave_today": 3,
-        "pending_requests": 5,
-        "birthdays_this_month": 2
+        "total_employees": stats.get("total_employees", 0),
+        "on_leave_today": stats.get("on_leave", 0),
+        "pending_requests": stats.get("pending_requests", 0),
+        "birthdays_this_month": stats.get(f"birthdays_month_{datetime.utcnow().month:02d}", 0)
     }
 
 
-@app.get("/api/employees/on-leave", response_model=List[EmployeeCard])
-def get_employees_on_leave(
-    current_user: UserInToken = Depends(get_current_user),
-    db: Session = Depends(get_db)
-):
+# ============================================
+# ADMIN
+# ============================================
+
+@app.get("/api/admin/db-pool")
+def get_db_pool_metrics(current_user: UserInToken = Depends(get_current_user)):
     """
-    Şu anda izinli olan çalışanları döndürür.
-    Dashboard'daki "Şu an Kimler Yok?" bölümü için kullanılır.
+    Veritabanı bağlantı havuzu metrikleri (bu worker process için):
+    kullanımdaki bağlantılar, taşma (overflow), bağlantı bekleme süresi histogramı ve zaman aşımları.
+    Sadece adminler kullanabilir
     """
-    employees = crud.get_employees_on_leave(db)
-    
-    return [
-        EmployeeCard(
-            id=emp.id,
-            full_name=emp.full_name,
-            title=emp.title,
-            avatar_url=emp.avatar_url or "".join([n[0] for n in emp.full_name.split()[:2]]),
-            is_on_leave=emp.is_on_leave,
-            department=emp.department.name if emp.department else "N/A"
-        )
-        for emp in employees
-    ]
+    if current_user.role != "admin":
+        raise HTTPException(status_code=403, detail="Bu işlem için yetkiniz yok")
+
+    return {
+        "settings": {
+            "pool_size": DB_POOL_SIZE,
+            "max_overflow": DB_MAX_OVERFLOW,
+            "pool_timeout": DB_POOL_TIMEOUT,
+            "pool_recycle": DB_POOL_RECYCLE,
+        },
+        "pools": pool_metrics.snapshot(),
+    }
 
 
 # ============================================
 # LEAVE MANAGEMENT (Protected)
 # ============================================
 
-@app.get("/api/leaves", response_model=List[LeaveRequest])
+@app.get("/api/leaves", response_model=LeavePage)
 def get_leaves(
+    request: Request,
+    response: Response,
     status: Optional[str] = None,
+    overlaps_from: Optional[date_type] = None,
+    overlaps_to: Optional[date_type] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    fields: Optional[str] = None,
     current_user: UserInToken = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
-    İzin taleplerini listeler.
+    İzin taleplerini listeler (en yeni önce).
     
     Query Params:
     - status: Duruma göre filtreleme (Bekliyor, Onaylandı, Reddedildi)
+    - overlaps_from / overlaps_to: Bu tarih aralığıyla çakışan izinler (YYYY-MM-DD)
+    - cursor: Önceki sayfanın next_cursor değeri
+    - limit: Sayfa başına kayıt sayısı
+    - fields: Sadece istenen alanlar, virgülle ayrılmış (ör. id,full_name; id her zaman döner)
     """
-    db_leaves = crud.get_leave_requests(db, status_filter=status)
+    version = crud.get_collection_version(db, db_models.Leave, db_models.Employee)
+    not_modified = conditional_get(request, response, *version)
+    if not_modified:
+        return not_modified
+
+    try:
+        selected = parse_fields(fields, LeaveRequest)
+        db_leaves, next_cursor = crud.get_leave_rows(
+            db, status=status, cursor=cursor, limit=limit,
+            overlaps_from=overlaps_from, overlaps_to=overlaps_to, fields=selected
+        )
+    except (InvalidCursor, InvalidFields) as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
-    return [
-        LeaveRequest(
-            id=leave.id,
-            employee_id=leave.employee_id,
-            employee_name=leave.employee.full_name if leave.employee else "N/A",
-            leave_type=leave.leave_type,
-            start_date=leave.start_date.strftime("%Y-%m-%d"),
-            end_date=leave.end_date.strftime("%Y-%m-%d"),
-            days=leave.days,
-            reason=leave.reason or "",
-            status=leave.status,
-            created_at=leave.created_at.strftime("%Y-%m-%d")
+    items = [leave_request_from_row(row, selected) for row in db_leaves]
+    return model_response(page_of(LeavePage, items, next_cursor, selected), response)
+
+
+@app.get("/api/leaves/search", response_model=LeavePage)
+def search_leaves(
+    request: Request,
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200),
+    status: Optional[str] = None,
+    overlaps_from: Optional[date_type] = None,
+    overlaps_to: Optional[date_type] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    fields: Optional[str] = None,
+    current_user: UserInToken = Depends(get_current_user),
+    db: Session = Depends(get_read_db)
+):
+    """
+    İzin sebeplerinde tam metin arama (en alakalı önce).
+    Her kelime önek olarak aranır ("amel" -> "ameliyat"); filtreler ve sayfalama /api/leaves ile aynıdır.
+    """
+    version = crud.get_collection_version(db, db_models.Leave, db_models.Employee)
+    not_modified = conditional_get(request, response, *version)
+    if not_modified:
+        return not_modified
+
+    try:
+        selected = parse_fields(fields, LeaveRequest)
+        db_leaves, next_cursor = crud.search_leaves(
+            db, q, status=status, cursor=cursor, limit=limit,
+            overlaps_from=overlaps_from, overlaps_to=overlaps_to, fields=selected
         )
-        for leave in db_leaves
-    ]
+    except (InvalidCursor, InvalidFields) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    items = [leave_request_from_row(row, selected) for row in db_leaves]
+    return model_response(page_of(LeavePage, items, next_cursor, selected), response)
 
 
 @app.post("/api/leaves", response_model=LeaveRequest, status_code=201)
@@ -225,120 +446,198 @@ def create_leave(
     """
     Yeni izin talebi oluşturur.
     """
-    # Tarih validasyonu
-    try:
-        start = datetime.strptime(leave_data.start_date, "%Y-%m-%d").date()
-        end = datetime.strptime(leave_data.end_date, "%Y-%m-%d").date()
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Geçersiz tarih formatı. YYYY-MM-DD formatında olmalı.")
-    
-    if start > end:
+    # Tarih validasyonu (format Pydantic tarafından doğrulanır)
+    if leave_data.start_date > leave_data.end_date:
         raise HTTPException(status_code=400, detail="Bitiş tarihi başlangıç tarihinden önce olamaz.")
     
-    # Gün sayısını hesapla
-    days = (end - start).days + 1
-    
     # Create in database (assuming employee_id = 1 for now)
-    db_leave = crud.create_leave_request(
-        db,
-        employee_id=1,  # TODO: Get from current_user
-        leave_data={
-            "leave_type": leave_data.leave_type,
-            "start_date": start,
-            "end_date": end,
-            "days": days,
-            "reason": leave_data.reason,
-            "status": "Bekliyor"
-        }
-    )
-    
-    return LeaveRequest(
-        id=db_leave.id,
-        employee_id=db_leave.employee_id,
-        employee_name=db_leave.employee.full_name if db_leave.employee else current_user.name,
-        leave_type=db_leave.leave_type,
-        start_date=db_leave.start_date.strftime("%Y-%m-%d"),
-        end_date=db_leave.end_date.strftime("%Y-%m-%d"),
-        days=db_leave.days,
-        reason=db_leave.reason or "",
-        status=db_leave.status,
-        created_at=db_leave.created_at.strftime("%Y-%m-%d")
-    )
+    # Çakışma ve bakiye kontrolleri INSERT ile aynı sorguda yapılır
+    try:
+        db_leave = crud.create_leave(
+            db,
+            leave_data,
+            employee_id=1  # TODO: Get from current_user
+        )
+    except LookupError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except crud.LeaveConflict as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except crud.InsufficientLeaveBalance as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return to_leave_request(db_leave, employee_name=current_user.name)
+
+
+@app.get("/api/leaves/export")
+def export_leaves(
+    status: Optional[str] = None,
+    overlaps_from: Optional[date_type] = None,
+    overlaps_to: Optional[date_type] = None,
+    format: str = Query("csv", pattern="^(csv|xlsx)$"),
+    current_user: UserInToken = Depends(get_current_user)
+):
+    """
+    İzin taleplerini CSV veya XLSX olarak dışa aktarır (akış halinde, sabit bellek).
+    Sadece yöneticiler kullanabilir
+    """
+    if current_user.role not in ["admin", "manager"]:
+        raise HTTPException(status_code=403, detail="Bu işlem için yetkiniz yok")
+
+    stmt = leave_export_query(status=status, overlaps_from=overlaps_from, overlaps_to=overlaps_to)
+    return export_response(stmt, LEAVE_COLUMNS, format, "izinler")
 
 
 @app.get("/api/leaves/{leave_id}", response_model=LeaveRequest)
 def get_leave_detail(
     leave_id: int,
-    current_user: UserInToken = Depends(get_current_user)
+    request: Request,
+    response: Response,
+    fields: Optional[str] = None,
+    current_user: UserInToken = Depends(get_current_user),
+    db: Session = Depends(get_read_db)
 ):
     """
     Belirli bir izin talebinin detaylarını döndürür.
+    If-None-Match eşleşirse 304 döner (ETag: updated_at).
+    fields: Sadece istenen alanlar, virgülle ayrılmış (id her zaman döner).
     """
-    # Mock veri
-    if leave_id == 1:
-        return LeaveRequest(
-            id=1,
-            employee_id=1,
-            employee_name="Ahmet Yılmaz",
-            leave_type="Yıllık İzin",
-            start_date="2025-12-20",
-            end_date="2025-12-27",
-            days=5,
-            reason="Yılbaşı tatili",
-            status="Bekliyor",
-            created_at="2025-11-20"
-        )
+    version = crud.get_row_version(db, db_models.Leave, leave_id)
+    if version is None:
+        raise HTTPException(status_code=404, detail="İzin talebi bulunamadı")
+    not_modified = conditional_get(request, response, *version)
+    if not_modified:
+        return not_modified
+
+    try:
+        selected = parse_fields(fields, LeaveRequest)
+    except InvalidFields as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    row = crud.get_leave_row(db, leave_id, selected)
+    if row is None:
+        raise HTTPException(status_code=404, detail="İzin talebi bulunamadı")
     
-    raise HTTPException(status_code=404, detail="İzin talebi bulunamadı")
+    return model_response(leave_request_from_row(row, selected), response)
+
+
+def _approver_id(db: Session, current_user: UserInToken) -> Optional[int]:
+    """users.id of the approving manager (None for mock users without a DB row)."""
+    user = crud.get_user_by_email(db, current_user.email)
+    return user.id if user else None
 
 
 @app.put("/api/leaves/{leave_id}/approve")
 def approve_leave(
     leave_id: int,
-    current_user: UserInToken = Depends(get_current_user)
+    current_user: UserInToken = Depends(get_current_user),
+    db: Session = Depends(get_db)
 ):
     """
-    İzin talebini onaylar.
+    İzin talebini onaylar ve çalışanın izin bakiyesinden düşer.
     Sadece yöneticiler kullanabilir
     """
     if current_user.role not in ["admin", "manager"]:
         raise HTTPException(status_code=403, detail="Bu işlem için yetkiniz yok")
     
+    try:
+        db_leave = crud.approve_leave(db, leave_id, approved_by=_approver_id(db, current_user))
+    except LookupError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except crud.LeaveConflict as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except crud.InsufficientLeaveBalance as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not db_leave:
+        raise HTTPException(status_code=404, detail="İzin talebi bulunamadı")
+    
     return {
         "message": "İzin talebi onaylandı",
         "leave_id": leave_id,
-        "status": "Onaylandı"
+        "status": db_leave.status
     }
 
 
 @app.put("/api/leaves/{leave_id}/reject")
 def reject_leave(
     leave_id: int,
-    current_user: UserInToken = Depends(get_current_user)
+    reason: Optional[str] = None,
+    current_user: UserInToken = Depends(get_current_user),
+    db: Session = Depends(get_db)
 ):
     """
-    İzin talebini reddeder.
+    İzin talebini reddeder (onaylanmışsa bakiye iade edilir).
     Sadece yöneticiler kullanabilir
     """
     if current_user.role not in ["admin", "manager"]:
         raise HTTPException(status_code=403, detail="Bu işlem için yetkiniz yok")
     
+    db_leave = crud.reject_leave(db, leave_id, approved_by=_approver_id(db, current_user), reason=reason)
+    if not db_leave:
+        raise HTTPException(status_code=404, detail="İzin talebi bulunamadı")
+    
     return {
         "message": "İzin talebi reddedildi",
         "leave_id": leave_id,
-        "status": "Reddedildi"
+        "status": db_leave.status
     }
 
 
+def _bulk_response(outcomes: List[dict]) -> BulkDecisionResponse:
+    return BulkDecisionResponse(
+        updated=sum(1 for item in outcomes if item["outcome"] == "updated"),
+        items=outcomes
+    )
+
+
+@app.post("/api/leaves:bulk-approve", response_model=BulkDecisionResponse)
+def bulk_approve_leaves(
+    request: BulkDecisionRequest,
+    current_user: UserInToken = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Bekleyen izin taleplerini tek sorguda toplu onaylar; bakiyeler toplu güncellenir.
+    Her ID için sonuç döner (updated, not_pending, not_found).
+    Sadece yöneticiler kullanabilir
+    """
+    if current_user.role not in ["admin", "manager"]:
+        raise HTTPException(status_code=403, detail="Bu işlem için yetkiniz yok")
+
+    outcomes = crud.bulk_approve_leaves(db, request.ids, approved_by=_approver_id(db, current_user))
+    return _bulk_response(outcomes)
+
+
+@app.post("/api/leaves:bulk-reject", response_model=BulkDecisionResponse)
+def bulk_reject_leaves(
+    request: BulkDecisionRequest,
+    current_user: UserInToken = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Bekleyen izin taleplerini tek sorguda toplu reddeder.
+    Sadece yöneticiler kullanabilir
+    """
+    if current_user.role not in ["admin", "manager"]:
+        raise HTTPException(status_code=403, detail="Bu işlem için yetkiniz yok")
+
+    outcomes = crud.bulk_reject_leaves(
+        db, request.ids, approved_by=_approver_id(db, current_user), reason=request.reason
+    )
+    return _bulk_response(outcomes)
+
+
 @app.delete("/api/leaves/{leave_id}")
 def delete_leave(
     leave_id: int,
-    current_user: UserInToken = Depends(get_current_user)
+    current_user: UserInToken = Depends(get_current_user),
+    db: Session = Depends(get_db)
 ):
     """
-    İzin talebini siler.
+    İzin talebini siler (onaylanmışsa bakiye iade edilir).
     Sadece talep sahibi veya yönetici silebilir
     """
+    if not crud.delete_leave(db, leave_id):
+        raise HTTPException(status_code=404, detail="İzin talebi bulunamadı")
+    
     return {
         "message": "İzin talebi silindi",
         "leave_id": leave_id
@@ -348,52 +647,125 @@ def delete_leave(
 @app.get("/api/leaves/balance/{employee_id}", response_model=LeaveBalance)
 def get_leave_balance(
     employee_id: int,
-    current_user: UserInToken = Depends(get_current_user)
+    current_user: UserInToken = Depends(get_current_user),
+    db: Session = Depends(get_read_db)
 ):
     """
     Çalışanın izin bakiyesini döndürür.
     """
-    # Mock veri
+    balance = crud.get_leave_balance(db, employee_id)
+    if not balance:
+        raise HTTPException(status_code=404, detail="Çalışan bulunamadı")
+    
     return LeaveBalance(
-        annual=14,
-        annual_used=8,
-        sick=10,
-        sick_used=2
+        annual=balance.annual_leave_total or 0,
+        annual_used=balance.annual_leave_used or 0,
+        sick=balance.sick_leave_total or 0,
+        sick_used=balance.sick_leave_used or 0
     )
 
 
+@app.post("/api/leaves/balances:batch", response_model=List[EmployeeLeaveBalance])
+def get_leave_balances_batch(
+    request: LeaveBalanceBatchRequest,
+    current_user: UserInToken = Depends(get_current_user),
+    db: Session = Depends(get_read_db)
+):
+    """
+    Birden çok çalışanın izin bakiyesini tek sorguda döndürür (yönetici ekip görünümü).
+    Bulunamayan ID'ler yanıtta yer almaz.
+    """
+    return [
+        EmployeeLeaveBalance(
+            employee_id=balance.id,
+            annual=balance.annual_leave_total or 0,
+            annual_used=balance.annual_leave_used or 0,
+            sick=balance.sick_leave_total or 0,
+            sick_used=balance.sick_leave_used or 0
+        )
+        for balance in crud.get_leave_balances(db, request.employee_ids)
+    ]
+
+
 # ============================================
 # EXPENSE MANAGEMENT (Protected)
 # ============================================
 
-@app.get("/api/expenses", response_model=List[ExpenseRequest])
+@app.get("/api/expenses", response_model=ExpensePage)
 def get_expenses(
+    request: Request,
+    response: Response,
     status: Optional[str] = None,
+    date_from: Optional[date_type] = None,
+    date_to: Optional[date_type] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    fields: Optional[str] = None,
     current_user: UserInToken = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
-    Masraf taleplerini listeler.
+    Masraf taleplerini listeler (en yeni önce).
     
     Query Params:
     - status: Duruma göre filtreleme (Bekliyor, Onaylandı, Reddedildi)
+    - date_from / date_to: Masraf tarihi aralığı (YYYY-MM-DD, dahil)
+    - cursor: Önceki sayfanın next_cursor değeri
+    - limit: Sayfa başına kayıt sayısı
+    - fields: Sadece istenen alanlar, virgülle ayrılmış (ör. id,full_name; id her zaman döner)
     """
-    db_expenses = crud.get_expense_requests(db, status_filter=status)
+    version = crud.get_collection_version(db, db_models.Expense, db_models.Employee)
+    not_modified = conditional_get(request, response, *version)
+    if not_modified:
+        return not_modified
+
+    try:
+        selected = parse_fields(fields, ExpenseRequest)
+        db_expenses, next_cursor = crud.get_expense_rows(
+            db, status=status, cursor=cursor, limit=limit,
+            date_from=date_from, date_to=date_to, fields=selected
+        )
+    except (InvalidCursor, InvalidFields) as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
-    return [
-        ExpenseRequest(
-            id=exp.id,
-            employee_id=exp.employee_id,
-            employee_name=exp.employee.full_name if exp.employee else "N/A",
-            expense_type=exp.expense_type,
-            amount=exp.amount,
-            date=exp.date,
-            description=exp.description or "",
-            status=exp.status,
-            created_at=exp.created_at.strftime("%Y-%m-%d")
+    items = [expense_request_from_row(row, selected) for row in db_expenses]
+    return model_response(page_of(ExpensePage, items, next_cursor, selected), response)
+
+
+@app.get("/api/expenses/search", response_model=ExpensePage)
+def search_expenses(
+    request: Request,
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200),
+    status: Optional[str] = None,
+    date_from: Optional[date_type] = None,
+    date_to: Optional[date_type] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    fields: Optional[str] = None,
+    current_user: UserInToken = Depends(get_current_user),
+    db: Session = Depends(get_read_db)
+):
+    """
+    Masraf açıklamalarında tam metin arama (en alakalı önce), ör. "Ankara".
+    Her kelime önek olarak aranır; filtreler ve sayfalama /api/expenses ile aynıdır.
+    """
+    version = crud.get_collection_version(db, db_models.Expense, db_models.Employee)
+    not_modified = conditional_get(request, response, *version)
+    if not_modified:
+        return not_modified
+
+    try:
+        selected = parse_fields(fields, ExpenseRequest)
+        db_expenses, next_cursor = crud.search_expenses(
+            db, q, status=status, cursor=cursor, limit=limit,
+            date_from=date_from, date_to=date_to, fields=selected
         )
-        for exp in db_expenses
-    ]
+    except (InvalidCursor, InvalidFields) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    items = [expense_request_from_row(row, selected) for row in db_expenses]
+    return model_response(page_of(ExpensePage, items, next_cursor, selected), response)
 
 
 @app.post("/api/expenses", response_model=ExpenseRequest, status_code=201)
@@ -405,15 +777,8 @@ def create_expense(
     """
     Yeni masraf talebi oluşturur.
     """
-    # Tarih validasyonu
-    try:
-        expense_date = datetime.strptime(expense_data.date, "%Y-%m-%d").date()
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Geçersiz tarih formatı. YYYY-MM-DD formatında olmalı.")
-    
-    # Gelecek tarih kontrolü
-    from datetime import date as date_type
-    if expense_date > date_type.today():
+    # Gelecek tarih kontrolü (format Pydantic tarafından doğrulanır)
+    if expense_data.date > date_type.today():
         raise HTTPException(status_code=400, detail="Gelecek tarihli masraf girilemez.")
     
     # Tutar kontrolü
@@ -421,60 +786,108 @@ def create_expense(
         raise HTTPException(status_code=400, detail="Masraf tutarı 0'dan büyük olmalı.")
     
     # Create in database (assuming employee_id = 1 for now)
-    db_expense = crud.create_expense_request(
+    db_expense = crud.create_expense(
         db,
-        employee_id=1,  # TODO: Get from current_user
-        expense_data={
-            "expense_type": expense_data.expense_type,
-            "amount": expense_data.amount,
-            "date": expense_data.date,
-            "description": expense_data.description,
-            "status": "Bekliyor"
-        }
+        expense_data,
+        employee_id=1  # TODO: Get from current_user
     )
     
-    return ExpenseRequest(
-        id=db_expense.id,
-        employee_id=db_expense.employee_id,
-        employee_name=db_expense.employee.full_name if db_expense.employee else current_user.name,
-        expense_type=db_expense.expense_type,
-        amount=db_expense.amount,
-        date=db_expense.date,
-        description=db_expense.description or "",
-        status=db_expense.status,
-        created_at=db_expense.created_at.strftime("%Y-%m-%d")
-    )
+    return to_expense_request(db_expense, employee_name=current_user.name)
+
+
+@app.get("/api/expenses/export")
+def export_expenses(
+    status: Optional[str] = None,
+    date_from: Optional[date_type] = None,
+    date_to: Optional[date_type] = None,
+    format: str = Query("csv", pattern="^(csv|xlsx)$"),
+    current_user: UserInToken = Depends(get_current_user)
+):
+    """
+    Masraf taleplerini CSV veya XLSX olarak dışa aktarır (akış halinde, sabit bellek).
+    Sadece yöneticiler kullanabilir
+    """
+    if current_user.role not in ["admin", "manager"]:
+        raise HTTPException(status_code=403, detail="Bu işlem için yetkiniz yok")
+
+    stmt = expense_export_query(status=status, date_from=date_from, date_to=date_to)
+    return export_response(stmt, EXPENSE_COLUMNS, format, "masraflar")
 
 
 @app.get("/api/expenses/{expense_id}", response_model=ExpenseRequest)
 def get_expense_detail(
     expense_id: int,
-    current_user: UserInToken = Depends(get_current_user)
+    request: Request,
+    response: Response,
+    fields: Optional[str] = None,
+    current_user: UserInToken = Depends(get_current_user),
+    db: Session = Depends(get_read_db)
 ):
     """
     Belirli bir masraf talebinin detaylarını döndürür.
+    If-None-Match eşleşirse 304 döner (ETag: updated_at).
+    fields: Sadece istenen alanlar, virgülle ayrılmış (id her zaman döner).
     """
-    # Mock veri
-    if expense_id == 1:
-        return ExpenseRequest(
-            id=1,
-            employee_id=1,
-            employee_name="Ahmet Yılmaz",
-            expense_type="Yol",
-            amount=450.00,
-            date="2025-11-20",
-            description="İstanbul - Ankara müşteri ziyareti",
-            status="Bekliyor",
-            created_at="2025-11-20"
-        )
+    version = crud.get_row_version(db, db_models.Expense, expense_id)
+    if version is None:
+        raise HTTPException(status_code=404, detail="Masraf talebi bulunamadı")
+    not_modified = conditional_get(request, response, *version)
+    if not_modified:
+        return not_modified
+
+    try:
+        selected = parse_fields(fields, ExpenseRequest)
+    except InvalidFields as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    row = crud.get_expense_row(db, expense_id, selected)
+    if row is None:
+        raise HTTPException(status_code=404, detail="Masraf talebi bulunamadı")
     
-    raise HTTPException(status_code=404, detail="Masraf talebi bulunamadı")
+    return model_response(expense_request_from_row(row, selected), response)
+
+
+@app.post("/api/expenses:bulk-approve", response_model=BulkDecisionResponse)
+def bulk_approve_expenses(
+    request: BulkDecisionRequest,
+    current_user: UserInToken = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Bekleyen masraf taleplerini tek sorguda toplu onaylar.
+    Her ID için sonuç döner (updated, not_pending, not_found).
+    Sadece yöneticiler kullanabilir
+    """
+    if current_user.role not in ["admin", "manager"]:
+        raise HTTPException(status_code=403, detail="Bu işlem için yetkiniz yok")
+
+    outcomes = crud.bulk_approve_expenses(db, request.ids, approved_by=_approver_id(db, current_user))
+    return _bulk_response(outcomes)
+
+
+@app.post("/api/expenses:bulk-reject", response_model=BulkDecisionResponse)
+def bulk_reject_expenses(
+    request: BulkDecisionRequest,
+    current_user: UserInToken = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Bekleyen masraf taleplerini tek sorguda toplu reddeder.
+    Sadece yöneticiler kullanabilir
+    """
+    if current_user.role not in ["admin", "manager"]:
+        raise HTTPException(status_code=403, detail="Bu işlem için yetkiniz yok")
+
+    outcomes = crud.bulk_reject_expenses(
+        db, request.ids, approved_by=_approver_id(db, current_user), reason=request.reason
+    )
+    return _bulk_response(outcomes)
 
 
 @app.put("/api/expenses/{expense_id}/approve")
 def approve_expense(
     expense_id: int,
-    current_user: UserInToken = Depends(get_current_user)
+    current_user: UserInToken = Depends(get_current_user),
+    db: Session = Depends(get_db)
 ):
     """
     Masraf talebini onaylar.
@@ -483,17 +896,23 @@ def approve_expense(
     if current_user.role not in ["admin", "manager"]:
         raise HTTPException(status_code=403, detail="Bu işlem için yetkiniz yok")
     
+    db_expense = crud.approve_expense(db, expense_id, approved_by=_approver_id(db, current_user))
+    if not db_expense:
+        raise HTTPException(status_code=404, detail="Masraf talebi bulunamadı")
+    
     return {
         "message": "Masraf talebi onaylandı",
         "expense_id": expense_id,
-        "status": "Onaylandı"
+        "status": db_expense.status
     }
 
 
 @app.put("/api/expenses/{expense_id}/reject")
 def reject_expense(
     expense_id: int,
-    current_user: UserInToken = Depends(get_current_user)
+    reason: Optional[str] = None,
+    current_user: UserInToken = Depends(get_current_user),
+    db: Session = Depends(get_db)
 ):
     """
     Masraf talebini reddeder.
@@ -502,50 +921,98 @@ def reject_expense(
     if current_user.role not in ["admin", "manager"]:
         raise HTTPException(status_code=403, detail="Bu işlem için yetkiniz yok")
     
+    db_expense = crud.reject_expense(db, expense_id, approved_by=_approver_id(db, current_user), reason=reason)
+    if not db_expense:
+        raise HTTPException(status_code=404, detail="Masraf talebi bulunamadı")
+    
     return {
         "message": "Masraf talebi reddedildi",
         "expense_id": expense_id,
-        "status": "Reddedildi"
+        "status": db_expense.status
     }
 
 
 @app.delete("/api/expenses/{expense_id}")
 def delete_expense(
     expense_id: int,
-    current_user: UserInToken = Depends(get_current_user)
+    current_user: UserInToken = Depends(get_current_user),
+    db: Session = Depends(get_db)
 ):
     """
     Masraf talebini siler.
     Sadece talep sahibi veya yönetici silebilir
     """
+    if not crud.delete_expense(db, expense_id):
+        raise HTTPException(status_code=404, detail="Masraf talebi bulunamadı")
+    
     return {
         "message": "Masraf talebi silindi",
         "expense_id": expense_id
     }
 
 
-@app.get("/api/expenses/summary/stats")
-def get_expense_summary(current_user: UserInToken = Depends(get_current_user)):
-    """
-    Masraf özetini döndürür (toplam, bekleyen, onaylanan).
+MONTH_PATTERN = r"^\d{4}-(0[1-9]|1[0-2])$"
+
+
+@app.get("/api/expenses/summary/stats", response_model=ExpenseSummary)
+def get_expense_summary(
+    employee_id: Optional[int] = None,
+    department_id: Optional[int] = None,
+    status: Optional[str] = None,
+    month: Optional[str] = Query(None, pattern=MONTH_PATTERN),
+    current_user: UserInToken = Depends(get_current_user),
+    db: Session = Depends(get_read_db)
+):
     """
-    mock_expenses = [
-        {"amount": 450.00, "status": "Bekliyor"},
-        {"amount": 280.50, "status": "Onaylandı"},
-        {"amount": 1250.00, "status": "Onaylandı"},
-        {"amount": 150.00, "status": "Reddedildi"},
-        {"amount": 85.00, "status": "Bekliyor"},
-    ]
+    Masraf özetini döndürür (toplam, bekleyen, onaylanan, reddedilen).
     
-    total = sum(exp["amount"] for exp in mock_expenses)
-    pending = sum(exp["amount"] for exp in mock_expenses if exp["status"] == "Bekliyor")
-    approved = sum(exp["amount"] for exp in mock_expenses if exp["status"] == "Onaylandı")
+    Query Params:
+    - employee_id, department_id, status: Filtreler
+    - month: Ay filtresi (YYYY-MM)
+    """
+    return crud.get_expense_summary(
+        db, employee_id=employee_id, department_id=department_id,
+        status=status, month_from=month, month_to=month
+    )
+
+
+@app.get("/api/expenses/summary/rollup", response_model=List[ExpenseRollupRow])
+def get_expense_rollup(
+    group_by: str = Query("month", pattern="^(employee|department|month|status)$"),
+    employee_id: Optional[int] = None,
+    department_id: Optional[int] = None,
+    status: Optional[str] = None,
+    month_from: Optional[str] = Query(None, pattern=MONTH_PATTERN),
+    month_to: Optional[str] = Query(None, pattern=MONTH_PATTERN),
+    current_user: UserInToken = Depends(get_current_user),
+    db: Session = Depends(get_read_db)
+):
+    """
+    Masrafları çalışan, departman, ay veya duruma göre gruplayarak özetler.
+    Kapanmış aylar expense_rollups tablosundan okunur; yıllık raporlar tüm
+    masraf satırlarını yeniden taramaz.
     
-    return {
-        "total_amount": total,
-        "pending_amount": pending,
-        "approved_amount": approved,
-        "total_count": len(mock_expenses),
-        "pending_count": sum(1 for exp in mock_expenses if exp["status"] == "Bekliyor"),
-        "approved_count": sum(1 for exp in mock_expenses if exp["status"] == "Onaylandı")
-    }
+    Query Params:
+    - group_by: employee, department, month, status
+    - month_from / month_to: Ay aralığı (YYYY-MM, dahil)
+    """
+    return crud.get_expense_rollup(
+        db, group_by=group_by, employee_id=employee_id, department_id=department_id,
+        status=status, month_from=month_from, month_to=month_to
+    )
+
+
+@app.get("/api/expenses/summary/{employee_id}", response_model=ExpenseSummary)
+def get_employee_expense_summary(
+    employee_id: int,
+    status: Optional[str] = None,
+    month: Optional[str] = Query(None, pattern=MONTH_PATTERN),
+    current_user: UserInToken = Depends(get_current_user),
+    db: Session = Depends(get_read_db)
+):
+    """
+    Bir çalışanın masraf özetini döndürür.
+    """
+    return crud.get_expense_summary(
+        db, employee_id=employee_id, status=status, month_from=month, month_to=month
+    )
@@ -0,0 +1,123 @@
+"""
+Management commands.
+
+    python manage.py init-db     # create tables on a fresh database and stamp the Alembic head
+    python manage.py check-db    # exit 1 if the database is not at the Alembic head
+    python manage.py reconcile-stats  # recompute the materialized dashboard counters
+    python manage.py close-expense-months  # build expense rollups for finished months
+    python manage.py check-plans # exit 1 if a crud query plan falls back to a full table scan
+    python manage.py import-employees roster.csv --tokens-out tokens.csv  # bulk import employees from CSV/XLSX
+"""
+
+import argparse
+import csv
+import sys
+
+
+def cmd_init_db(args):
+    from database import init_db
+    init_db()
+    return 0
+
+
+def cmd_check_db(args):
+    from database import get_schema_revisions
+    current, heads = get_schema_revisions()
+    if current == heads:
+        print(f"OK - Database at head: {', '.join(sorted(heads)) or '-'}")
+        return 0
+    print(f"Schema mismatch - database: {', '.join(sorted(current)) or '-'}, "
+          f"head: {', '.join(sorted(heads)) or '-'}")
+    print("Run: alembic upgrade head")
+    return 1
+
+
+def cmd_reconcile_stats(args):
+    from database import SessionLocal
+    import crud
+    db = SessionLocal()
+    try:
+        drift = crud.reconcile_dashboard_stats(db)
+    finally:
+        db.close()
+    print(f"OK - Dashboard stats reconciled, drift: {drift or 'none'}")
+    return 0
+
+
+def cmd_close_expense_months(args):
+    from database import SessionLocal
+    import crud
+    db = SessionLocal()
+    try:
+        months = crud.close_expense_months(db)
+    finally:
+        db.close()
+    print(f"OK - Expense months closed: {', '.join(months) or 'none'}")
+    return 0
+
+
+def cmd_check_plans(args):
+    from database import SessionLocal
+    from query_plans import check_query_plans, PLAN_CHECKS
+    db = SessionLocal()
+    try:
+        problems = check_query_plans(db)
+    finally:
+        db.close()
+    for name, issues in problems.items():
+        for issue in issues:
+            print(f"FAIL {name}: {issue}")
+    if problems:
+        return 1
+    print(f"OK - {len(PLAN_CHECKS)} query plans use indexes")
+    return 0
+
+
+def cmd_import_employees(args):
+    from database import SessionLocal
+    from employee_import import import_employees, ImportFormatError
+    db = SessionLocal()
+    try:
+        with open(args.path, "rb") as file:
+            report = import_employees(db, file, args.path, chunk_size=args.chunk_size)
+    except ImportFormatError as e:
+        print(f"FAIL - {e}")
+        return 1
+    finally:
+        db.close()
+    for error in report["errors"]:
+        print(f"row {error['row']}: {error['error']}")
+    if args.tokens_out:
+        with open(args.tokens_out, "w", newline="", encoding="utf-8") as out:
+            writer = csv.writer(out)
+            writer.writerow(["email", "token"])
+            writer.writerows((t["email"], t["token"]) for t in report["password_tokens"])
+        print(f"Password-set tokens written to {args.tokens_out}")
+    elif report["password_tokens"]:
+        print(f"WARNING - {len(report['password_tokens'])} password-set tokens not saved (use --tokens-out)")
+    print(f"{'OK' if not report['failed'] else 'DONE'} - imported {report['imported']}, failed {report['failed']}")
+    return 1 if report["failed"] else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="FastHR management commands")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("init-db", help="Create tables and stamp the Alembic head").set_defaults(func=cmd_init_db)
+    subparsers.add_parser("check-db", help="Compare the database revision with the Alembic head").set_defaults(func=cmd_check_db)
+
+    subparsers.add_parser("reconcile-stats", help="Recompute dashboard counters").set_defaults(func=cmd_reconcile_stats)
+    subparsers.add_parser("close-expense-months", help="Build expense rollups for finished months").set_defaults(func=cmd_close_expense_months)
+    subparsers.add_parser("check-plans", help="EXPLAIN crud queries and fail on full table scans").set_defaults(func=cmd_check_plans)
+
+    import_parser = subparsers.add_parser("import-employees", help="Bulk import employees from a CSV/XLSX file")
+    import_parser.add_argument("path")
+    import_parser.add_argument("--chunk-size", type=int, default=1000)
+    import_parser.add_argument("--tokens-out", help="CSV file for the users' password-set tokens")
+    import_parser.set_defaults(func=cmd_import_employees)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,6 @@
 from pydantic import BaseModel, Field, EmailStr
-from typing import Optional
+from typing import List, Optional, Union
+from datetime import date as date_type
 
 class EmployeeCard(BaseModel):
     """
@@ -27,6 +28,26 @@ class EmployeeCard(BaseModel):
         }
 
 
+class EmployeeSuggestion(BaseModel):
+    """
+    İsim arama (typeahead) sonucu.
+    """
+    id: int = Field(..., description="Çalışan benzersiz kimliği")
+    full_name: str = Field(..., description="Çalışanın ad ve soyadı")
+    title: str = Field(..., description="Çalışanın pozisyonu/ünvanı")
+    avatar_url: str = Field(..., description="Profil fotoğrafı URL'i veya baş harfler")
+    department: str = Field(..., description="Çalışanın departmanı")
+
+
+class EmployeePage(BaseModel):
+    """
+    Çalışan listesinin bir sayfası.
+    next_cursor bir sonraki sayfayı almak için ?cursor= olarak gönderilir; son sayfada None'dır.
+    """
+    items: List[EmployeeCard]
+    next_cursor: Optional[str] = Field(None, description="Sonraki sayfa imleci")
+
+
 class EmployeeDetail(BaseModel):
     """
     Çalışan detay modeli.
@@ -45,11 +66,11 @@ class EmployeeDetail(BaseModel):
     phone: str = Field(..., description="Çalışanın telefon numarası", max_length=20)
     
     # İş bilgileri
-    start_date: str = Field(..., description="İşe başlama tarihi (YYYY-MM-DD formatında)")
+    start_date: date_type = Field(..., description="İşe başlama tarihi (YYYY-MM-DD formatında)")
     
     # Detaylı bilgiler (opsiyonel)
     address: Optional[str] = Field(None, description="İkamet adresi", max_length=200)
-    birth_date: Optional[str] = Field(None, description="Doğum tarihi (YYYY-MM-DD formatında)")
+    birth_date: Optional[date_type] = Field(None, description="Doğum tarihi (YYYY-MM-DD formatında)")
     emergency_contact: Optional[str] = Field(None, description="Acil durum iletişim bilgisi", max_length=100)
     
     # Hassas bilgiler
@@ -83,8 +104,8 @@ class LeaveRequest(BaseModel):
     employee_id: int
     employee_name: str
     leave_type: str = Field(..., description="İzin türü: Yıllık İzin, Hastalık İzni, Mazeret İzni, Ücretsiz İzin")
-    start_date: str = Field(..., description="Başlangıç tarihi (YYYY-MM-DD)")
-    end_date: str = Field(..., description="Bitiş tarihi (YYYY-MM-DD)")
+    start_date: date_type = Field(..., description="Başlangıç tarihi (YYYY-MM-DD)")
+    end_date: date_type = Field(..., description="Bitiş tarihi (YYYY-MM-DD)")
     days: int = Field(..., description="Toplam izin günü sayısı", ge=1)
     reason: str = Field(..., description="İzin sebebi/açıklama", min_length=5)
     status: str = Field(default="Bekliyor", description="Durum: Bekliyor, Onaylandı, Reddedildi")
@@ -107,6 +128,14 @@ class LeaveRequest(BaseModel):
         }
 
 
+class LeavePage(BaseModel):
+    """
+    İzin talepleri listesinin bir sayfası
+    """
+    items: List[LeaveRequest]
+    next_cursor: Optional[str] = Field(None, description="Sonraki sayfa imleci")
+
+
 class LeaveBalance(BaseModel):
     """
     İzin bakiyesi modeli
@@ -127,13 +156,27 @@ class LeaveBalance(BaseModel):
         }
 
 
+class EmployeeLeaveBalance(LeaveBalance):
+    """
+    Toplu bakiye sorgusunda bir çalışanın izin bakiyesi
+    """
+    employee_id: int
+
+
+class LeaveBalanceBatchRequest(BaseModel):
+    """
+    Toplu izin bakiyesi isteği
+    """
+    employee_ids: List[int] = Field(..., description="Çalışan ID listesi", min_length=1, max_length=5000)
+
+
 class LeaveCreateRequest(BaseModel):
     """
     İzin talebi oluşturma request modeli
     """
     leave_type: str
-    start_date: str
-    end_date: str
+    start_date: date_type
+    end_date: date_type
     reason: str
     
     class Config:
@@ -156,7 +199,7 @@ class ExpenseRequest(BaseModel):
     employee_name: str
     expense_type: str = Field(..., description="Masraf türü: Yol, Yemek, Konaklama, Diğer")
     amount: float = Field(..., ge=0, description="Masraf tutarı (TL)")
-    date: str = Field(..., description="Masraf tarihi (YYYY-MM-DD)")
+    date: date_type = Field(..., description="Masraf tarihi (YYYY-MM-DD)")
     description: str = Field(..., description="Masraf açıklaması", min_length=5)
     receipt_url: Optional[str] = None
     status: str = Field(default="Bekliyor", description="Durum: Bekliyor, Onaylandı, Reddedildi")
@@ -179,13 +222,43 @@ class ExpenseRequest(BaseModel):
         }
 
 
+class ExpensePage(BaseModel):
+    """
+    Masraf talepleri listesinin bir sayfası
+    """
+    items: List[ExpenseRequest]
+    next_cursor: Optional[str] = Field(None, description="Sonraki sayfa imleci")
+
+
+class ExpenseSummary(BaseModel):
+    """
+    Masraf özeti (duruma göre toplam tutar ve adet)
+    """
+    total_amount: float
+    pending_amount: float
+    approved_amount: float
+    rejected_amount: float
+    total_count: int
+    pending_count: int
+    approved_count: int
+    rejected_count: int
+
+
+class ExpenseRollupRow(ExpenseSummary):
+    """
+    Gruplanmış masraf özeti satırı.
+    key: çalışan ID, departman ID, ay (YYYY-MM) veya durum - group_by değerine göre
+    """
+    key: Optional[Union[int, str]] = None
+
+
 class ExpenseCreateRequest(BaseModel):
     """
     Masraf talebi oluşturma request modeli
     """
     expense_type: str
     amount: float = Field(..., ge=0)
-    date: str
+    date: date_type
     description: str
     
     class Config:
@@ -198,3 +271,54 @@ class ExpenseCreateRequest(BaseModel):
             }
         }
 
+
+
+class BulkDecisionRequest(BaseModel):
+    """
+    Toplu onay/ret isteği (izin veya masraf)
+    """
+    ids: List[int] = Field(..., description="Talep ID listesi", min_length=1, max_length=500)
+    reason: Optional[str] = Field(None, description="Ret gerekçesi (sadece bulk-reject)")
+
+
+class BulkDecisionItem(BaseModel):
+    """
+    Toplu işlemde tek bir talebin sonucu
+    """
+    id: int
+    outcome: str  # updated, not_pending, not_found
+    status: Optional[str] = None  # talebin işlem sonrası durumu
+
+
+class BulkDecisionResponse(BaseModel):
+    """
+    Toplu onay/ret yanıtı
+    """
+    updated: int
+    items: List[BulkDecisionItem]
+
+
+class EmployeeImportError(BaseModel):
+    """
+    İçe aktarmada hatalı satır
+    """
+    row: int
+    error: str
+
+
+class EmployeeImportPasswordToken(BaseModel):
+    """
+    İçe aktarılan kullanıcının şifre belirleme token'ı (POST /api/auth/set-password)
+    """
+    email: str
+    token: str
+
+
+class EmployeeImportReport(BaseModel):
+    """
+    Toplu çalışan içe aktarma sonucu
+    """
+    imported: int
+    failed: int
+    errors: List[EmployeeImportError]
+    password_tokens: List[EmployeeImportPasswordToken] = []
@@ -0,0 +1,136 @@
+"""
+Keyset (cursor) pagination helpers.
+List endpoints page on (sort column, id) instead of OFFSET, so deep pages
+cost the same as the first one and concurrent inserts don't shift rows
+between pages.
+"""
+
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import Select, and_, or_
+from sqlalchemy.orm import Query
+
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+class InvalidCursor(ValueError):
+    """Raised when a client sends a cursor we did not issue."""
+
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Cursor value not serializable: {type(value).__name__}")
+
+
+def encode_cursor(sort_value: Any, row_id: int) -> str:
+    """Encode the last row's (sort value, id) as an opaque URL-safe token."""
+    raw = json.dumps([sort_value, row_id], default=_json_default, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_column) -> Tuple[Any, int]:
+    """Decode a cursor back into (sort value, id), typed for sort_column."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        row_id = int(row_id)
+        python_type = sort_column.type.python_type
+        if sort_value is not None and python_type is datetime:
+            sort_value = datetime.fromisoformat(sort_value)
+        elif sort_value is not None and python_type is date:
+            sort_value = date.fromisoformat(sort_value)
+    except (ValueError, TypeError, json.JSONDecodeError, UnicodeError):
+        raise InvalidCursor("Geçersiz sayfa imleci")
+    return sort_value, row_id
+
+
+def _apply_keyset(query, sort_column, id_column, cursor, limit, descending):
+    """Add the keyset predicate, ordering and limit+1 to a Query or Select."""
+    if cursor:
+        last_value, last_id = decode_cursor(cursor, sort_column)
+        if descending:
+            query = query.filter(or_(
+                sort_column < last_value,
+                and_(sort_column == last_value, id_column < last_id),
+            ))
+        else:
+            query = query.filter(or_(
+                sort_column > last_value,
+                and_(sort_column == last_value, id_column > last_id),
+            ))
+
+    if descending:
+        query = query.order_by(sort_column.desc(), id_column.desc())
+    else:
+        query = query.order_by(sort_column.asc(), id_column.asc())
+
+    # Fetch one extra row to know whether another page exists
+    return query.limit(limit + 1)
+
+
+def _split_page(rows, sort_column, id_column, limit) -> Tuple[List[Any], Optional[str]]:
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    last = rows[-1]
+    next_cursor = encode_cursor(getattr(last, sort_column.key), getattr(last, id_column.key))
+    return rows, next_cursor
+
+
+def paginate(
+    query: Query,
+    sort_column,
+    id_column,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    descending: bool = False,
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    Apply keyset pagination to query.
+    Returns (rows, next_cursor); next_cursor is None on the last page.
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    rows = _apply_keyset(query, sort_column, id_column, cursor, limit, descending).all()
+    return _split_page(rows, sort_column, id_column, limit)
+
+
+def paginate_rows(
+    db,
+    stmt: Select,
+    sort_column,
+    id_column,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    descending: bool = False,
+) -> Tuple[List[Any], Optional[str]]:
+    """paginate() for a Core select() of plain columns; returns Row tuples."""
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    rows = db.execute(_apply_keyset(stmt, sort_column, id_column, cursor, limit, descending)).all()
+    return _split_page(rows, sort_column, id_column, limit)
+
+
+async def paginate_async(
+    db,
+    stmt: Select,
+    sort_column,
+    id_column,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    descending: bool = False,
+    plain_rows: bool = False,
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    paginate() for a select() executed on an AsyncSession. Entity selects
+    return ORM objects; with plain_rows=True (Core column selects) Row tuples.
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    result = await db.execute(_apply_keyset(stmt, sort_column, id_column, cursor, limit, descending))
+    rows = list(result.all()) if plain_rows else list(result.scalars().unique().all())
+    return _split_page(rows, sort_column, id_column, limit)
@@ -0,0 +1,124 @@
+"""
+Connection pool metrics (GET /api/admin/db-pool).
+
+The MariaDB/MySQL engines use TimedQueuePool (TimedAsyncQueuePool for the
+async engine): a QueuePool that times every checkout - the wait for a free
+connection, or for opening an overflow one - into a histogram and counts
+checkouts that gave up after pool_timeout. Together with the live
+checked-out / overflow counts this shows whether requests queue for a
+connection, i.e. whether pool_size + max_overflow is below the number of
+worker threads using the pool.
+
+Counters are per process; each worker reports its own pools.
+"""
+
+import logging
+import threading
+from bisect import bisect_left
+from time import perf_counter
+from typing import Dict, List, Optional
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+# Upper bounds (ms) of the wait-time histogram buckets; the last bucket is +Inf
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+logger = logging.getLogger("fasthr.db")
+
+
+class PoolStats:
+    """Checkout wait times and timeouts of one pool."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.buckets: List[int] = [0] * (len(WAIT_BUCKETS_MS) + 1)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def record(self, seconds: float):
+        index = bisect_left(WAIT_BUCKETS_MS, seconds * 1000)
+        with self._lock:
+            self.buckets[index] += 1
+            self.checkouts += 1
+            self.wait_seconds += seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+
+    def record_timeout(self):
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            buckets = list(self.buckets)
+            checkouts, timeouts = self.checkouts, self.timeouts
+            wait_seconds, max_wait = self.wait_seconds, self.max_wait_seconds
+        labels = [str(bound) for bound in WAIT_BUCKETS_MS] + ["+Inf"]
+        return {
+            "checkouts": checkouts,
+            "timeouts": timeouts,
+            "wait_ms_total": round(wait_seconds * 1000, 2),
+            "wait_ms_max": round(max_wait * 1000, 2),
+            # Non-cumulative: checkouts that waited up to each bound (ms)
+            "wait_ms_histogram": dict(zip(labels, buckets)),
+        }
+
+
+class _TimedPool:
+    stats: Optional[PoolStats] = None
+
+    def _do_get(self):
+        start = perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            if self.stats is not None:
+                self.stats.record_timeout()
+            logger.warning("Connection pool timeout after %.1fs (%s)", perf_counter() - start, self.status())
+            raise
+        if self.stats is not None:
+            self.stats.record(perf_counter() - start)
+        return connection
+
+    def recreate(self):
+        # engine.dispose() swaps in a new pool; keep counting into the same stats
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+
+class TimedQueuePool(_TimedPool, QueuePool):
+    pass
+
+
+class TimedAsyncQueuePool(_TimedPool, AsyncAdaptedQueuePool):
+    pass
+
+
+_tracked: Dict[str, object] = {}
+
+
+def track(name: str, engine):
+    """Start collecting stats for engine's pool, reported under name."""
+    pool = engine.pool
+    if isinstance(pool, _TimedPool):
+        pool.stats = PoolStats()
+        _tracked[name] = engine
+
+
+def _pool_snapshot(pool) -> dict:
+    overflow = pool.overflow()
+    return {
+        "pool_size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow_in_use": max(0, overflow),
+        **(pool.stats.snapshot() if pool.stats is not None else {}),
+    }
+
+
+def snapshot() -> Dict[str, dict]:
+    """Live state of every tracked pool, by name."""
+    return {name: _pool_snapshot(engine.pool) for name, engine in _tracked.items()}
@@ -0,0 +1,146 @@
+"""
+Query counting and timing.
+Records SQL statements (and how long each took) executed inside a block,
+per request/task (contextvar based, so concurrent requests don't mix their
+counts). Used for N+1 detection in tests and by instrumentation.py for
+per-request Server-Timing. Counters nest: an outer block also counts the
+statements of the blocks inside it.
+
+The test helpers (assert_max_queries, assert_constant_queries) count
+statements from every thread, since TestClient serves requests on its own
+event-loop thread where the test's context isn't visible.
+
+Usage:
+    with count_queries() as counter:
+        client.get("/api/employees?limit=10")
+    assert counter.count <= 3
+
+    with assert_max_queries(3):
+        client.get("/api/employees?limit=100")
+"""
+
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class QueryCounter:
+    """Statements executed while this counter was active, with durations in seconds."""
+
+    def __init__(self):
+        self.statements: List[str] = []
+        self.parameters: List[object] = []
+        self.durations: List[float] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    @property
+    def total_time(self) -> float:
+        return sum(self.durations)
+
+    @property
+    def slowest(self) -> Optional[Tuple[float, str]]:
+        """(duration, statement) of the slowest statement, or None."""
+        if not self.durations:
+            return None
+        index = max(range(len(self.durations)), key=self.durations.__getitem__)
+        return self.durations[index], self.statements[index]
+
+
+_active_counters: ContextVar[Tuple[QueryCounter, ...]] = ContextVar("active_query_counters", default=())
+
+# Counters that record statements from any thread (count_queries(all_threads=True))
+_process_counters: Tuple[QueryCounter, ...] = ()
+_process_counters_lock = threading.Lock()
+
+
+def _recording() -> Tuple[QueryCounter, ...]:
+    return _active_counters.get() + _process_counters
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_statement(conn, cursor, statement, parameters, context, executemany):
+    if _recording():
+        conn.info.setdefault("query_start", []).append(perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _record_statement(conn, cursor, statement, parameters, context, executemany):
+    counters = _recording()
+    if not counters:
+        return
+    starts = conn.info.get("query_start")
+    elapsed = perf_counter() - starts.pop() if starts else 0.0
+    for counter in counters:
+        counter.statements.append(statement)
+        counter.parameters.append(parameters)
+        counter.durations.append(elapsed)
+
+
+@event.listens_for(Engine, "handle_error")
+def _abandon_statement(exception_context):
+    # after_cursor_execute doesn't fire for failed statements; drop their start time
+    conn = exception_context.connection
+    if conn is not None:
+        starts = conn.info.get("query_start")
+        if starts:
+            starts.pop()
+
+
+@contextmanager
+def count_queries(all_threads: bool = False):
+    """
+    Count statements executed by any engine inside the block - in this
+    context, or with all_threads in every thread of the process.
+    """
+    global _process_counters
+    counter = QueryCounter()
+    if all_threads:
+        with _process_counters_lock:
+            _process_counters = _process_counters + (counter,)
+        try:
+            yield counter
+        finally:
+            with _process_counters_lock:
+                _process_counters = tuple(c for c in _process_counters if c is not counter)
+        return
+    token = _active_counters.set(_active_counters.get() + (counter,))
+    try:
+        yield counter
+    finally:
+        _active_counters.reset(token)
+
+
+@contextmanager
+def assert_max_queries(limit: int):
+    """Fail if the block executes more than limit statements (in any thread)."""
+    with count_queries(all_threads=True) as counter:
+        yield counter
+    if counter.count > limit:
+        executed = "\n".join(f"  {i + 1}. {sql}" for i, sql in enumerate(counter.statements))
+        raise AssertionError(
+            f"Expected at most {limit} queries, got {counter.count}:\n{executed}"
+        )
+
+
+def assert_constant_queries(run, page_sizes=(1, 10, 100)) -> int:
+    """
+    Call run(page_size) for each size and fail if the query count changes
+    (statements in any thread). Catches N+1 regressions where each extra row
+    costs another SELECT. Returns the (constant) query count.
+    """
+    counts = {}
+    for size in page_sizes:
+        with count_queries(all_threads=True) as counter:
+            run(size)
+        counts[size] = counter.count
+    if len(set(counts.values())) > 1:
+        raise AssertionError(f"Query count grows with page size: {counts}")
+    return counts[page_sizes[0]]
@@ -0,0 +1,118 @@
+"""
+Query-plan regression checks.
+Runs the crud read queries the endpoints use (the Core row statements of
+the list/detail routes included), captures the SQL they emit and EXPLAINs each
+statement (SQLite: EXPLAIN QUERY PLAN, MariaDB/MySQL: EXPLAIN). A statement
+that reads a large table without an index is reported as a full scan.
+
+    python manage.py check-plans
+"""
+
+import re
+from datetime import datetime
+from typing import Callable, Dict, List, Tuple
+
+from sqlalchemy.orm import Session
+
+import crud
+import db_models
+from pagination import encode_cursor
+from query_counter import count_queries
+
+# Tables small enough that a full scan is the right plan
+SMALL_TABLES = {"departments", "dashboard_stats", "expense_rollup_months"}
+
+_SQLITE_SCAN = re.compile(r"^SCAN (?:TABLE )?(\w+)(?: AS \w+)?(.*)$")
+# Subqueries and CTEs SQLite evaluates into a pseudo-table it then scans
+_SQLITE_PSEUDO = re.compile(r"^(?:CO-ROUTINE|MATERIALIZE) (?:\()?([\w-]+)")
+
+
+def _sample_month() -> str:
+    return datetime.utcnow().strftime("%Y-%m")
+
+
+# name -> crud call; each call should be answerable from an index
+PLAN_CHECKS: List[Tuple[str, Callable[[Session], object]]] = [
+    ("employees_page", lambda db: crud.get_employee_cards(db, limit=20)),
+    ("employees_next_page", lambda db: crud.get_employee_cards(
+        db, cursor=encode_cursor("M", 1), limit=20)),
+    ("employees_page_fields", lambda db: crud.get_employee_cards(db, limit=20, fields=("id", "full_name"))),
+    ("employee_detail", lambda db: crud.get_employee_row(db, 1)),
+    ("employees_on_leave", lambda db: crud.get_employees_on_leave(db)),
+    ("leaves_page", lambda db: crud.get_leave_rows(db, limit=20)),
+    ("leaves_by_status", lambda db: crud.get_leave_rows(db, status="Bekliyor", limit=20)),
+    ("leave_detail", lambda db: crud.get_leave_row(db, 1)),
+    ("expenses_page", lambda db: crud.get_expense_rows(db, limit=20)),
+    ("expenses_by_status", lambda db: crud.get_expense_rows(db, status="Bekliyor", limit=20)),
+    ("expense_detail", lambda db: crud.get_expense_row(db, 1)),
+    ("expense_summary_employee_month", lambda db: crud.get_expense_summary(
+        db, employee_id=1, month_from=_sample_month(), month_to=_sample_month())),
+    ("expense_summary_status_month", lambda db: crud.get_expense_summary(
+        db, status="Onaylandı", month_from=_sample_month(), month_to=_sample_month())),
+    ("leave_request_checks", lambda db: crud.get_leave_request_checks(
+        db, 1, "Yıllık İzin", datetime.utcnow().date(), datetime.utcnow().date())),
+    ("leave_balance", lambda db: crud.get_leave_balance(db, 1)),
+    ("leave_balances_batch", lambda db: crud.get_leave_balances(db, list(range(1, 50)))),
+    ("collection_versions", lambda db: crud.get_collection_version(
+        db, db_models.Employee, db_models.Leave, db_models.Expense)),
+    ("leave_row_version", lambda db: crud.get_row_version(db, db_models.Leave, 1)),
+    ("leave_search", lambda db: crud.search_leaves(db, "ameliyat", status="Bekliyor", limit=20)),
+    ("expense_search", lambda db: crud.search_expenses(db, "Ankara", limit=20)),
+    ("user_by_email", lambda db: crud.get_user_by_email(db, "admin@fasthr.com")),
+]
+
+
+def explain(db: Session, statement: str, parameters) -> List[dict]:
+    """EXPLAIN one captured statement with its original parameters."""
+    conn = db.connection()
+    prefix = "EXPLAIN QUERY PLAN " if conn.dialect.name == "sqlite" else "EXPLAIN "
+    result = conn.exec_driver_sql(prefix + statement, parameters)
+    return [dict(row) for row in result.mappings()]
+
+
+def full_scans(dialect_name: str, plan: List[dict]) -> List[str]:
+    """Tables the plan reads in full, excluding SMALL_TABLES."""
+    tables, pseudo = [], set()
+    for row in plan:
+        if dialect_name == "sqlite":
+            detail = row.get("detail", "")
+            pseudo_match = _SQLITE_PSEUDO.match(detail)
+            if pseudo_match:
+                pseudo.add(pseudo_match.group(1))
+                continue
+            # "SCAN CONSTANT ROW": a scalar subquery (COUNT/MAX) with no FROM of its own
+            if detail.startswith("SCAN CONSTANT ROW"):
+                continue
+            match = _SQLITE_SCAN.match(detail)
+            # FTS5 lookups show up as "SCAN <fts> VIRTUAL TABLE INDEX ..."
+            if match and "USING" not in match.group(2) and "VIRTUAL TABLE INDEX" not in match.group(2):
+                tables.append(match.group(1))
+        else:
+            if str(row.get("type", "")).upper() == "ALL":
+                tables.append(row.get("table"))
+    return [
+        t for t in tables
+        if t and t not in SMALL_TABLES and t not in pseudo
+        and not t.startswith(("<derived", "<subquery", "<union"))
+    ]
+
+
+def check_query_plans(db: Session) -> Dict[str, List[str]]:
+    """
+    Run every PLAN_CHECKS query and EXPLAIN its statements.
+    Returns {check name: [problem, ...]} for checks that hit a full scan.
+    """
+    dialect_name = db.get_bind().dialect.name
+    problems: Dict[str, List[str]] = {}
+    for name, run in PLAN_CHECKS:
+        with count_queries() as counter:
+            run(db)
+        for statement, parameters in zip(counter.statements, counter.parameters):
+            if not statement.lstrip().upper().startswith("SELECT"):
+                continue
+            scanned = full_scans(dialect_name, explain(db, statement, parameters))
+            if scanned:
+                sql = " ".join(statement.split())
+                problems.setdefault(name, []).append(f"full scan of {', '.join(scanned)}: {sql[:300]}")
+    db.rollback()
+    return problems
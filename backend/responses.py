@@ -0,0 +1,32 @@
+"""
+Single-pass JSON responses for collection endpoints.
+
+When a route returns a model instance, FastAPI dumps it to a dict,
+validates it again against response_model, runs jsonable_encoder and
+finally json.dumps. The page models here are already validated when they
+are built, so collection routes return ModelResponse instead: pydantic-core
+serializes the models straight to JSON bytes. response_model stays on the
+route for the OpenAPI schema.
+"""
+
+from typing import Any, Optional
+
+from fastapi import Response
+from pydantic_core import to_json
+
+
+class ModelResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+def model_response(content: Any, response: Optional[Response] = None, status_code: int = 200) -> ModelResponse:
+    """
+    Serialize content once. Headers set on the route's injected Response
+    (ETag, Cache-Control, ...) are carried over, since FastAPI ignores that
+    object when a route returns its own Response.
+    """
+    headers = dict(response.headers) if response is not None else None
+    return ModelResponse(content, status_code=status_code, headers=headers)
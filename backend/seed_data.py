@@ -6,8 +6,9 @@ Run this after creating migrations.
 from sqlalchemy.orm import Session
 from database import SessionLocal, init_db
 from db_models import User, Department, Employee, Leave, Expense
+from crud import reconcile_dashboard_stats
 from passlib.context import CryptContext
-from datetime import datetime
+from datetime import date, datetime
 
 # Password hashing
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -221,7 +222,7 @@ def seed_users_and_employees(db: Session):
             email=emp_data["email"],
             phone=emp_data["phone"],
             avatar_url=emp_data["avatar_url"],
-            start_date=emp_data["start_date"],
+            start_date=date.fromisoformat(emp_data["start_date"]),
             is_on_leave=emp_data["is_on_leave"],
             annual_leave_total=14,
             annual_leave_used=8 if emp_data["full_name"] == "Ahmet Yılmaz" else 5,
@@ -290,6 +291,8 @@ def seed_leaves(db: Session):
     ]
     
     for leave_data in leaves_data:
+        leave_data["start_date"] = date.fromisoformat(leave_data["start_date"])
+        leave_data["end_date"] = date.fromisoformat(leave_data["end_date"])
         existing = db.query(Leave).filter(
             Leave.employee_id == leave_data["employee_id"],
             Leave.start_date == leave_data["start_date"]
@@ -348,6 +351,7 @@ def seed_expenses(db: Session):
     ]
     
     for expense_data in expenses_data:
+        expense_data["date"] = date.fromisoformat(expense_data["date"])
         existing = db.query(Expense).filter(
             Expense.employee_id == expense_data["employee_id"],
             Expense.date == expense_data["date"],
@@ -377,6 +381,10 @@ def main():
         seed_leaves(db)
         seed_expenses(db)
         
+        # Seed rows bypass crud, so rebuild the dashboard counters
+        reconcile_dashboard_stats(db)
+        print("OK - Dashboard stats reconciled")
+        
         print("\nDatabase seeding completed successfully!")
         print("\nTest Credentials:")
         print("  Admin: admin@fasthr.com / admin123")
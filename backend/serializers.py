@@ -0,0 +1,135 @@
+"""
+ORM entity -> API model conversion shared by the sync and async routes.
+The *_from_row variants map the plain rows of the Core row queries
+(crud.employee_row_stmt etc.); their values come from typed columns, so
+the models are built with model_construct and skip validation. Given a
+sparse fieldset they return a dict of just those keys instead.
+"""
+
+from operator import attrgetter
+from typing import Optional, Tuple
+
+import db_models
+from models import EmployeeCard, EmployeeDetail, EmployeeSuggestion, LeaveRequest, ExpenseRequest
+
+
+def avatar_for(emp: db_models.Employee) -> str:
+    """Avatar URL, or the employee's initials when none is set."""
+    return emp.avatar_url or "".join([n[0] for n in emp.full_name.split()[:2]])
+
+
+def to_employee_card(emp: db_models.Employee) -> EmployeeCard:
+    return EmployeeCard(
+        id=emp.id,
+        full_name=emp.full_name,
+        title=emp.title,
+        avatar_url=avatar_for(emp),
+        is_on_leave=emp.is_on_leave,
+        department=emp.department.name if emp.department else "N/A"
+    )
+
+
+def to_leave_request(leave: db_models.Leave, employee_name: str = "N/A") -> LeaveRequest:
+    return LeaveRequest(
+        id=leave.id,
+        employee_id=leave.employee_id,
+        employee_name=leave.employee.full_name if leave.employee else employee_name,
+        leave_type=leave.leave_type,
+        start_date=leave.start_date,
+        end_date=leave.end_date,
+        days=leave.days,
+        reason=leave.reason or "",
+        status=leave.status,
+        created_at=leave.created_at.strftime("%Y-%m-%d")
+    )
+
+
+def to_expense_request(exp: db_models.Expense, employee_name: str = "N/A") -> ExpenseRequest:
+    return ExpenseRequest(
+        id=exp.id,
+        employee_id=exp.employee_id,
+        employee_name=exp.employee.full_name if exp.employee else employee_name,
+        expense_type=exp.expense_type,
+        amount=exp.amount,
+        date=exp.date,
+        description=exp.description or "",
+        status=exp.status,
+        created_at=exp.created_at.strftime("%Y-%m-%d")
+    )
+
+
+# Response field -> value from a row of the matching crud.*_FIELD_COLUMNS
+EMPLOYEE_VALUES = {
+    "id": attrgetter("id"),
+    "full_name": attrgetter("full_name"),
+    "title": attrgetter("title"),
+    "avatar_url": avatar_for,
+    "is_on_leave": lambda row: bool(row.is_on_leave),
+    "department": lambda row: row.department or "N/A",
+    "email": attrgetter("email"),
+    "phone": lambda row: row.phone or "N/A",
+    "start_date": attrgetter("start_date"),
+    "address": lambda row: row.address or "N/A",
+    "birth_date": attrgetter("birth_date"),
+    "emergency_contact": lambda row: row.emergency_contact or "N/A",
+    "salary": lambda row: None,
+}
+
+LEAVE_VALUES = {
+    "id": attrgetter("id"),
+    "employee_id": attrgetter("employee_id"),
+    "employee_name": lambda row: row.employee_name or "N/A",
+    "leave_type": attrgetter("leave_type"),
+    "start_date": attrgetter("start_date"),
+    "end_date": attrgetter("end_date"),
+    "days": attrgetter("days"),
+    "reason": lambda row: row.reason or "",
+    "status": attrgetter("status"),
+    "created_at": lambda row: row.created_at.strftime("%Y-%m-%d"),
+}
+
+EXPENSE_VALUES = {
+    "id": attrgetter("id"),
+    "employee_id": attrgetter("employee_id"),
+    "employee_name": lambda row: row.employee_name or "N/A",
+    "expense_type": attrgetter("expense_type"),
+    "amount": attrgetter("amount"),
+    "date": attrgetter("date"),
+    "description": lambda row: row.description or "",
+    "receipt_url": attrgetter("receipt_url"),
+    "status": attrgetter("status"),
+    "created_at": lambda row: row.created_at.strftime("%Y-%m-%d"),
+}
+
+
+def _from_row(model, values: dict, row, fields: Optional[Tuple[str, ...]]):
+    if fields is not None:
+        return {name: values[name](row) for name in fields}
+    return model.model_construct(**{name: values[name](row) for name in model.model_fields})
+
+
+def employee_card_from_row(row, fields: Optional[Tuple[str, ...]] = None):
+    return _from_row(EmployeeCard, EMPLOYEE_VALUES, row, fields)
+
+
+def employee_detail_from_row(row, fields: Optional[Tuple[str, ...]] = None):
+    return _from_row(EmployeeDetail, EMPLOYEE_VALUES, row, fields)
+
+
+def employee_suggestion_from_row(row) -> EmployeeSuggestion:
+    return _from_row(EmployeeSuggestion, EMPLOYEE_VALUES, row, None)
+
+
+def leave_request_from_row(row, fields: Optional[Tuple[str, ...]] = None):
+    return _from_row(LeaveRequest, LEAVE_VALUES, row, fields)
+
+
+def expense_request_from_row(row, fields: Optional[Tuple[str, ...]] = None):
+    return _from_row(ExpenseRequest, EXPENSE_VALUES, row, fields)
+
+
+def page_of(page_model, items: list, next_cursor: Optional[str], fields: Optional[Tuple[str, ...]] = None):
+    """The page model, or a plain dict when the items are sparse dicts."""
+    if fields is None:
+        return page_model(items=items, next_cursor=next_cursor)
+    return {"items": items, "next_cursor": next_cursor}
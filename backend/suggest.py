@@ -0,0 +1,223 @@
+"""
+Employee typeahead index (GET /api/employees/suggest).
+
+Per-keystroke lookups are served from memory instead of a LIKE '%q%' scan.
+Every word of full_name, title and department is indexed under its
+prefixes; a query word starting a word in any of the three fields is a hit.
+
+Folding follows Turkish casing first (I -> ı, İ -> i, then lower()), so
+"IŞIK" and "Işık" agree and "İsmail" doesn't pick up a combining dot. The
+search key then drops the diacritics (ş -> s, ı -> i, ...): a query typed
+without them ("sahin") matches "Şahin", while a query that has them
+("şahin") only matches tokens that have them too.
+
+The index is per process. crud refreshes the affected employees after
+create_employee / update_employee / bulk_create_employees, and jobs.py
+rebuilds it periodically so other workers converge.
+"""
+
+import os
+import re
+import threading
+from bisect import bisect_left, insort
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple
+
+SUGGEST_LIMIT = int(os.getenv("SUGGEST_LIMIT", "10"))
+PREFIX_MAX = 4
+BULK_UPSERT = 64  # above this many rows an upsert rebuilds instead of editing lists
+
+# Field rank: matches on the name sort before title, title before department
+NAME, TITLE, DEPARTMENT = 0, 1, 2
+
+_TURKISH_UPPER = str.maketrans({"I": "ı", "İ": "i"})
+_DIACRITICS = str.maketrans("çğıöşüâîû", "cgiosuaiu")
+_WORD = re.compile(r"\w+")
+
+
+def fold(text: str) -> str:
+    """Turkish-aware lower case."""
+    return text.translate(_TURKISH_UPPER).lower()
+
+
+def search_key(token: str) -> str:
+    """Folded token without diacritics."""
+    return token.translate(_DIACRITICS)
+
+
+def _words(text) -> List[str]:
+    return _WORD.findall(fold(text)) if text else []
+
+
+@lru_cache(maxsize=65536)
+def _tokens(text: str) -> Tuple[Tuple[str, str], ...]:
+    """(search key, token) per word; titles and departments repeat a lot."""
+    return tuple((search_key(token), token) for token in _words(text))
+
+
+def _entries(row) -> List[tuple]:
+    """(field, folded name, id, search key, token) for every word of the row."""
+    name = fold(row.full_name)
+    entries = set()
+    for field, text in ((NAME, row.full_name), (TITLE, row.title), (DEPARTMENT, row.department)):
+        for key, token in _tokens(text) if text else ():
+            entries.add((field, name, row.id, key, token))
+    return sorted(entries)
+
+
+def _prefixes(entry) -> frozenset:
+    return _posting_keys(entry[3], entry[4])
+
+
+@lru_cache(maxsize=65536)
+def _posting_keys(key: str, token: str) -> frozenset:
+    """
+    Prefixes of the search key, plus prefixes of the token itself where it
+    has diacritics (the lists strict queries use).
+    """
+    prefixes = {key[:length] for length in range(1, min(len(key), PREFIX_MAX) + 1)}
+    if token != key:
+        prefixes.update(token[:length] for length in range(1, min(len(token), PREFIX_MAX) + 1))
+    return frozenset(prefixes)
+
+
+def _matches(entry, key: str, token: str) -> bool:
+    # A query word with diacritics must match them; one without matches either way
+    return entry[3].startswith(key) and (key == token or entry[4].startswith(token))
+
+
+class EmployeeIndex:
+    """
+    Prefix -> entries, each list kept in rank order (field, then name), so a
+    query stops after `limit` hits instead of ranking every match. Prefixes
+    are stored up to PREFIX_MAX characters; longer query words walk that
+    list and compare the full word.
+
+    Searches never lock. Writers replace whole posting lists (copy, edit,
+    assign) and store the row before publishing the lists that point at it;
+    load and large upserts build a new state and swap it in.
+
+    A rebuild reads its rows from the database before load() swaps them in,
+    so upserts made meanwhile would be lost. Inside reloading(), upserts are
+    also recorded and load() replays them on top of the new state, under
+    the same lock as the swap.
+    """
+
+    def __init__(self):
+        # (postings {prefix: [entry, ...]}, rows {id: (row, entries)})
+        self._state: Tuple[Dict[str, list], Dict[int, tuple]] = ({}, {})
+        self._lock = threading.Lock()
+        self._reloads = 0
+        self._replay: Dict[int, object] = {}  # id -> latest row upserted during a reload
+        self.loaded = False
+
+    @property
+    def loading(self) -> bool:
+        return self._reloads > 0
+
+    @contextmanager
+    def reloading(self):
+        """Wrap reading the rows for load() and the load itself."""
+        with self._lock:
+            self._reloads += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._reloads -= 1
+                if not self._reloads:
+                    self._replay.clear()
+
+    @staticmethod
+    def _build(rows: Dict[int, tuple]) -> Dict[str, list]:
+        postings: Dict[str, list] = {}
+        # One global sort; appending in that order keeps every list sorted
+        for entry in sorted(entry for _, entries in rows.values() for entry in entries):
+            for prefix in _prefixes(entry):
+                postings.setdefault(prefix, []).append(entry)
+        return postings
+
+    def load(self, rows: Iterable):
+        """Replace the whole index with rows (id, full_name, title, department, ...)."""
+        rows = {row.id: (row, _entries(row)) for row in rows}
+        postings = self._build(rows)
+        with self._lock:
+            self._state = (postings, rows)
+            self.loaded = True
+            if self._replay:
+                self._upsert_locked(list(self._replay.values()))
+
+    def upsert(self, rows: Iterable):
+        """Add or replace the given employees."""
+        rows = list(rows)
+        if not rows:
+            return
+        with self._lock:
+            if self._reloads:
+                self._replay.update((row.id, row) for row in rows)
+            self._upsert_locked(rows)
+
+    def _upsert_locked(self, rows: list):
+        """upsert() with self._lock held."""
+        postings, docs = self._state
+        if len(rows) > BULK_UPSERT:
+            docs = dict(docs)
+            docs.update((row.id, (row, _entries(row))) for row in rows)
+            self._state = (self._build(docs), docs)
+            return
+
+        changed: Dict[str, list] = {}
+
+        def posting(prefix: str) -> list:
+            if prefix not in changed:
+                changed[prefix] = list(postings.get(prefix, ()))
+            return changed[prefix]
+
+        for row in rows:
+            entries = _entries(row)
+            if row.id in docs:
+                for entry in docs[row.id][1]:
+                    for prefix in _prefixes(entry):
+                        target = posting(prefix)
+                        position = bisect_left(target, entry)
+                        if position < len(target) and target[position] == entry:
+                            del target[position]
+            for entry in entries:
+                for prefix in _prefixes(entry):
+                    insort(posting(prefix), entry)
+            docs[row.id] = (row, entries)
+        postings.update(changed)
+
+    def search(self, q: str, limit: int = SUGGEST_LIMIT) -> list:
+        """
+        Rows whose name/title/department words start with every word of q,
+        best field first, then by name.
+        """
+        postings, docs = self._state
+        words = [(postings.get(word[:PREFIX_MAX], ()), search_key(word), word) for word in _words(q)]
+        if not words:
+            return []
+
+        # Walk the shortest posting list; the other words are checked per row
+        words.sort(key=lambda word: len(word[0]))
+        (entries, key, token), others = words[0], words[1:]
+        seen, hits = set(), []
+        for entry in entries:
+            row_id = entry[2]
+            if row_id in seen or not _matches(entry, key, token):
+                continue
+            row, row_entries = docs[row_id]
+            if others and not all(
+                any(_matches(other, other_key, other_token) for other in row_entries)
+                for _, other_key, other_token in others
+            ):
+                continue
+            seen.add(row_id)
+            hits.append(row)
+            if len(hits) == limit:
+                break
+        return hits
+
+
+employee_index = EmployeeIndex()
@@ -0,0 +1,79 @@
+import os
+import sys
+import tempfile
+from datetime import date, timedelta
+
+import pytest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+# Every test runs against a throwaway SQLite file; set before database.py is imported
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='fasthr-test-'), 'test.db')}"
+os.environ["DATABASE_TYPE"] = "sqlite"
+os.environ["JOBS_ENABLED"] = "false"
+
+DEPARTMENTS = ["Yazılım", "Tasarım", "Ürün", "İnsan Kaynakları"]
+EMPLOYEES = 120
+ROWS_PER_EMPLOYEE = 2
+
+
+def seed(db):
+    """Departments, employees and two leaves and two expenses per employee."""
+    from sqlalchemy import insert
+
+    import crud
+    import db_models
+
+    department_ids = crud.create_departments(db, DEPARTMENTS)
+    crud.bulk_create_employees(db, [
+        (
+            {"email": f"calisan{i}@example.com", "username": f"calisan{i}",
+             "full_name": f"Çalışan {i:03d}", "hashed_password": "!", "role": "employee", "is_active": True},
+            {"full_name": f"Çalışan {i:03d}", "title": "Uzman", "email": f"calisan{i}@example.com",
+             "department_id": department_ids[DEPARTMENTS[i % len(DEPARTMENTS)]],
+             "avatar_url": "ÇA", "start_date": date(2024, 1, 15)},
+        )
+        for i in range(EMPLOYEES)
+    ])
+    employee_ids = [row[0] for row in db.query(db_models.Employee.id).order_by(db_models.Employee.id)]
+    leaves, expenses = [], []
+    for employee_id in employee_ids:
+        for n in range(ROWS_PER_EMPLOYEE):
+            start = date(2025, 3, 1) + timedelta(days=employee_id % 20 + n * 30)
+            leaves.append({
+                "employee_id": employee_id, "leave_type": "Yıllık İzin", "start_date": start,
+                "end_date": start + timedelta(days=1), "days": 2, "reason": "Tatil",
+                "status": "Bekliyor" if n else "Onaylandı",
+            })
+            expenses.append({
+                "employee_id": employee_id, "expense_type": "Yol", "amount": 100 + n,
+                "date": start, "description": "Taksi", "status": "Bekliyor" if n else "Onaylandı",
+            })
+    db.execute(insert(db_models.Leave), leaves)
+    db.execute(insert(db_models.Expense), expenses)
+    db.commit()
+    crud.reconcile_dashboard_stats(db)
+
+
+@pytest.fixture(scope="session")
+def seeded_db():
+    from database import SessionLocal, init_db
+
+    init_db()
+    db = SessionLocal()
+    try:
+        seed(db)
+    finally:
+        db.close()
+
+
+@pytest.fixture
+def db(seeded_db):
+    from database import SessionLocal
+
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
@@ -0,0 +1,45 @@
+"""CompressionMiddleware behind the app's BaseHTTPMiddleware stack."""
+
+import json
+
+from fastapi.testclient import TestClient
+from starlette.applications import Starlette
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from compression import CompressionMiddleware
+
+
+async def _passthrough(request, call_next):
+    return await call_next(request)
+
+
+def _client(payload) -> TestClient:
+    app = Starlette(routes=[Route("/", lambda request: JSONResponse(payload))])
+    app.add_middleware(BaseHTTPMiddleware, dispatch=_passthrough)
+    app.add_middleware(CompressionMiddleware, minimum_size=1024)
+    return TestClient(app)
+
+
+def test_small_response_through_full_stack_is_not_compressed():
+    from main import app
+
+    response = TestClient(app).get("/", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+    assert response.headers["content-length"] == str(len(response.content))
+
+
+def test_small_streamed_body_is_not_compressed():
+    response = _client({"ok": True}).get("/", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+    assert response.json() == {"ok": True}
+
+
+def test_large_streamed_body_is_compressed():
+    payload = [{"id": i, "full_name": f"Çalışan {i}"} for i in range(200)]
+    response = _client(payload).get("/", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert "accept-encoding" in response.headers["vary"].lower()
+    assert response.json() == json.loads(json.dumps(payload))
@@ -0,0 +1,31 @@
+"""Dashboard counters exist up front, so _bump_stat is a plain UPDATE."""
+
+import os
+import sqlite3
+import subprocess
+import sys
+
+import crud
+import db_models
+from conftest import BACKEND_DIR
+
+
+def test_init_db_seeds_every_counter(db):
+    assert set(crud.get_dashboard_stats(db)) >= set(db_models.DASHBOARD_STAT_NAMES)
+
+
+def test_migration_seeds_every_counter(tmp_path):
+    database = tmp_path / "migrated.db"
+    env = {**os.environ, "DATABASE_URL": f"sqlite:///{database}"}
+    subprocess.run([sys.executable, "-m", "alembic", "upgrade", "head"],
+                   cwd=BACKEND_DIR, env=env, capture_output=True, check=True)
+    with sqlite3.connect(database) as conn:
+        rows = dict(conn.execute("SELECT name, value FROM dashboard_stats"))
+    assert rows == {name: 0 for name in db_models.DASHBOARD_STAT_NAMES}
+
+
+def test_bump_stat_applies_negative_deltas(db):
+    before = crud.get_dashboard_stats(db)["on_leave"]
+    crud._bump_stat(db, "on_leave", -1)
+    assert crud.get_dashboard_stats(db)["on_leave"] == before - 1
+    db.rollback()
@@ -0,0 +1,47 @@
+"""Bulk import creates users without bcrypt; each sets a password once with its token."""
+
+import io
+
+import bcrypt
+from fastapi.testclient import TestClient
+
+import crud
+from employee_import import UNUSABLE_PASSWORD, import_employees
+
+ROSTER = (
+    "full_name,email,title,department,start_date,password\n"
+    "Deniz Aktaş,deniz.aktas@example.com,Uzman,Finans,2024-01-15,gecici1\n"
+    "Ece Korkmaz,ece.korkmaz@example.com,Uzman,Finans,15.01.2024,gecici2\n"
+    "Eksik Satır,,Uzman,Finans,2024-01-15,\n"
+)
+
+
+def test_import_hashes_nothing_and_issues_password_tokens(db, monkeypatch):
+    hashes = []
+    monkeypatch.setattr(bcrypt, "hashpw", lambda *args: hashes.append(args))
+
+    report = import_employees(db, io.BytesIO(ROSTER.encode("utf-8")), "roster.csv")
+
+    assert (report["imported"], report["failed"]) == (2, 1)
+    assert hashes == []
+    assert [t["email"] for t in report["password_tokens"]] == ["deniz.aktas@example.com", "ece.korkmaz@example.com"]
+    assert crud.get_user_by_email(db, "deniz.aktas@example.com").hashed_password == UNUSABLE_PASSWORD
+
+
+def test_password_token_sets_the_password_once(db):
+    from main import app
+
+    report = import_employees(
+        db, io.BytesIO(b"full_name,email,title,start_date\nCan Er,can.er@example.com,Uzman,2024-01-15\n"), "r.csv"
+    )
+    token = report["password_tokens"][0]["token"]
+    client = TestClient(app)
+
+    # Not an access token
+    assert client.get("/api/auth/me", headers={"Authorization": f"Bearer {token}"}).status_code == 401
+
+    body = {"token": token, "new_password": "yeni-sifre-123"}
+    assert client.post("/api/auth/set-password", json=body).status_code == 200
+    db.expire_all()
+    assert crud.get_user_by_email(db, "can.er@example.com").hashed_password.startswith("$2")
+    assert client.post("/api/auth/set-password", json=body).status_code == 400
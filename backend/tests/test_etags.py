@@ -0,0 +1,24 @@
+"""Collection ETag validators must change on every edit."""
+
+from sqlalchemy.dialects import mysql
+from sqlalchemy.schema import CreateTable
+
+import crud
+import db_models
+
+
+def test_updated_at_keeps_microseconds_on_mariadb():
+    for model in (db_models.Employee, db_models.Leave, db_models.Expense):
+        ddl = str(CreateTable(model.__table__).compile(dialect=mysql.dialect()))
+        assert "updated_at DATETIME(6)" in ddl
+
+
+def test_back_to_back_edits_change_the_collection_version(db):
+    leave_ids = [row[0] for row in db.query(db_models.Leave.id).order_by(db_models.Leave.id).limit(2)]
+    versions = [crud.get_collection_version(db, db_models.Leave)]
+    for leave_id in leave_ids:
+        db.get(db_models.Leave, leave_id).reason = f"Düzenlendi {leave_id}"
+        db.commit()
+        versions.append(crud.get_collection_version(db, db_models.Leave))
+    db.rollback()
+    assert len(set(versions)) == 3
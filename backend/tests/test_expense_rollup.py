@@ -0,0 +1,26 @@
+"""Expense rollups: closing months must not change the totals, and skips them by date range."""
+
+import crud
+from query_counter import count_queries
+from query_plans import explain, full_scans
+
+
+def test_closed_months_keep_totals_and_are_skipped(db):
+    before = crud.get_expense_rollup(db, group_by="employee")
+    assert crud.close_expense_months(db)
+
+    with count_queries() as counter:
+        after = crud.get_expense_rollup(db, group_by="employee")
+    assert after == before
+
+    raw = [(sql, params) for sql, params in zip(counter.statements, counter.parameters)
+           if "FROM expenses" in sql]
+    assert len(raw) == 1
+    assert "substr" not in raw[0][0].split("WHERE", 1)[1].split("GROUP BY")[0]
+    assert full_scans("sqlite", explain(db, *raw[0])) == []
+
+
+def test_rollup_keys_sort_numerically(db):
+    keys = [row["key"] for row in crud.get_expense_rollup(db, group_by="employee")]
+    assert keys == sorted(keys)
+    assert len(keys) > 10
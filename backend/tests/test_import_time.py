@@ -0,0 +1,53 @@
+"""Cold start: importing main stays under budget and has no side effects."""
+
+import json
+import os
+import subprocess
+import sys
+
+from conftest import BACKEND_DIR
+
+IMPORT_BUDGET_MS = float(os.getenv("IMPORT_BUDGET_MS", "1500"))
+RUNS = 5  # best of: a single run is noisy on a busy machine
+
+# Counts bcrypt hashes (passlib calls bcrypt.hashpw) while auth and main are imported
+PROBE = """
+import json, time
+import bcrypt
+hashes = []
+_hashpw = bcrypt.hashpw
+bcrypt.hashpw = lambda *args: hashes.append(1) or _hashpw(*args)
+start = time.perf_counter()
+import auth
+auth_hashes = len(hashes)
+import main
+elapsed = (time.perf_counter() - start) * 1000
+print(json.dumps({"ms": elapsed, "auth_hashes": auth_hashes, "hashes": len(hashes)}))
+"""
+
+
+def _import_main(tmp_path) -> dict:
+    database = tmp_path / "cold.db"
+    env = {**os.environ, "DATABASE_URL": f"sqlite:///{database}", "DATABASE_TYPE": "sqlite"}
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE], cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True,
+    )
+    result = json.loads(out.stdout.strip().splitlines()[-1])
+    result["database_created"] = database.exists()
+    return result
+
+
+def test_import_main_within_budget(tmp_path):
+    elapsed = min(_import_main(tmp_path)["ms"] for _ in range(RUNS))
+    assert elapsed <= IMPORT_BUDGET_MS, (
+        f"import main took {elapsed:.0f}ms (budget {IMPORT_BUDGET_MS:.0f}ms); "
+        "check `python -X importtime -c 'import main'`"
+    )
+
+
+def test_import_has_no_side_effects(tmp_path):
+    result = _import_main(tmp_path)
+    assert result["auth_hashes"] == 0
+    assert result["hashes"] == 0
+    # No connection, so no create_all: SQLite hasn't even created the file
+    assert not result["database_created"]
@@ -0,0 +1,51 @@
+"""Leave overlap checks see every active leave, even legacy ones that overlap each other."""
+
+from datetime import date
+
+import pytest
+from sqlalchemy import insert
+
+import crud
+import db_models
+from models import LeaveCreateRequest
+
+
+@pytest.fixture
+def legacy_overlap(db):
+    """A long approved leave and a short one inside it, as the pre-check code allowed."""
+    employee_id = db.query(db_models.Employee.id).order_by(db_models.Employee.id.desc()).limit(1).scalar()
+    db.execute(insert(db_models.Leave), [
+        {"employee_id": employee_id, "leave_type": "Mazeret İzni", "start_date": start, "end_date": end,
+         "days": (end - start).days + 1, "reason": "Eski kayıt", "status": "Onaylandı"}
+        for start, end in [(date(2027, 1, 1), date(2027, 1, 31)), (date(2027, 1, 5), date(2027, 1, 6))]
+    ])
+    db.commit()
+    return employee_id
+
+
+def _request(start: date, end: date) -> LeaveCreateRequest:
+    return LeaveCreateRequest(leave_type="Mazeret İzni", start_date=start, end_date=end, reason="Tatil")
+
+
+def test_create_leave_conflicts_with_an_earlier_longer_leave(db, legacy_overlap):
+    # The latest-starting active leave ends on 6 January; the 31 January one still overlaps
+    with pytest.raises(crud.LeaveConflict, match="2027-01-31"):
+        crud.create_leave(db, _request(date(2027, 1, 20), date(2027, 1, 22)), legacy_overlap)
+
+    leave = crud.create_leave(db, _request(date(2027, 2, 1), date(2027, 2, 2)), legacy_overlap)
+    assert leave.status == "Bekliyor"
+
+
+def test_reactivating_a_leave_conflicts_with_an_earlier_longer_leave(db, legacy_overlap):
+    leave = crud.create_leave(db, _request(date(2027, 3, 1), date(2027, 3, 2)), legacy_overlap)
+    crud.reject_leave(db, leave.id, approved_by=1)
+    db.execute(
+        db_models.Leave.__table__.update()
+        .where(db_models.Leave.id == leave.id)
+        .values(start_date=date(2027, 1, 25), end_date=date(2027, 1, 26))
+    )
+    db.commit()
+    db.expire_all()
+
+    with pytest.raises(crud.LeaveConflict, match="2027-01-31"):
+        crud.approve_leave(db, leave.id, approved_by=1)
@@ -0,0 +1,25 @@
+"""List endpoints must not issue more queries as the page grows (N+1)."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from auth import create_access_token
+from query_counter import assert_constant_queries
+
+
+@pytest.fixture
+def client(seeded_db):
+    from main import app
+
+    token = create_access_token({"sub": "admin@fasthr.com"})
+    return TestClient(app, headers={"Authorization": f"Bearer {token}"})
+
+
+@pytest.mark.parametrize("path", ["/api/employees", "/api/leaves", "/api/expenses"])
+def test_list_query_count_is_constant(client, path):
+    def fetch(limit):
+        response = client.get(path, params={"limit": limit})
+        assert response.status_code == 200
+        assert len(response.json()["items"]) == limit
+
+    assert assert_constant_queries(fetch, page_sizes=(1, 10, 100)) > 0
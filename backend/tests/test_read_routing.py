@@ -0,0 +1,47 @@
+"""Async reads follow the sync replica routing (health, read-your-writes)."""
+
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from starlette.requests import Request
+
+import database
+
+
+def _request(cookie: str = "") -> Request:
+    headers = [(b"cookie", cookie.encode())] if cookie else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+async def _bound_url(request: Request) -> str:
+    dependency = database.get_async_read_db(request)
+    db = await dependency.__anext__()
+    try:
+        return str(db.bind.url)
+    finally:
+        await dependency.aclose()
+
+
+@pytest.fixture
+def async_replica(tmp_path, monkeypatch, seeded_db):
+    primary_url = database.to_async_url(database.DATABASE_URL)
+    replica_url = f"sqlite:///{tmp_path / 'replica.db'}"
+    replicas = database.ReadReplicas([replica_url])
+    replicas.async_sessions = [async_sessionmaker(create_async_engine(database.to_async_url(replica_url)))]
+    monkeypatch.setattr(database, "read_replicas", replicas)
+    monkeypatch.setattr(database, "AsyncSessionLocal", async_sessionmaker(create_async_engine(primary_url)))
+    return primary_url, database.to_async_url(replica_url), replicas
+
+
+def test_async_reads_go_to_a_healthy_replica(async_replica):
+    primary_url, replica_url, replicas = async_replica
+    assert asyncio.run(_bound_url(_request())) == replica_url
+
+    replicas.mark_down(0, "test")
+    assert asyncio.run(_bound_url(_request())) == primary_url
+
+
+def test_async_reads_stick_to_the_primary_after_a_write(async_replica):
+    primary_url, _, _ = async_replica
+    assert asyncio.run(_bound_url(_request(f"{database.STICKY_COOKIE}=1"))) == primary_url
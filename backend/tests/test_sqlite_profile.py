@@ -0,0 +1,40 @@
+"""SQLite profile: only writing transactions hold the single writer connection."""
+
+from sqlalchemy import select, update
+
+import crud
+import db_models
+from database import SessionLocal, engine, read_engine
+
+
+def test_reads_before_and_after_a_write_leave_the_writer_free(db):
+    employee_id = db.query(db_models.Employee.id).first()[0]
+    crud.get_employee(db, employee_id)
+    assert db.get_bind(clause=select(db_models.Employee.id)) is read_engine
+    assert engine.pool.checkedout() == 0
+
+    other = SessionLocal()
+    try:
+        crud._bump_stat(other, "on_leave", 0)
+        assert engine.pool.checkedout() == 1
+        other.commit()
+    finally:
+        other.close()
+    assert engine.pool.checkedout() == 0
+
+
+def test_write_transaction_reads_its_own_writes(db):
+    Employee = db_models.Employee
+    employee_id, title = db.query(Employee.id, Employee.title).first()
+    db.execute(update(Employee).where(Employee.id == employee_id).values(title="Geçici"))
+    assert db.query(Employee.title).filter(Employee.id == employee_id).scalar() == "Geçici"
+    db.rollback()
+    assert db.query(Employee.title).filter(Employee.id == employee_id).scalar() == title
+    assert engine.pool.checkedout() == 0
+
+
+def test_select_for_update_takes_the_writer(db):
+    db.execute(select(db_models.DashboardStat).with_for_update())
+    assert engine.pool.checkedout() == 1
+    db.rollback()
+    assert engine.pool.checkedout() == 0
@@ -40,6 +40,21 @@ async function apiRequest<T>(
   return response.json()
 }
 
+// Cursor-paginated list response
+export interface Page<T> {
+  items: T[]
+  next_cursor: string | null
+}
+
+const pageQuery = (params: Record<string, string | undefined>) => {
+  const query = new URLSearchParams()
+  Object.entries(params).forEach(([key, value]) => {
+    if (value) query.set(key, value)
+  })
+  const qs = query.toString()
+  return qs ? `?${qs}` : ''
+}
+
 // Auth API
 export const authAPI = {
   login: async (email: string, password: string) => {
@@ -60,8 +75,8 @@ export const authAPI = {
 
 // Employees API
 export const employeesAPI = {
-  getAll: async () => {
-    return apiRequest<any[]>('/api/employees')
+  getAll: async (cursor?: string) => {
+    return apiRequest<Page<any>>(`/api/employees${pageQuery({ cursor })}`)
   },
   
   getDetail: async (id: number) => {
@@ -71,9 +86,8 @@ export const employeesAPI = {
 
 // Leaves API
 export const leavesAPI = {
-  getAll: async (status?: string) => {
-    const query = status ? `?status=${status}` : ''
-    return apiRequest<any[]>(`/api/leaves${query}`)
+  getAll: async (status?: string, cursor?: string) => {
+    return apiRequest<Page<any>>(`/api/leaves${pageQuery({ status, cursor })}`)
   },
   
   create: async (data: any) => {
@@ -91,15 +105,21 @@ export const leavesAPI = {
   },
   
   getBalance: async (employeeId: number) => {
-    return apiRequest<any>(`/api/leaves/balances/${employeeId}`)
+    return apiRequest<any>(`/api/leaves/balance/${employeeId}`)
+  },
+  
+  getBalances: async (employeeIds: number[]) => {
+    return apiRequest<any[]>('/api/leaves/balances:batch', {
+      method: 'POST',
+      body: JSON.stringify({ employee_ids: employeeIds }),
+    })
   },
 }
 
 // Expenses API
 export const expensesAPI = {
-  getAll: async (status?: string) => {
-    const query = status ? `?status=${status}` : ''
-    return apiRequest<any[]>(`/api/expenses${query}`)
+  getAll: async (status?: string, cursor?: string) => {
+    return apiRequest<Page<any>>(`/api/expenses${pageQuery({ status, cursor })}`)
   },
   
   create: async (data: any) => {